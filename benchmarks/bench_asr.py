@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+연령표준화 발생률 일괄 계산 벤치마크 (층 수에 따른 소요 시간)
+
+사용법: python benchmarks/bench_asr.py [--years 1 5 10] [--cancers 24]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from dataset import AGE_BANDS, REGIONS, SEXES
+from standardization import age_standardized_rates
+
+
+def synthetic_tables(n_years, n_cancers, seed=0):
+    """층 × 연령대 발생수 표와 연도 × 지역 × 성별 × 연령대 인구표"""
+    rng = np.random.default_rng(seed)
+    years = list(range(2020 - n_years + 1, 2021))
+    cancers = [f"암종{i:02d}" for i in range(n_cancers)]
+
+    case_index = pd.MultiIndex.from_product([years, REGIONS, cancers, SEXES, AGE_BANDS],
+                                            names=['연도', '지역', '암종', '성별', '연령대'])
+    cases = case_index.to_frame(index=False)
+    cases['발생수'] = rng.poisson(40, len(cases))
+
+    pop_index = pd.MultiIndex.from_product([years, REGIONS, SEXES, AGE_BANDS],
+                                           names=['연도', '지역', '성별', '연령대'])
+    population = pop_index.to_frame(index=False)
+    population['인구'] = rng.integers(20_000, 800_000, len(population))
+    return cases, population
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--years', type=int, nargs='+', default=[1, 5, 10])
+    parser.add_argument('--cancers', type=int, default=24)
+    args = parser.parse_args()
+
+    print(f"{'strata':>8} {'seconds':>8} {'strata/s':>10}")
+    for n_years in args.years:
+        cases, population = synthetic_tables(n_years, args.cancers)
+        start = time.perf_counter()
+        result = age_standardized_rates(cases, population)
+        elapsed = time.perf_counter() - start
+        print(f"{len(result):>8,} {elapsed:>8.3f} {len(result) / elapsed:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+차트 출력 설정(print/web/thumbnail/vector) 저장 벤치마크
+
+설정마다 plt.savefig를 따로 호출하는 방식과 save_figure(한 번 그린 래스터를 축소해 인코딩)를
+차트별 소요 시간과 출력 크기로 비교
+
+사용법: python benchmarks/bench_chart_output.py [--profiles print web thumbnail] [--repeat 3]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from chart_output import OUTPUT_PROFILES, resolve_profiles, save_figure
+from synthetic import synthetic_dataset
+from visualizer import CHART_TASKS, CancerDataVisualizer, plt
+
+
+def save_separately(fig, path, profiles):
+    """설정·형식마다 savefig 호출 (tight bbox도 저장마다 계산)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    saved = []
+    for profile in resolve_profiles(profiles):
+        for fmt, target in zip(profile.formats, profile.paths(path)):
+            fig.savefig(target, format=fmt, dpi=profile.dpi, bbox_inches='tight' if profile.tight else None)
+            saved.append(target)
+    return saved
+
+
+class FigureCapture(CancerDataVisualizer):
+    """차트 메서드가 저장하려는 Figure를 저장하지 않고 보관"""
+
+    def _save_chart(self, fig, file_name):
+        self.figure = fig
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--profiles', nargs='+', default=['print', 'web', 'thumbnail'],
+                        choices=list(OUTPUT_PROFILES))
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"profiles: {', '.join(args.profiles)}\n")
+    print(f"{'chart':<26} {'separate(s)':>12} {'save_figure(s)':>15} {'files':>6} {'size(KB)':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for method_name, (_, file_name) in CHART_TASKS.items():
+            if not file_name.endswith('.png'):
+                continue
+            capture = FigureCapture(dataset=synthetic_dataset(1))
+            capture.load_data()
+            getattr(capture, method_name)()
+            fig = capture.figure
+            timings = {}
+            for mode, save in (('separate', save_separately), ('save_figure', save_figure)):
+                times = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    saved = save(fig, Path(tmp) / mode / file_name, args.profiles)
+                    times.append(time.perf_counter() - start)
+                timings[mode] = min(times)
+            size_kb = sum(path.stat().st_size for path in saved) / 1024
+            print(f"{Path(file_name).stem:<26} {timings['separate']:>12.2f} {timings['save_figure']:>15.2f} "
+                  f"{len(saved):>6} {size_kb:>9.0f}", flush=True)
+            plt.close(fig)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+차트 렌더링 벤치마크 (순차 vs 프로세스 풀)
+
+사용법: python benchmarks/bench_chart_rendering.py [--workers 1 2 5] [--repeat 3]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from visualizer import CancerDataVisualizer
+
+
+def time_render(workers, charts_dir):
+    """모든 차트를 한 번 렌더링하는 데 걸린 시간(초)"""
+    visualizer = CancerDataVisualizer()
+    visualizer.data_dir = project_root / 'data'
+    visualizer.charts_dir = Path(charts_dir)
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        results = visualizer.generate_all_charts(workers=workers)
+    elapsed = time.perf_counter() - start
+
+    failed = [name for name, (_, error) in results.items() if error]
+    if failed:
+        raise RuntimeError(f"Chart rendering failed: {failed}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 5])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8} {'best(s)':>9} {'mean(s)':>9}")
+    with tempfile.TemporaryDirectory() as charts_dir:
+        baseline = None
+        for workers in args.workers:
+            timings = [time_render(workers, charts_dir) for _ in range(args.repeat)]
+            best = min(timings)
+            baseline = baseline or best
+            print(f"{workers:>8} {best:>9.2f} {sum(timings) / len(timings):>9.2f}"
+                  f"  ({baseline / best:.1f}x vs first)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+지역별/암종별 차트 세트 일괄 생성 벤치마크 (초당 차트 수)
+
+세트마다 Figure를 새로 만드는 방식(reuse=False)과 Figure/축을 재사용해 막대 높이,
+선 데이터만 바꾸는 방식(reuse=True)을 워커 수별로 비교
+
+사용법: python benchmarks/bench_chart_sets.py [--rows 200000] [--years 5] [--workers 1 4] [--dpi 100]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from bench_cube import synthetic_cases
+from chart_batch import chart_set_jobs, render_chart_sets
+from cube import CancerCube
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=200_000, help='합성 케이스 수')
+    parser.add_argument('--years', type=int, default=5, help='연도 수 (세트 수 = 17개 지역 + 암종 수 + 연도 수)')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, os.cpu_count() or 1])
+    parser.add_argument('--dpi', type=int, default=100)
+    args = parser.parse_args()
+
+    cases = synthetic_cases(args.rows, years=tuple(range(2021 - args.years, 2021)))
+    cube = CancerCube.from_records(cases)
+    jobs = chart_set_jobs(cube, by=('지역', '암종', '연도'))
+    print(f"{len(jobs)} chart sets ({cube.total():,} cases), dpi {args.dpi}, {os.cpu_count()} CPUs\n")
+
+    print(f"{'mode':<10} {'workers':>7} {'charts':>7} {'time(s)':>9} {'charts/s':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for workers in dict.fromkeys(args.workers):
+            for reuse in (False, True):
+                mode = 'reuse' if reuse else 'rebuild'
+                start = time.perf_counter()
+                paths = render_chart_sets(jobs, Path(tmp) / f'{mode}-{workers}', workers=workers,
+                                          dpi=args.dpi, reuse=reuse)
+                elapsed = time.perf_counter() - start
+                print(f"{mode:<10} {workers:>7} {len(paths):>7} {elapsed:>9.2f} {len(paths) / elapsed:>9.1f}",
+                      flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+코호트 보고서 벤치마크: 코호트마다 큐브를 질의해 보고서를 하나씩 만드는 방식 vs CohortReportEngine
+
+합성 케이스로 만든 큐브의 지역 × 연도 × 암종 코호트 전체에 대해 JSON Lines, Markdown, CSV 보고서를 쓰고
+소요 시간과 최대 추가 메모리(tracemalloc)를 비교
+- per-cohort: generate_summary_report처럼 코호트마다 필터 질의 + f-string/json.dumps, 모든 보고서를 모아 한 번에 기록
+- engine: cohort_table로 결과표를 한 번에 계산하고 미리 컴파일한 템플릿으로 --batch-size행씩 렌더링해 바로 기록
+
+사용법: python benchmarks/bench_cohort_reports.py [--rows 500000] [--years 20] [--batch-size 1000]
+"""
+
+import argparse
+import csv
+import io
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from bench_cube import synthetic_cases
+from cohort_reports import COHORT_COLUMNS, MARKDOWN_HEADER, MARKDOWN_TEMPLATE, CohortReportEngine, cohort_table
+from cube import CancerCube
+from population import get_population_table
+
+
+def per_cohort_reports(cube, population, root):
+    """코호트마다 큐브를 질의하고 보고서를 하나씩 렌더링 (모든 보고서를 메모리에 모은 뒤 기록)"""
+    records, markdown = [], [MARKDOWN_HEADER]
+    for region in cube.labels['지역']:
+        for year in cube.labels['연도']:
+            region_year = cube.where({'지역': region, '연도': year})
+            by_cancer = region_year.series('암종')
+            region_total = by_cancer.sum()
+            ranks = by_cancer.rank(ascending=False, method='first').astype(int)
+            for cancer, total in by_cancer.items():
+                if total < 1:
+                    continue
+                cohort = region_year.where({'암종': cancer})
+                sexes = cohort.series('성별')
+                ages = cohort.series('연령대')
+                record = {
+                    '지역': region, '연도': int(year), '암종': cancer, '발생수': int(total),
+                    '남성': int(sexes['남성']), '여성': int(sexes['여성']),
+                    '남성_비율': round(sexes['남성'] / total * 100, 1),
+                    '여성_비율': round(sexes['여성'] / total * 100, 1),
+                    '인구10만명당발생률': round(float(total / population.get(int(year), region) * 100000), 2),
+                    '지역_내_순위': int(ranks[cancer]),
+                    '지역_내_비율': round(total / region_total * 100, 1),
+                    '최고_위험_연령대': ages.idxmax(),
+                    '최고_위험_연령대_발생수': int(ages.max()),
+                }
+                records.append(record)
+                markdown.append(MARKDOWN_TEMPLATE.format(**record))
+
+    (root / 'cohort_reports.jsonl').write_text(
+        ''.join(json.dumps(record, ensure_ascii=False) + '\n' for record in records), encoding='utf-8')
+    (root / 'cohort_reports.md').write_text(''.join(markdown), encoding='utf-8')
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=COHORT_COLUMNS, lineterminator='\n')
+    writer.writeheader()
+    writer.writerows(records)
+    (root / 'cohort_reports.csv').write_text(buffer.getvalue(), encoding='utf-8-sig')
+    return len(records)
+
+
+def engine_reports(cube, population, root, batch_size):
+    table = cohort_table(cube, population)
+    CohortReportEngine(batch_size=batch_size).write(table, root)
+    return len(table)
+
+
+def measure(func):
+    """(시간, 최대 추가 메모리 바이트, 결과) - 시간은 tracemalloc 없이 따로 측정"""
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=500_000, help='합성 케이스 수')
+    parser.add_argument('--years', type=int, default=20, help='연도 수 (코호트 수 = 17개 지역 × 연도 수 × 8개 암종)')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    cube = CancerCube.from_records(synthetic_cases(args.rows, years=tuple(range(2021 - args.years, 2021))))
+    population = get_population_table()
+
+    print(f"{'method':<12} {'cohorts':>8} {'time(s)':>8} {'cohorts/s':>10} {'peak(MB)':>9}")
+    with tempfile.TemporaryDirectory() as tmp:
+        cases = {
+            'per-cohort': lambda: per_cohort_reports(cube, population, Path(tmp)),
+            'engine': lambda: engine_reports(cube, population, Path(tmp), args.batch_size),
+        }
+        for name, func in cases.items():
+            elapsed, peak, cohorts = measure(func)
+            print(f"{name:<12} {cohorts:>8,} {elapsed:>8.2f} {cohorts / elapsed:>10,.0f} "
+                  f"{peak / 1024 / 1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
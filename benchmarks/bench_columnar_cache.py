@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+data/*.csv 로드 벤치마크: CSV 직접 파싱 vs 컬럼형(Parquet) 캐시
+
+합성 데이터셋(synthetic.py)을 --scale배로 늘려 CSV로 저장한 뒤
+CancerDataset.from_csv(cache=False), 캐시 생성(첫 로드), 캐시 적중(이후 로드)의 시간과 메모리를 비교
+
+사용법: python benchmarks/bench_columnar_cache.py [--scale 10000] [--repeat 3]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from dataset import CancerDataset
+from synthetic import dataset_rows, synthetic_dataset
+
+
+def frame_memory_mb(dataset):
+    return sum(frame.memory_usage(deep=True).sum() for frame in dataset.frames()) / 1024 / 1024
+
+
+def timed(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=10_000, help='현재 데이터 크기 대비 배수')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    source = synthetic_dataset(args.scale)
+    print(f"{dataset_rows(source):,} rows (scale {args.scale})\n")
+    print(f"{'load':<22} {'time(s)':>9} {'memory(MB)':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        source.to_csv(data_dir)
+
+        elapsed, dataset = timed(lambda: CancerDataset.from_csv(data_dir, cache=False), args.repeat)
+        print(f"{'csv':<22} {elapsed:>9.3f} {frame_memory_mb(dataset):>11.1f}")
+
+        start = time.perf_counter()
+        dataset = CancerDataset.from_csv(data_dir)
+        elapsed = time.perf_counter() - start
+        print(f"{'columnar (build)':<22} {elapsed:>9.3f} {frame_memory_mb(dataset):>11.1f}")
+
+        elapsed, dataset = timed(lambda: CancerDataset.from_csv(data_dir), args.repeat)
+        print(f"{'columnar (hit)':<22} {elapsed:>9.3f} {frame_memory_mb(dataset):>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+엔드포인트 수에 따른 수집 소요 시간 벤치마크 (순차 vs 동시 요청)
+
+사용법: python benchmarks/bench_concurrent_fetch.py [--delay 0.5] [--max-workers 8]
+"""
+
+import argparse
+import contextlib
+import io
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from data_collector import CancerDataCollector
+from stub_server import StubServer
+
+
+def time_fetch(base_url, endpoint_count, fetch_mode, max_workers):
+    """엔드포인트 endpoint_count개를 수집하는 데 걸린 시간(초)"""
+    collector = CancerDataCollector(base_url=base_url, fetch_mode=fetch_mode,
+                                    max_workers=max_workers, total_timeout=120,
+                                    cache_dir=None)
+    collector.api_endpoints = {f'endpoint_{i}': f'endpoint_{i}.do' for i in range(endpoint_count)}
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        collector._fetch_real_api_data(2020)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--delay', type=float, default=0.5, help='스텁 서버 응답 지연(초)')
+    parser.add_argument('--max-workers', type=int, default=8, help='동시 요청 수 상한')
+    parser.add_argument('--counts', type=int, nargs='+', default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    print(f"Stub delay: {args.delay}s, max workers: {args.max_workers}")
+    print(f"{'endpoints':>10} {'sequential(s)':>14} {'concurrent(s)':>14} {'speedup':>8}")
+    with StubServer(delay=args.delay) as server:
+        for count in args.counts:
+            sequential = time_fetch(server.url, count, 'sequential', args.max_workers)
+            concurrent = time_fetch(server.url, count, 'concurrent', args.max_workers)
+            print(f"{count:>10} {sequential:>14.2f} {concurrent:>14.2f} {sequential / concurrent:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+케이스 단위 레코드에 대한 큐브 집계 벤치마크
+
+큐브를 한 번 만든 뒤 성별 비율, 상위 암종, 지역별 구성비를 조회하는 시간과
+같은 질의를 pandas groupby로 매번 계산하는 시간을 비교
+
+사용법: python benchmarks/bench_cube.py [--rows 100000 1000000]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from cube import CancerCube
+from dataset import AGE_BANDS, REGIONS, SEXES
+
+CANCER_TYPES = ['갑상선암', '폐암', '대장암', '위암', '유방암', '전립선암', '간암', '자궁경부암']
+
+
+def synthetic_cases(rows, years=(2018, 2019, 2020), seed=0):
+    """케이스 단위 합성 레코드 (한 행 = 한 건)"""
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        '연도': rng.choice(list(years), rows),
+        '암종': rng.choice(CANCER_TYPES, rows),
+        '성별': rng.choice(SEXES, rows),
+        '연령대': rng.choice(AGE_BANDS, rows),
+        '지역': rng.choice(REGIONS, rows)
+    })
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def run_queries_with_cube(cube):
+    cube.shares('성별')
+    cube.top_n('암종', 5)
+    cube.shares('지역')
+    cube.shares('성별', {'지역': '서울특별시'})
+    cube.top_n('암종', 5, {'연도': 2020, '성별': '여성'})
+
+
+def run_queries_with_pandas(cases):
+    cases['성별'].value_counts(normalize=True)
+    cases.groupby('암종').size().nlargest(5)
+    cases['지역'].value_counts(normalize=True)
+    cases.loc[cases['지역'] == '서울특별시', '성별'].value_counts(normalize=True)
+    subset = cases[(cases['연도'] == 2020) & (cases['성별'] == '여성')]
+    subset.groupby('암종').size().nlargest(5)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000, 5_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'build(s)':>9} {'cube queries(ms)':>17} {'pandas queries(ms)':>19}")
+    for rows in args.rows:
+        cases = synthetic_cases(rows)
+        cube, build = timed(lambda: CancerCube.from_records(cases))
+        _, cube_queries = timed(lambda: run_queries_with_cube(cube))
+        _, pandas_queries = timed(lambda: run_queries_with_pandas(cases))
+        print(f"{rows:>10,} {build:>9.2f} {cube_queries * 1000:>17.1f} {pandas_queries * 1000:>19.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+연도 × 지역별 대시보드 일괄 생성 벤치마크 (소요 시간과 출력 크기)
+
+대시보드마다 Figure를 만들어 fig.write_html(plotly.js 내장)로 저장하는 기존 방식과
+DashboardTemplate.write_many(템플릿 재사용 + typed array + plotly.js 공유/CDN)를 비교
+
+사용법: python benchmarks/bench_dashboards.py [--rows 200000] [--years 3]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from bench_cube import synthetic_cases
+from cube import CancerCube
+from dashboard import DashboardTemplate, build_dashboard_figure, cube_dashboards
+
+
+def directory_size(path):
+    return sum(f.stat().st_size for f in Path(path).rglob('*') if f.is_file())
+
+
+def write_with_figures(dashboards):
+    for path, dataset, title in dashboards:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fig = build_dashboard_figure(dataset.cancer_data, dataset.age_data, dataset.regional_data, title)
+        fig.write_html(str(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=200_000, help='합성 케이스 수')
+    parser.add_argument('--years', type=int, default=3, help='연도 수 (대시보드 수 = 연도 수 × 17개 지역)')
+    args = parser.parse_args()
+
+    cases = synthetic_cases(args.rows, years=tuple(range(2021 - args.years, 2021)))
+    cube = CancerCube.from_records(cases)
+
+    print(f"{'mode':<22} {'dashboards':>10} {'time(s)':>9} {'per file(ms)':>13} {'total size(MB)':>15}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for mode in ('write_html', 'template-inline', 'template-shared', 'template-cdn'):
+            output_dir = Path(tmp) / mode
+            dashboards = list(cube_dashboards(cube, output_dir))
+            start = time.perf_counter()
+            if mode == 'write_html':
+                write_with_figures(dashboards)
+            else:
+                DashboardTemplate(plotly_js=mode.split('-')[1], output_dir=output_dir).write_many(dashboards)
+            elapsed = time.perf_counter() - start
+            size_mb = directory_size(output_dir) / 1024 / 1024
+            print(f"{mode:<22} {len(dashboards):>10} {elapsed:>9.2f} {elapsed / len(dashboards) * 1000:>13.1f} "
+                  f"{size_mb:>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+HTML 통계 페이지 파싱 벤치마크: 기존 정규식 방식 vs 스트리밍 표 추출기(html_tables.py)
+
+--size MB 크기의 합성 페이지(스크립트, 잡음 표, 지역별 암종 표)를 만들어
+정규식 방식(숫자 전체 findall + 암종 이름 포함 여부만 확인)과
+StatisticsTableParser(문자열을 조각으로 나눠 한 번에 파싱, 숫자까지 추출)의
+처리 속도(MB/s)와 최대 추가 메모리(tracemalloc)를 비교
+생성기로 조각을 흘려보내는 경우(페이지 전체를 메모리에 두지 않음)도 함께 측정
+
+사용법: python benchmarks/bench_html_tables.py [--size 8] [--chunk-kb 64] [--repeat 3]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from html_tables import CANCER_NAMES, extract_cancer_tables
+
+
+def table_html(rng, title):
+    rows = ['<tr><th>암종</th><th>남성</th><th>여성</th><th>총계</th></tr>']
+    for name in CANCER_NAMES:
+        male, female = rng.randint(0, 30000), rng.randint(0, 30000)
+        rows.append(f'<tr><td class="name">{name}</td><td>{male:,}</td><td>{female:,}</td>'
+                    f'<td>{male + female:,}</td></tr>')
+    return f'<h3>{title}</h3><table class="stat">{"".join(rows)}</table>\n'
+
+
+def noise_html(rng):
+    cells = ''.join(f'<td>{rng.randint(0, 10**6):,}</td>' for _ in range(8))
+    return (f'<div class="item"><a href="/page?id={rng.randint(0, 10**6)}">공지 {rng.randint(0, 999)}</a>'
+            f'<table><tr>{cells}</tr></table></div>\n')
+
+
+def page_chunks(size_mb, chunk_size, seed=0):
+    """size_mb 크기가 될 때까지 페이지 조각을 생성 (chunk_size 글자 단위)"""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    produced = 0
+    buffer = '<html><head><script>var cancers = ["위암", "폐암"];</script></head><body>\n'
+    while produced < target:
+        buffer += table_html(rng, f'지역 {produced}') if rng.random() < 0.2 else noise_html(rng)
+        while len(buffer) >= chunk_size:
+            produced += chunk_size
+            yield buffer[:chunk_size]
+            buffer = buffer[chunk_size:]
+    yield buffer + '</body></html>'
+
+
+def regex_baseline(html_content):
+    """기존 _parse_html_statistics (숫자는 찾지만 버리고 암종 이름 포함 여부만 반환)"""
+    numbers = re.findall(r'[\d,]+', html_content)
+    return {cancer: {'found_in_html': True, 'position': i}
+            for i, cancer in enumerate(CANCER_NAMES) if cancer in html_content}
+
+
+def measure(func, repeat):
+    """(최소 시간, 최대 추가 메모리 바이트, 결과)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(times), peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--size', type=float, default=8, help='페이지 크기(MB)')
+    parser.add_argument('--chunk-kb', type=int, default=64, help='파서에 넣는 조각 크기(KB)')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    chunk_size = args.chunk_kb * 1024
+    page = ''.join(page_chunks(args.size, chunk_size))
+    size_mb = len(page.encode('utf-8')) / 1024 / 1024
+    print(f"Page: {size_mb:.1f} MB ({len(page):,} chars), chunk {args.chunk_kb} KB\n")
+
+    cases = {
+        'regex (names only)': lambda: regex_baseline(page),
+        'parser (string)': lambda: extract_cancer_tables(page, chunk_size=chunk_size),
+        'parser (stream)': lambda: extract_cancer_tables(page_chunks(args.size, chunk_size)),
+    }
+    print(f"{'method':<20} {'time(s)':>8} {'MB/s':>7} {'peak(MB)':>9} {'rows':>5}")
+    for name, func in cases.items():
+        elapsed, peak, result = measure(func, args.repeat)
+        rows = sum('남성' in values for values in result.values()) if isinstance(result, dict) else len(result[0])
+        print(f"{name:<20} {elapsed:>8.3f} {size_mb / elapsed:>7.1f} {peak / 1024 / 1024:>9.2f} {rows:>5}")
+    print("\n'parser (stream)' includes generating the page chunks; its peak excludes the page itself.")
+
+
+if __name__ == "__main__":
+    main()
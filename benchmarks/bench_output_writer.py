@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+출력 파일 쓰기 벤치마크: 기존 순차 to_csv vs OutputWriter(임시 파일 + 원자적 교체, 동시 기록, 압축)
+
+합성 데이터셋(synthetic.py)을 --scale배로 늘려 세 CSV를 쓰는 데 걸린 시간과 파일 크기를 비교
+쓰는 동안 다른 스레드가 파일을 계속 읽어 반쯤 쓰인 파일(이전/새 내용 어느 쪽과도 크기가 다른 파일)을 본 횟수도 셈
+
+사용법: python benchmarks/bench_output_writer.py [--scale 2000] [--workers 1 3] [--repeat 3]
+"""
+
+import argparse
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from dataset import CancerDataset
+from output_writer import OutputWriter, check_compression
+from synthetic import dataset_rows, synthetic_dataset
+
+
+def write_direct(dataset, data_dir):
+    """기존 CancerDataset.to_csv (최종 경로에 바로 순차 기록)"""
+    for attr, filename in CancerDataset.FILES.items():
+        getattr(dataset, attr).to_csv(data_dir / filename, index=False, encoding='utf-8-sig')
+
+
+def write_with_writer(dataset, data_dir, workers, compression):
+    writer = OutputWriter(data_dir, compression=compression, workers=workers)
+    for attr, filename in CancerDataset.FILES.items():
+        writer.add_csv(filename, getattr(dataset, attr))
+    return writer.commit()
+
+
+class TornReadWatcher:
+    """쓰는 동안 파일을 계속 읽어, 크기가 허용된 값(이전/새 파일 크기)이 아닌 경우를 셈"""
+
+    def __init__(self, path, sizes):
+        self.path = path
+        self.sizes = set(sizes)
+        self.reads = 0
+        self.torn = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                size = len(self.path.read_bytes())
+            except FileNotFoundError:
+                size = None
+            self.reads += 1
+            if size not in self.sizes:
+                self.torn += 1
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def timed(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scale', type=int, default=2000, help='현재 데이터 크기 대비 배수')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 3])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    dataset = synthetic_dataset(args.scale)
+    print(f"{dataset_rows(dataset):,} rows (scale {args.scale})\n")
+
+    compressions = [None, 'gzip']
+    try:
+        check_compression('zstd')
+        compressions.append('zstd')
+    except ImportError as e:
+        print(f"(skipping zstd: {e})\n")
+
+    print(f"{'writer':<26} {'time(s)':>8} {'size(MB)':>9} {'torn reads':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        data_dir = Path(tmp)
+        watched = data_dir / CancerDataset.FILES['regional_data']
+
+        elapsed = timed(lambda: write_direct(dataset, data_dir), args.repeat)
+        size = sum((data_dir / filename).stat().st_size for filename in CancerDataset.FILES.values())
+        with TornReadWatcher(watched, {watched.stat().st_size}) as watcher:
+            write_direct(dataset, data_dir)
+        print(f"{'direct to_csv':<26} {elapsed:>8.3f} {size / 1024 / 1024:>9.1f} "
+              f"{watcher.torn:>5}/{watcher.reads:<5}")
+
+        for compression in compressions:
+            for workers in args.workers:
+                elapsed = timed(lambda: write_with_writer(dataset, data_dir, workers, compression), args.repeat)
+                entries = write_with_writer(dataset, data_dir, workers, compression)
+                size = sum(entry['size'] for entry in entries.values())
+                path = data_dir / next(name for name in entries if name.startswith(watched.name))
+                with TornReadWatcher(path, {path.stat().st_size}) as watcher:
+                    write_with_writer(dataset, data_dir, workers, compression)
+                name = f"writer {compression or 'plain'} x{workers}"
+                print(f"{name:<26} {elapsed:>8.3f} {size / 1024 / 1024:>9.1f} "
+                      f"{watcher.torn:>5}/{watcher.reads:<5}")
+
+
+if __name__ == "__main__":
+    main()
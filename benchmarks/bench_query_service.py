@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+분석 질의 HTTP 서비스 부하 테스트 (p50/p99 지연 시간, 초당 요청 수)
+
+--url을 주지 않으면 main.py --serve로 로컬 서비스를 띄운 뒤 측정하고 종료
+여러 필터 조합의 URL을 섞어 keep-alive 연결 --concurrency개로 --requests번 요청
+
+사용법: python benchmarks/bench_query_service.py [--requests 2000] [--concurrency 16]
+        [--serve-cache 0] [--extract cases.csv] [--url http://127.0.0.1:8000]
+"""
+
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from urllib.parse import quote, urlsplit
+
+import numpy as np
+
+project_root = Path(__file__).resolve().parent.parent
+
+# 데이터와 상관없이 항상 유효한 질의 + 케이스 단위 데이터(--extract)에서만 가능한 필터 질의
+BASE_PATHS = ['/gender', '/top-cancers', '/top-cancers?n=3', '/top-cancers?n=5', '/age', '/regional']
+FILTERED_PATHS = [f'/{endpoint}?region={quote(region)}'
+                  for endpoint in ('gender', 'top-cancers', 'age')
+                  for region in ('서울특별시', '부산광역시', '경기도', '제주특별자치도')] + \
+                 [f'/regional?cancer={quote(cancer)}' for cancer in ('폐암', '위암', '대장암')]
+
+
+async def fetch(reader, writer, host, path):
+    """keep-alive 연결로 GET 한 번, (상태 코드, 캐시 여부) 반환"""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('ascii'))
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    await reader.readexactly(int(headers['content-length']))
+    return status, headers.get('x-cache') == 'HIT'
+
+
+async def run_client(url, paths, requests, concurrency):
+    """요청별 지연 시간(초), 상태 코드, 캐시 적중 수와 전체 소요 시간"""
+    parts = urlsplit(url)
+    latencies = []
+    statuses = {}
+    hits = 0
+    counter = iter(range(requests))
+
+    async def connection():
+        nonlocal hits
+        reader, writer = await asyncio.open_connection(parts.hostname, parts.port)
+        try:
+            for i in counter:
+                start = time.perf_counter()
+                status, cached = await fetch(reader, writer, parts.netloc, paths[i % len(paths)])
+                latencies.append(time.perf_counter() - start)
+                statuses[status] = statuses.get(status, 0) + 1
+                hits += cached
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(connection() for _ in range(concurrency)))
+    return np.array(latencies), statuses, hits, time.perf_counter() - start
+
+
+def start_service(args):
+    """main.py --serve를 하위 프로세스로 실행하고 (프로세스, URL) 반환"""
+    command = [sys.executable, 'main.py', '--serve', '127.0.0.1:0',
+               '--serve-workers', str(args.serve_workers), '--serve-executor', args.serve_executor,
+               '--serve-cache', str(args.serve_cache)]
+    if args.extract:
+        command += ['--extract', str(Path(args.extract).resolve())]
+    process = subprocess.Popen(command, cwd=project_root, stdout=subprocess.PIPE, text=True)
+    for line in process.stdout:
+        if line.startswith('Serving on '):
+            return process, line.split()[-1]
+    raise RuntimeError("Service exited before it started listening")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--url', help='이미 실행 중인 서비스 주소 (없으면 로컬 서비스를 띄움)')
+    parser.add_argument('--requests', type=int, default=2000, help='전체 요청 수')
+    parser.add_argument('--concurrency', type=int, default=16, help='동시 연결 수')
+    parser.add_argument('--extract', help='케이스 단위 추출본 CSV (지역/암종 필터 질의 포함)')
+    parser.add_argument('--serve-workers', type=int, default=4)
+    parser.add_argument('--serve-executor', choices=['thread', 'process'], default='thread')
+    parser.add_argument('--serve-cache', type=int, default=256, help='서비스 응답 캐시 크기 (0이면 비활성)')
+    args = parser.parse_args()
+
+    paths = BASE_PATHS + (FILTERED_PATHS if args.extract else [])
+    process = None
+    url = args.url
+    if url is None:
+        process, url = start_service(args)
+    try:
+        latencies, statuses, hits, elapsed = asyncio.run(
+            run_client(url, paths, args.requests, args.concurrency))
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    print(f"Service: {url} ({len(paths)} distinct queries, concurrency {args.concurrency})")
+    print(f"Requests: {len(latencies):,} in {elapsed:.2f}s -> {len(latencies) / elapsed:,.0f} req/s")
+    print(f"Latency: p50 {p50:.2f}ms, p99 {p99:.2f}ms, max {latencies.max() * 1000:.2f}ms")
+    print(f"Status codes: {json.dumps(statuses)}, cache hits: {hits:,}")
+
+
+if __name__ == "__main__":
+    main()
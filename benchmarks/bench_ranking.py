@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+순위 질의 벤치마크: 질의마다 nlargest/rank를 다시 계산하는 방식 vs RankingIndex
+
+합성 케이스로 만든 큐브의 연도 × 지역 × 성별 파티션마다 암종 top-N, 암종별 순위와 백분위를 질의
+- nlargest: 긴 형식 표에서 파티션 행을 골라 질의마다 nlargest / rank 계산
+- cube.top_n: 질의마다 큐브를 필터링해 주변합을 구하고 정렬
+- index: RankingIndex를 한 번 만든 뒤 정렬된 위치 배열과 미리 계산한 순위를 조회 (생성 시간 포함)
+세 방식의 top-N 결과가 같은지도 확인
+
+사용법: python benchmarks/bench_ranking.py [--rows 500000] [--years 20] [--top 5] [--repeat 3]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from bench_cube import synthetic_cases
+from cube import CancerCube
+from ranking import RankingIndex
+
+PARTITION_BY = ('연도', '지역', '성별')
+
+
+def query_nlargest(frame, partitions, top):
+    results = []
+    for partition in partitions:
+        mask = True
+        for dim, label in zip(PARTITION_BY, partition):
+            mask = mask & (frame[dim] == label)
+        rows = frame[mask]
+        results.append(rows.nlargest(top, '발생수')['암종'].tolist())
+        ranks = rows['발생수'].rank(method='first', ascending=False)
+        below = rows['발생수'].rank(method='min') - 1
+        for cancer in rows['암종']:
+            selected = (rows['암종'] == cancer).to_numpy()
+            int(ranks[selected].iloc[0])
+            float(below[selected].iloc[0] / (len(rows) - 1) * 100)
+    return results
+
+
+def query_cube(cube, partitions, top):
+    results = []
+    for partition in partitions:
+        filters = dict(zip(PARTITION_BY, partition))
+        results.append(cube.top_n('암종', top, filters).index.tolist())
+        counts = cube.series('암종', filters)
+        ranks = counts.rank(method='first', ascending=False)
+        below = counts.rank(method='min') - 1
+        for cancer in counts.index:
+            int(ranks[cancer])
+            float(below[cancer] / (len(counts) - 1) * 100)
+    return results
+
+
+def query_index(cube, partitions, top):
+    ranking = RankingIndex.from_cube(cube, '암종', PARTITION_BY)
+    results = []
+    for partition in partitions:
+        results.append(ranking.top_keys('발생수', top, partition))
+        for cancer in cube.labels['암종']:
+            ranking.rank('발생수', cancer, partition)
+            ranking.percentile('발생수', cancer, partition)
+    return results
+
+
+def timed(func, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return min(times), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=500_000, help='합성 케이스 수')
+    parser.add_argument('--years', type=int, default=20, help='연도 수 (파티션 수 = 연도 수 × 17개 지역 × 2개 성별)')
+    parser.add_argument('--top', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    cube = CancerCube.from_records(synthetic_cases(args.rows, years=tuple(range(2021 - args.years, 2021))))
+    frame = cube.to_frame(PARTITION_BY + ('암종',))
+    partitions = list(frame[list(PARTITION_BY)].drop_duplicates().itertuples(index=False, name=None))
+    queries = len(partitions) * (1 + 2 * len(cube.labels['암종']))
+    print(f"{len(partitions):,} partitions, {queries:,} queries (top-{args.top}, rank, percentile)\n")
+
+    cases = {
+        'nlargest': lambda: query_nlargest(frame, partitions, args.top),
+        'cube.top_n': lambda: query_cube(cube, partitions, args.top),
+        'index': lambda: query_index(cube, partitions, args.top),
+    }
+    print(f"{'method':<12} {'time(s)':>8} {'queries/s':>10} {'same':>5}")
+    expected = None
+    for name, func in cases.items():
+        elapsed, result = timed(func, args.repeat)
+        expected = expected if expected is not None else result
+        print(f"{name:<12} {elapsed:>8.3f} {queries / elapsed:>10,.0f} {str(result == expected):>5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+레지스트리 추출본 스트리밍 집계 벤치마크 (처리 속도와 최대 메모리)
+
+사용법: python benchmarks/bench_streaming_ingest.py [--rows 1000000] [--chunksize 200000]
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from dataset import REGIONS
+from streaming_ingest import RegistryAggregator
+
+CANCER_TYPES = ['갑상선암', '폐암', '대장암', '위암', '유방암', '전립선암', '간암', '자궁경부암']
+
+
+def write_extract(path, rows, seed=0, block=500_000):
+    """케이스 단위 합성 추출본 (성별 코드 M/F, 정수 나이) 작성"""
+    rng = np.random.default_rng(seed)
+    written = 0
+    while written < rows:
+        n = min(block, rows - written)
+        pd.DataFrame({
+            '연도': rng.choice([2018, 2019, 2020], n),
+            '암종': rng.choice(CANCER_TYPES, n),
+            '성별': rng.choice(['M', 'F'], n),
+            '나이': rng.integers(0, 100, n),
+            '지역': rng.choice(REGIONS, n)
+        }).to_csv(path, mode='a', header=written == 0, index=False, encoding='utf-8')
+        written += n
+
+
+def run_mode(mode, path, chunksize):
+    """한 가지 방식으로 집계하고 (소요 시간(초), 최대 RSS(MB)) 반환 (별도 프로세스에서 실행)"""
+    start = time.perf_counter()
+    if mode == 'stream':
+        with contextlib.redirect_stdout(io.StringIO()):
+            RegistryAggregator().ingest_csv(path, chunksize=chunksize).to_dataset()
+    else:
+        cases = pd.read_csv(path)
+        cases.groupby(['암종', '성별']).size()
+    elapsed = time.perf_counter() - start
+    # ru_maxrss 단위: Linux는 KB, macOS는 바이트
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    peak_mb = peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+    return elapsed, peak_mb
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--chunksize', type=int, default=200_000)
+    parser.add_argument('--mode', choices=['stream', 'full'], help=argparse.SUPPRESS)
+    parser.add_argument('--path', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.mode:
+        print(json.dumps(run_mode(args.mode, args.path, args.chunksize)))
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'extract.csv'
+        write_extract(path, args.rows)
+        size_mb = path.stat().st_size / 1024 / 1024
+        print(f"Extract: {args.rows:,} rows, {size_mb:.1f} MB")
+
+        # 최대 메모리를 독립적으로 재기 위해 방식마다 새 프로세스에서 실행
+        for mode, label in (('stream', 'streaming'), ('full', 'full load')):
+            output = subprocess.run([sys.executable, __file__, '--mode', mode, '--path', str(path),
+                                     '--chunksize', str(args.chunksize)],
+                                    capture_output=True, text=True, check=True).stdout
+            elapsed, peak = json.loads(output)
+            print(f"{label:<10}: {elapsed:6.2f}s  {args.rows / elapsed:>12,.0f} rows/s  peak RSS {peak:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+수집기/분석기/시각화 모듈의 공개 메서드 벤치마크 모음
+
+합성 데이터(synthetic.py)를 현재 크기의 --scales배로 늘려 메서드별 소요 시간(최소/중앙값)과
+실행 중 최대 메모리 증가량(RSS)을 측정하고 JSON으로 저장
+--compare로 이전 결과와 비교해 --threshold보다 느려지거나 메모리가 늘면 종료 코드 1
+
+사용법: python benchmarks/bench_suite.py [--scales 1 100 10000] [--only analyzer]
+        [--output results.json] [--compare baseline.json --threshold 0.2]
+"""
+
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from bench_streaming_ingest import write_extract
+from data_analyzer import CancerDataAnalyzer
+from data_collector import CancerDataCollector
+from synthetic import dataset_rows, synthetic_dataset
+from visualizer import CancerDataVisualizer
+
+# 추출본 벤치마크의 scale 1당 케이스 행 수
+EXTRACT_ROWS_PER_SCALE = 10_000
+
+# scale 1 합성 데이터셋의 행 수
+BASE_ROWS = dataset_rows(synthetic_dataset(1))
+
+BENCHMARKS = []
+
+
+def benchmark(name, scaled=True, chart=False, rows=None):
+    """
+    벤치마크 등록 데코레이터
+    함수는 (scale, workdir)를 받아 측정할 호출 가능 객체를 반환 (준비 작업은 측정하지 않음, 반복마다 호출)
+    scaled=False면 합성 데이터 크기와 무관하므로 첫 scale에서만 실행
+    chart=True면 --max-chart-scale보다 큰 scale에서는 건너뜀
+    rows: scale -> 입력 행 수 (기본값: 합성 데이터셋 세 표의 행 수)
+    """
+    def register(setup):
+        BENCHMARKS.append({'name': name, 'setup': setup, 'scaled': scaled, 'chart': chart,
+                           'rows': rows or (lambda scale: scale * BASE_ROWS)})
+        return setup
+    return register
+
+
+def loaded_analyzer(scale):
+    analyzer = CancerDataAnalyzer(dataset=synthetic_dataset(scale))
+    analyzer.load_data()
+    return analyzer
+
+
+def loaded_visualizer(scale):
+    visualizer = CancerDataVisualizer(dataset=synthetic_dataset(scale))
+    visualizer.load_data()
+    return visualizer
+
+
+@benchmark('collector.save_data', scaled=False)
+def bench_save_data(scale, workdir):
+    # API 키가 없으면 샘플 데이터로 수집 (네트워크를 쓰지 않도록 CANCER_API_KEY는 비움)
+    os.environ.pop('CANCER_API_KEY', None)
+    return CancerDataCollector(cache_dir=None).save_data
+
+
+@benchmark('collector.save_data_from_extract', rows=lambda scale: scale * EXTRACT_ROWS_PER_SCALE)
+def bench_save_data_from_extract(scale, workdir):
+    path = workdir / f'extract_{scale}.csv'
+    if not path.exists():
+        write_extract(path, scale * EXTRACT_ROWS_PER_SCALE)
+    return lambda: CancerDataCollector(cache_dir=None).save_data_from_extract(path)
+
+
+@benchmark('dataset.to_csv')
+def bench_to_csv(scale, workdir):
+    dataset = synthetic_dataset(scale)
+    return lambda: dataset.to_csv(workdir / 'data')
+
+
+@benchmark('analyzer.load_data')
+def bench_load_data(scale, workdir):
+    synthetic_dataset(scale).to_csv(workdir / 'data')
+    return CancerDataAnalyzer().load_data
+
+
+@benchmark('analyzer.generate_summary_report')
+def bench_summary_report(scale, workdir):
+    # 분석기마다 새 캐시이므로 매번 모든 분석을 다시 계산
+    return loaded_analyzer(scale).generate_summary_report
+
+
+@benchmark('analyzer.analyze_gender_distribution')
+def bench_gender(scale, workdir):
+    return loaded_analyzer(scale).analyze_gender_distribution
+
+
+@benchmark('analyzer.analyze_top_cancers')
+def bench_top_cancers(scale, workdir):
+    return loaded_analyzer(scale).analyze_top_cancers
+
+
+@benchmark('analyzer.analyze_age_distribution')
+def bench_age(scale, workdir):
+    return loaded_analyzer(scale).analyze_age_distribution
+
+
+@benchmark('analyzer.analyze_regional_distribution')
+def bench_regional(scale, workdir):
+    return loaded_analyzer(scale).analyze_regional_distribution
+
+
+for _method in ('create_cancer_type_chart', 'create_gender_distribution_chart',
+                'create_age_distribution_chart', 'create_regional_map_chart',
+                'create_interactive_dashboard'):
+    benchmark(f'visualizer.{_method}', chart=True)(
+        lambda scale, workdir, method=_method: getattr(loaded_visualizer(scale), method))
+
+
+@benchmark('visualizer.generate_all_charts', chart=True)
+def bench_all_charts(scale, workdir):
+    synthetic_dataset(scale).to_csv(workdir / 'data')
+    return CancerDataVisualizer().generate_all_charts
+
+
+def current_rss():
+    """현재 프로세스 RSS(바이트), /proc이 없으면 None"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return None
+
+
+class PeakMemory:
+    """
+    with 블록 동안의 최대 메모리 증가량(바이트)
+    Linux는 RSS를 1ms마다 샘플링 (pandas를 크게 느리게 하는 tracemalloc은 /proc이 없을 때만 사용)
+    """
+
+    def __enter__(self):
+        self.peak = 0
+        self._baseline = current_rss()
+        if self._baseline is None:
+            tracemalloc.start()
+            return self
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+        return self
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, current_rss() - self._baseline)
+            time.sleep(0.001)
+
+    def __exit__(self, *exc_info):
+        if self._baseline is None:
+            self.peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        else:
+            self._stop.set()
+            self._thread.join()
+            self.peak = max(self.peak, current_rss() - self._baseline)
+
+
+def run_benchmark(entry, scale, repeat, workdir, warmup=1):
+    """한 벤치마크를 warmup번 실행(지연 import, 첫 호출 비용 제외)한 뒤 repeat번 측정한 결과"""
+    times = []
+    peak = 0
+    for i in range(warmup + repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            func = entry['setup'](scale, workdir)
+            with PeakMemory() as memory:
+                start = time.perf_counter()
+                func()
+                elapsed = time.perf_counter() - start
+        if i >= warmup:
+            times.append(elapsed)
+            peak = max(peak, memory.peak)
+    return {
+        'name': entry['name'],
+        'scale': scale,
+        'rows': entry['rows'](scale) if entry['scaled'] else None,
+        'repeat': repeat,
+        'min_s': min(times),
+        'median_s': float(np.median(times)),
+        'peak_mb': peak / 1024 / 1024
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=project_root,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline_path, threshold, min_delta):
+    """이전 결과 대비 변화 출력, 임계값을 넘은 항목 목록 반환"""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = {(r['name'], r['scale']): r for r in json.load(f)['results']}
+
+    regressions = []
+    print(f"\nCompared with {baseline_path} (threshold {threshold:.0%}):")
+    for result in results:
+        before = baseline.get((result['name'], result['scale']))
+        if before is None:
+            continue
+        # min_delta초 미만의 차이는 측정 잡음으로 보고 무시 (몇 ms짜리 메서드)
+        time_change = (result['min_s'] / before['min_s'] - 1
+                       if result['min_s'] - before['min_s'] >= min_delta else 0.0)
+        # 1MB 미만의 메모리 변화는 샘플링 오차로 보고 무시
+        memory_change = ((result['peak_mb'] - before['peak_mb']) / max(before['peak_mb'], 1.0)
+                         if result['peak_mb'] - before['peak_mb'] >= 1.0 else 0.0)
+        flag = ''
+        if time_change > threshold or memory_change > threshold:
+            flag = '  REGRESSION'
+            regressions.append(result)
+        print(f"  {result['name']:<45} x{result['scale']:<6} time {time_change:+7.1%}  "
+              f"memory {memory_change:+7.1%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 100, 10_000],
+                        help='현재 데이터 크기 대비 배수 (100000이면 표마다 수십만~백만 행 이상)')
+    parser.add_argument('--only', nargs='+', default=[], help='이름에 이 문자열이 들어간 벤치마크만 실행')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--warmup', type=int, default=1, help='측정 전에 버리는 실행 횟수')
+    parser.add_argument('--max-chart-scale', type=int, default=10,
+                        help='차트 벤치마크를 실행할 최대 scale (모든 행을 그리는 차트가 있음)')
+    parser.add_argument('--output', help='결과 JSON 경로')
+    parser.add_argument('--compare', metavar='BASELINE', help='비교할 이전 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=0.2, help='회귀로 볼 증가율 (기본 0.2 = 20%%)')
+    parser.add_argument('--min-delta', type=float, default=0.005,
+                        help='회귀로 볼 최소 시간 차이(초), 이보다 작은 차이는 잡음으로 무시')
+    args = parser.parse_args()
+
+    entries = [entry for entry in BENCHMARKS
+               if not args.only or any(pattern in entry['name'] for pattern in args.only)]
+    results = []
+    print(f"{'benchmark':<45} {'scale':>7} {'rows':>10} {'min(s)':>9} {'median(s)':>10} {'peak(MB)':>9}")
+
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        # 메서드들이 data/, charts/, reports/ 상대 경로에 쓰므로 임시 디렉토리에서 실행
+        os.chdir(workdir)
+        (workdir / 'data').mkdir()
+        try:
+            for scale in args.scales:
+                for entry in entries:
+                    if not entry['scaled'] and scale != args.scales[0]:
+                        continue
+                    if entry['chart'] and scale > args.max_chart_scale:
+                        continue
+                    result = run_benchmark(entry, scale, args.repeat, workdir, args.warmup)
+                    results.append(result)
+                    rows = f"{result['rows']:,}" if result['rows'] is not None else '-'
+                    print(f"{result['name']:<45} {scale:>7} {rows:>10} {result['min_s']:>9.4f} "
+                          f"{result['median_s']:>10.4f} {result['peak_mb']:>9.1f}", flush=True)
+        finally:
+            os.chdir(cwd)
+
+    if args.output:
+        report = {
+            'meta': {
+                'date': datetime.datetime.now().isoformat(timespec='seconds'),
+                'commit': git_commit(),
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'cpus': os.cpu_count()
+            },
+            'results': results
+        }
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+    if args.compare and compare(results, args.compare, args.threshold, args.min_delta):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+수집기 전송 계층(transport.py)의 장애 대응 벤치마크
+
+로컬 스텁 서버가 요청의 --fail-rate 비율만큼 503(Retry-After 포함), 500, 연결 끊김을 섞어 응답하고,
+재시도 없음/재시도 정책별로 성공률, 재시도 수, 대기 시간, 소요 시간을 비교
+마지막으로 항상 실패하는 엔드포인트에서 회로 차단기가 열려 요청을 바로 거절하는지 확인
+
+사용법: python benchmarks/bench_transport.py [--requests 200] [--fail-rate 0.3] [--workers 4]
+"""
+
+import argparse
+import json
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+import requests
+
+from transport import CircuitOpenError, ResilientTransport, RetryPolicy
+
+BODY = json.dumps({'statistics': [{'암종': '위암', '발생수': 29455}]}, ensure_ascii=False).encode('utf-8')
+
+
+class FaultInjectingHandler(BaseHTTPRequestHandler):
+    """요청마다 fail_rate 확률로 장애를 주입 (/down/...은 항상 503)"""
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, *args):
+        pass
+
+    def send_body(self, status, body=b'', headers=()):
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits += 1
+            roll = server.random.random()
+            fault = server.random.choice(('503', '500', 'reset'))
+        if self.path.startswith('/down/'):
+            self.send_body(503)
+        elif roll >= server.fail_rate:
+            self.send_body(200, BODY)
+        elif fault == '503':
+            self.send_body(503, headers=[('Retry-After', '0.05')])
+        elif fault == '500':
+            self.send_body(500)
+        else:
+            # 응답 없이 연결을 끊음 (클라이언트에서는 ConnectionError)
+            self.close_connection = True
+
+
+def start_stub_server(fail_rate, seed=0):
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FaultInjectingHandler)
+    server.daemon_threads = True
+    server.fail_rate = fail_rate
+    server.random = random.Random(seed)
+    server.lock = threading.Lock()
+    server.hits = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def run(transport, url, count, workers):
+    """count번 요청해 (성공 수, 소요 시간) 반환"""
+    def fetch(i):
+        try:
+            return transport.get(f"{url}?i={i}", deadline=time.monotonic() + 10).status_code == 200
+        except requests.RequestException:
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(workers) as executor:
+        ok = sum(executor.map(fetch, range(count)))
+    return ok, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=200)
+    parser.add_argument('--fail-rate', type=float, default=0.3, help='장애를 주입할 요청 비율')
+    parser.add_argument('--workers', type=int, default=4, help='동시 요청 수 (커넥션 풀 크기와 같게 설정)')
+    args = parser.parse_args()
+
+    server = start_stub_server(args.fail_rate)
+    base = f"http://127.0.0.1:{server.server_port}"
+    print(f"Stub server {base}, fail rate {args.fail_rate:.0%}, {args.requests} requests, {args.workers} workers\n")
+
+    policies = {
+        'no retry': RetryPolicy(max_retries=0),
+        'retry x3': RetryPolicy(max_retries=3, backoff_base=0.05, backoff_max=1.0, seed=0),
+        'retry x5': RetryPolicy(max_retries=5, backoff_base=0.05, backoff_max=1.0, seed=0),
+    }
+    print(f"{'policy':<10} {'success':>8} {'attempts':>9} {'retries':>8} {'wait(s)':>8} {'time(s)':>8}")
+    for name, policy in policies.items():
+        # 회로 차단기가 주입된 장애로 열리지 않도록 임계값을 크게 둠
+        transport = ResilientTransport(pool_size=args.workers, retry=policy, failure_threshold=10**6)
+        ok, elapsed = run(transport, f"{base}/api/data.do", args.requests, args.workers)
+        metrics = transport.metrics.snapshot()
+        print(f"{name:<10} {ok / args.requests:>8.1%} {metrics['attempts']:>9} {metrics['retries']:>8} "
+              f"{metrics['retry_wait_s']:>8.2f} {elapsed:>8.2f}")
+
+    transport = ResilientTransport(pool_size=args.workers, failure_threshold=5, reset_timeout=60,
+                                   retry=RetryPolicy(max_retries=2, backoff_base=0.01, backoff_max=1.0))
+    hits_before = server.hits
+    rejected = 0
+    for i in range(20):
+        try:
+            transport.get(f"{base}/down/data.do?i={i}")
+        except CircuitOpenError:
+            rejected += 1
+    metrics = transport.metrics.snapshot()
+    print(f"\nAlways-failing endpoint: 20 requests, {server.hits - hits_before} reached the server, "
+          f"{rejected} rejected by the open circuit (state: {list(transport.breaker_states().values())[0]})")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
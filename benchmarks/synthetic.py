@@ -0,0 +1,52 @@
+"""
+벤치마크용 합성 데이터 생성기
+
+data/*.csv와 같은 스키마(암종/남성/여성/총계, 연령대/발생수, 지역/발생수)를
+scale배 행 수로 늘린 CancerDataset을 만든다 (scale=1이면 현재 크기, 레이블 뒤에 #번호를 붙여 확장)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+project_root = Path(__file__).resolve().parent.parent
+sys.path.append(str(project_root / 'src'))
+
+from dataset import AGE_BANDS, REGIONS, CancerDataset
+
+CANCER_TYPES = ['갑상선암', '폐암', '대장암', '위암', '유방암', '전립선암', '간암', '자궁경부암']
+
+
+def scaled_labels(labels, scale):
+    """labels를 scale번 반복 (첫 묶음은 원래 레이블, 이후는 '레이블#i')"""
+    labels = np.asarray(labels, dtype=object)
+    if scale == 1:
+        return labels
+    suffixes = np.repeat(np.arange(scale), len(labels))
+    tiled = np.tile(labels, scale)
+    return np.where(suffixes == 0, tiled, tiled + '#' + suffixes.astype(str).astype(object))
+
+
+def synthetic_dataset(scale=1, seed=0):
+    """행 수가 현재 표의 scale배인 CancerDataset"""
+    rng = np.random.default_rng(seed)
+
+    cancers = scaled_labels(CANCER_TYPES, scale)
+    male = rng.integers(100, 25_000, len(cancers))
+    female = rng.integers(100, 25_000, len(cancers))
+    cancer_data = pd.DataFrame({'암종': cancers, '남성': male, '여성': female, '총계': male + female})
+
+    ages = scaled_labels(AGE_BANDS, scale)
+    age_data = pd.DataFrame({'연령대': ages, '발생수': rng.integers(200, 40_000, len(ages))})
+
+    regions = scaled_labels(REGIONS, scale)
+    regional_data = pd.DataFrame({'지역': regions, '발생수': rng.integers(500, 35_000, len(regions))})
+
+    return CancerDataset(cancer_data, age_data, regional_data)
+
+
+def dataset_rows(dataset):
+    """세 표의 행 수 합계"""
+    return sum(len(frame) for frame in dataset.frames())
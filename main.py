@@ -4,8 +4,13 @@
 메인 실행 스크립트
 """
 
+import argparse
+import hashlib
+import importlib.util
+import json
 import os
 import sys
+import time
 from pathlib import Path
 
 # 프로젝트 루트 디렉토리를 Python path에 추가
@@ -14,7 +19,154 @@ sys.path.append(str(project_root / 'src'))
 
 from data_collector import CancerDataCollector
 from data_analyzer import CancerDataAnalyzer
-from visualizer import CancerDataVisualizer
+from visualizer import CHART_TASKS, CancerDataVisualizer
+from chart_output import DEFAULT_PROFILES, OUTPUT_PROFILES
+from instrumentation import profiled, span, tracer
+from lazy_import import print_import_times
+from output_writer import COMPRESSION_SUFFIXES, check_compression, read_output
+
+# 단계별 입력/출력 해시 기록 (증분 실행용)
+PIPELINE_STATE_PATH = Path('.cache/pipeline_state.json')
+
+# 차트 단계: (단계 이름, 시각화 메서드, data/ 입력 파일)
+# 출력 파일은 CHART_TASKS 참조
+CHART_STAGES = [
+    ('chart:cancer_type', 'create_cancer_type_chart', ['cancer_by_type_gender.csv']),
+    ('chart:gender', 'create_gender_distribution_chart', ['cancer_by_type_gender.csv']),
+    ('chart:age', 'create_age_distribution_chart', ['cancer_by_age.csv']),
+    ('chart:regional', 'create_regional_map_chart', ['cancer_by_region.csv', 'population.csv']),
+    ('chart:dashboard', 'create_interactive_dashboard',
+     ['cancer_by_type_gender.csv', 'cancer_by_age.csv', 'cancer_by_region.csv']),
+]
+
+_code_version = None
+
+def code_version():
+    """
+    main.py와 src/*.py 전체 내용의 해시 (모든 단계에 공통인 코드 버전)
+    단계마다 의존 모듈 목록을 따로 관리하지 않으므로 어느 모듈이 바뀌어도 모든 단계를 다시 실행
+    """
+    global _code_version
+    if _code_version is None:
+        h = hashlib.sha256()
+        for path in [Path(__file__)] + sorted((project_root / 'src').glob('*.py')):
+            h.update(f"{path.name}:{file_digest(path)}".encode('utf-8'))
+        _code_version = h.hexdigest()
+    return _code_version
+
+def file_digest(path):
+    """파일 내용의 SHA-256 (파일이 없으면 None)"""
+    h = hashlib.sha256()
+    try:
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                h.update(chunk)
+    except FileNotFoundError:
+        return None
+    return h.hexdigest()
+
+class Stage:
+    """
+    파이프라인 단계
+    입력 데이터 파일, params, 코드 버전의 해시와 출력 파일의 해시가 이전 실행과 같으면 건너뜀
+    """
+    def __init__(self, name, action, inputs=(), outputs=(), params=None, always_run=False):
+        self.name = name
+        self.action = action
+        self.inputs = [Path(p) for p in inputs]
+        self.outputs = [Path(p) for p in outputs]
+        self.params = params or {}
+        self.always_run = always_run
+    
+    def input_digest(self):
+        """입력 파일 내용, params, 코드 버전을 합친 해시"""
+        h = hashlib.sha256(json.dumps(self.params, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+        h.update(code_version().encode('utf-8'))
+        for path in sorted(self.inputs):
+            h.update(f"{path}:{file_digest(path)}".encode('utf-8'))
+        return h.hexdigest()
+    
+    def output_digests(self):
+        return {str(path): file_digest(path) for path in self.outputs}
+
+class Pipeline:
+    """
+    단계를 순서대로 실행하고 변경이 없는 단계는 건너뛰는 간단한 빌드 그래프
+    profile_dir: 지정하면 실행한 단계마다 cProfile 결과를 <단계 이름>.prof로 저장
+    """
+    def __init__(self, state_path=PIPELINE_STATE_PATH, force=False, profile_dir=None):
+        self.state_path = Path(state_path)
+        self.force = force
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.results = []
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.state = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.state = {}
+    
+    def is_up_to_date(self, stage):
+        """입력과 출력이 이전 실행과 같은지 확인"""
+        previous = self.state.get(stage.name)
+        return (not self.force and not stage.always_run and previous is not None
+                and previous['inputs'] == stage.input_digest()
+                and previous['outputs'] == stage.output_digests())
+    
+    def run(self, stage):
+        """단계 실행 (건너뛰었으면 False)"""
+        def run_one(stages):
+            start = time.perf_counter()
+            stage.action()
+            return {stage.name: (time.perf_counter() - start, None)}
+        
+        return bool(self.run_batch([stage], run_one))
+    
+    def run_batch(self, stages, batch_action, name=None):
+        """
+        오래된 단계만 모아 batch_action(단계 목록)으로 한 번에 실행 (병렬 렌더링 등)
+        batch_action은 단계 이름 -> (소요 시간, 오류 또는 None)을 반환
+        name: 트레이스/프로파일에 쓸 묶음 이름 (기본값: 실행한 단계 이름들)
+        반환값: 실행한 단계 이름 목록
+        """
+        stale = []
+        for stage in stages:
+            if self.is_up_to_date(stage):
+                self.results.append((stage.name, 'skipped', 0.0))
+            else:
+                stale.append(stage)
+        if not stale:
+            return []
+        
+        inputs = {stage.name: stage.input_digest() for stage in stale}
+        batch_name = name or '+'.join(stage.name for stage in stale)
+        profile_path = (self.profile_dir / f"{batch_name.replace(':', '_')}.prof"
+                        if self.profile_dir else None)
+        with span(f"stage:{batch_name}", 'stage'), profiled(profile_path):
+            outcomes = batch_action(stale)
+        
+        for stage in stale:
+            duration, error = outcomes.get(stage.name, (0.0, 'not run'))
+            self.results.append((stage.name, 'failed' if error else 'ran', duration))
+            
+            # 성공했고 출력이 모두 만들어진 경우에만 기록 (실패한 단계는 다음 실행에서 다시 수행)
+            outputs = stage.output_digests()
+            if not error and all(digest is not None for digest in outputs.values()):
+                self.state[stage.name] = {'inputs': inputs[stage.name], 'outputs': outputs}
+        self._save_state()
+        return [stage.name for stage in stale]
+    
+    def _save_state(self):
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.state_path)
+    
+    def print_summary(self):
+        """단계별 실행 여부와 소요 시간 출력"""
+        print("Pipeline summary:")
+        for name, status, duration in self.results:
+            print(f"  {name:<20} {status:<8} {duration:7.2f}s")
 
 def print_banner():
     """배너 출력"""
@@ -30,7 +182,7 @@ def print_banner():
     print(banner)
 
 def check_dependencies():
-    """필요한 패키지 확인"""
+    """필요한 패키지 확인 (실제로 import 하지 않고 설치 여부만 확인)"""
     required_packages = [
         'pandas', 'numpy', 'matplotlib', 'seaborn', 
         'plotly', 'requests'
@@ -38,9 +190,7 @@ def check_dependencies():
     
     missing_packages = []
     for package in required_packages:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
+        if importlib.util.find_spec(package.replace('-', '_')) is None:
             missing_packages.append(package)
     
     if missing_packages:
@@ -71,48 +221,321 @@ def check_api_key():
     
     return True
 
+def parse_years(values):
+    """'2018 2020' 또는 '2016-2020' 형식의 연도 인자를 정렬된 목록으로 변환 (잘못된 값은 ValueError)"""
+    years = set()
+    for value in values:
+        if '-' in value:
+            start, end = (int(part) for part in value.split('-', 1))
+            if end < start:
+                raise ValueError(f"range {value} ends before it starts (write {end}-{start})")
+            years.update(range(start, end + 1))
+        else:
+            years.add(int(value))
+    return sorted(years)
+
+def parse_args():
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description="Korean Cancer Statistics Analysis (2020)")
+    parser.add_argument('--offline', action='store_true',
+                        help="serve API responses only from the local HTTP cache")
+    parser.add_argument('--no-cache', action='store_true',
+                        help="disable the on-disk HTTP response cache")
+    parser.add_argument('--max-retries', type=int, default=3, metavar='N',
+                        help="retry each API request up to N times on 5xx/429 and connection errors "
+                             "(exponential backoff with jitter, honours Retry-After; default: 3)")
+    parser.add_argument('--years', nargs='+', metavar='YEAR',
+                        help="collect and analyze several years, e.g. --years 2016-2020 "
+                             "(stored in data/dataset as year partitions)")
+    parser.add_argument('--extract', metavar='CSV',
+                        help="aggregate a case-level registry extract (one row per case) "
+                             "instead of calling the API")
+    parser.add_argument('--chart-workers', type=int, default=1, metavar='N',
+                        help="render charts in N worker processes (default: 1, serial)")
+    parser.add_argument('--chart-profiles', nargs='+', default=list(DEFAULT_PROFILES), metavar='PROFILE',
+                        help="output profiles for every chart image: "
+                             f"{', '.join(OUTPUT_PROFILES)} (default: print = 300dpi PNG)")
+    parser.add_argument('--chart-profile', action='append', default=[], metavar='CHART=PROFILE[,PROFILE]',
+                        help="output profiles for one chart, e.g. regional_distribution=web,thumbnail "
+                             "(repeatable, overrides --chart-profiles)")
+    parser.add_argument('--cohort-reports', action='store_true',
+                        help="also write a report for every region x year x cancer type cohort to "
+                             "reports/cohorts as JSON Lines, Markdown and CSV (needs --extract)")
+    parser.add_argument('--chart-sets', action='store_true',
+                        help="also render the four charts for every region and cancer type into "
+                             "charts/sets (needs --extract)")
+    parser.add_argument('--chart-set-dpi', type=int, default=100, metavar='DPI',
+                        help="resolution of the chart set images (default: 100)")
+    parser.add_argument('--dashboard-js', choices=['inline', 'shared', 'cdn'], default='inline',
+                        help="embed plotly.js in the dashboard (default), share one charts/plotly.min.js, "
+                             "or load it from the plotly CDN")
+    parser.add_argument('--compress', choices=list(COMPRESSION_SUFFIXES),
+                        help="compress the analysis reports (reports/*.json.gz etc.); data/ CSVs stay "
+                             "uncompressed because later steps read them")
+    parser.add_argument('--only', nargs='+', choices=['collect', 'analyze', 'visualize'],
+                        default=['collect', 'analyze', 'visualize'],
+                        help="run only the given steps (other steps' libraries are not imported)")
+    parser.add_argument('--import-times', action='store_true',
+                        help="print how long each lazily imported library took to load")
+    parser.add_argument('--force', action='store_true',
+                        help="re-run every stage even if its inputs are unchanged")
+    parser.add_argument('--trace', metavar='JSON',
+                        help="record wall/CPU time, RSS and I/O bytes of every collector, analyzer "
+                             "and visualizer method to a Chrome trace file (open in ui.perfetto.dev)")
+    parser.add_argument('--profile', metavar='DIR',
+                        help="write a cProfile dump (<stage>.prof) for every stage that runs")
+    parser.add_argument('--serve', metavar='[HOST:]PORT',
+                        help="load the data once and serve the analyses as a JSON HTTP service "
+                             "instead of running the pipeline (honours --years and --extract)")
+    parser.add_argument('--serve-workers', type=int, default=4, metavar='N',
+                        help="worker pool size for query aggregations (default: 4)")
+    parser.add_argument('--serve-executor', choices=['thread', 'process'], default='thread',
+                        help="run aggregations in threads sharing one analyzer, or in processes "
+                             "that each load the data (default: thread)")
+    parser.add_argument('--serve-cache', type=int, default=256, metavar='N',
+                        help="number of query responses kept in the service cache (0 disables)")
+    args = parser.parse_args()
+    try:
+        args.years = parse_years(args.years) if args.years else None
+    except ValueError as e:
+        parser.error(f"argument --years: {e}")
+    if args.years and 'collect' in args.only and not args.extract and not args.serve:
+        try:
+            CancerDataCollector.check_years(args.years)
+        except ValueError as e:
+            parser.error(f"argument --years: {e}")
+    args.output_profiles = parse_output_profiles(parser, args)
+    try:
+        check_compression(args.compress)
+    except ImportError as e:
+        parser.error(str(e))
+    return args
+
+def parse_output_profiles(parser, args):
+    """--chart-profiles/--chart-profile -> 시각화 모듈의 output_profiles (차트별 설정이 없으면 목록 그대로)"""
+    chart_files = [Path(CHART_TASKS[method_name][1]).stem for _, method_name, _ in CHART_STAGES
+                   if CHART_TASKS[method_name][1].endswith('.png')]
+    names = list(args.chart_profiles)
+    per_chart = {}
+    for value in args.chart_profile:
+        chart, _, profiles = value.partition('=')
+        if chart not in chart_files or not profiles:
+            parser.error(f"--chart-profile expects CHART=PROFILE[,PROFILE] with CHART one of {', '.join(chart_files)}")
+        per_chart[chart] = profiles.split(',')
+        names += per_chart[chart]
+    unknown = sorted(set(names) - set(OUTPUT_PROFILES))
+    if unknown:
+        parser.error(f"unknown output profile: {', '.join(unknown)} (choose from {', '.join(OUTPUT_PROFILES)})")
+    if not per_chart:
+        return args.chart_profiles
+    return {chart: per_chart.get(chart, args.chart_profiles) for chart in chart_files}
+
+DATA_DIR = Path('data')
+CSV_FILES = [DATA_DIR / name for name in
+             ('cancer_by_type_gender.csv', 'cancer_by_age.csv', 'cancer_by_region.csv')]
+
+def run_collection(args, pipeline):
+    """
+    1단계: 데이터 수집 (원격 데이터는 해시할 수 없으므로 항상 실행)
+    수집한 CancerDataset과 케이스 단위 큐브(--extract일 때만, 아니면 None) 반환
+    """
+    print("=" * 60)
+    print("Step 1: Data Collection")
+    print("=" * 60)
+    collector = CancerDataCollector(cache_dir=None if args.no_cache else '.cache/http',
+                                    offline=args.offline, max_retries=args.max_retries)
+    
+    collected = {}
+    
+    def collect():
+        if args.extract:
+            collected['dataset'] = collector.save_data_from_extract(args.extract)
+            collected['cube'] = collector.cube
+            return
+        if args.years:
+            # 마지막 연도는 이미 수집했으므로 그 테이블로 data/ CSV를 씀 (다시 요청하지 않음)
+            tables = collector.save_dataset(args.years)[args.years[-1]]
+            collected['dataset'] = collector.save_data(year=args.years[-1], tables=tables)
+        else:
+            collected['dataset'] = collector.save_data(year=2020)
+    
+    pipeline.run(Stage('collect', collect, outputs=CSV_FILES, always_run=True))
+    return collected.get('dataset'), collected.get('cube')
+
+def run_analysis(args, pipeline, dataset, cube=None):
+    """2단계: 데이터 분석 (수집한 데이터가 있으면 디스크를 다시 읽지 않고 사용)"""
+    print("\n" + "=" * 60)
+    print("Step 2: Data Analysis")
+    print("=" * 60)
+    analyzer = CancerDataAnalyzer(dataset=dataset, compression=args.compress)
+    report_paths = analyzer.report_paths()
+    report_path = report_paths[0]
+    if args.years:
+        analysis_inputs = sorted(DATA_DIR.glob('dataset/*/*/part-0.parquet'))
+    else:
+        analysis_inputs = list(CSV_FILES)
+    
+    def analyze():
+        # 추출본의 큐브에는 연도 차원이 있으므로 분석 연도와 발생률의 인년이 추출본의 연도를 따름
+        loaded = analyzer.load_cube(cube) if cube is not None else analyzer.load_data(years=args.years)
+        if loaded:
+            analyzer.generate_summary_report()
+    
+    if not pipeline.run(Stage('analyze', analyze,
+                              inputs=analysis_inputs + [DATA_DIR / 'population.csv'],
+                              outputs=report_paths,
+                              params={'years': args.years, 'compress': args.compress,
+                                      'extract': args.extract})):
+        print("Inputs unchanged - reusing existing reports")
+    
+    if report_path.exists():
+        report = json.loads(read_output(report_path))
+        
+        # 분석 결과 요약 출력
+        print("\nAnalysis Summary:")
+        print(f"  - Total cancer cases: {report['분석_개요']['총_암_발생_건수']:,}")
+        print(f"  - Male ratio: {report['성별_분석']['남성_비율']}")
+        print(f"  - Female ratio: {report['성별_분석']['여성_비율']}")
+        print(f"  - Top cancer type: {report['상위_암종']['1위']}")
+    
+    if args.cohort_reports:
+        run_cohort_reports(args, pipeline, cube)
+
+def run_cohort_reports(args, pipeline, cube):
+    """지역 × 연도 × 암종 코호트별 보고서 (케이스 단위 큐브가 필요하므로 --extract로 수집한 경우만)"""
+    if cube is None:
+        print("WARNING: --cohort-reports needs case-level data (--extract) collected in this run")
+        return
+    from cohort_reports import REPORT_FORMATS, CohortReportEngine, cohort_table
+    from population import get_population_table
+    
+    root = Path('reports/cohorts')
+    suffix = COMPRESSION_SUFFIXES.get(args.compress, '')
+    
+    def render():
+        start = time.perf_counter()
+        table = cohort_table(cube, get_population_table())
+        CohortReportEngine().write(table, root, compression=args.compress)
+        print(f"Wrote {len(table):,} cohort reports ({', '.join(REPORT_FORMATS)}) to {root} "
+              f"in {time.perf_counter() - start:.2f}s")
+    
+    pipeline.run(Stage('report:cohorts', render,
+                       inputs=[Path(args.extract), DATA_DIR / 'population.csv'],
+                       outputs=[root / f"cohort_reports.{fmt}{suffix}" for fmt in REPORT_FORMATS],
+                       params={'compress': args.compress}))
+
+def run_visualization(args, pipeline, dataset, cube=None):
+    """3단계: 시각화 (입력 CSV가 바뀐 차트만 다시 생성)"""
+    print("\n" + "=" * 60)
+    print("Step 3: Visualization")
+    print("=" * 60)
+    # 차트도 보고서와 같은 기간을 그림: --years는 data/dataset의 기간 합계, 추출본은 큐브의 연도
+    if cube is not None:
+        years = sorted(cube.labels['연도']) if '연도' in cube.dims else None
+    else:
+        years = args.years
+        if years:
+            dataset = None
+    visualizer = CancerDataVisualizer(dataset=dataset, dashboard_js=args.dashboard_js,
+                                      output_profiles=args.output_profiles, years=years)
+    stage_methods = {name: method_name for name, method_name, _ in CHART_STAGES}
+    
+    def render(stages):
+        if not visualizer.load_data():
+            return {}
+        results = visualizer.render_charts([stage_methods[stage.name] for stage in stages],
+                                           workers=args.chart_workers)
+        for method_name, (_, error) in results.items():
+            if error:
+                print(f"WARNING: {method_name} failed:\n{error}")
+        return {stage.name: results[stage_methods[stage.name]] for stage in stages}
+    
+    def data_inputs(inputs):
+        if dataset is None and years:
+            partitions = sorted(DATA_DIR.glob('dataset/*/*/part-0.parquet'))
+            return partitions + [DATA_DIR / f for f in inputs if not f.endswith('.csv')]
+        return [DATA_DIR / f for f in inputs]
+    
+    chart_stages = [
+        Stage(name, None,
+              inputs=data_inputs(inputs),
+              outputs=visualizer.chart_outputs(method_name),
+              params=dict({'dashboard_js': args.dashboard_js}
+                          if method_name == 'create_interactive_dashboard'
+                          else {'profiles': visualizer.chart_profiles(CHART_TASKS[method_name][1])},
+                          years=years))
+        for name, method_name, inputs in CHART_STAGES
+    ]
+    pipeline.run_batch(chart_stages, render, name='visualize')
+    
+    if args.chart_sets:
+        run_chart_sets(args, pipeline, cube)
+
+def run_chart_sets(args, pipeline, cube):
+    """지역별/암종별 차트 세트 (케이스 단위 큐브가 필요하므로 --extract로 수집한 경우만)"""
+    if cube is None:
+        print("WARNING: --chart-sets needs case-level data (--extract) collected in this run")
+        return
+    from chart_batch import chart_set_jobs, render_chart_sets
+    
+    root = Path('charts/sets')
+    
+    def render():
+        jobs = chart_set_jobs(cube)
+        start = time.perf_counter()
+        paths = render_chart_sets(jobs, root, workers=args.chart_workers, dpi=args.chart_set_dpi)
+        elapsed = time.perf_counter() - start
+        print(f"Rendered {len(paths)} charts for {len(jobs)} sets in {elapsed:.1f}s "
+              f"({len(paths) / elapsed:.1f} charts/s)")
+    
+    pipeline.run(Stage('chart:sets', render,
+                       inputs=[Path(args.extract)],
+                       outputs=[root / 'index.json'],
+                       params={'dpi': args.chart_set_dpi}))
+
 def main():
     """메인 실행 함수"""
+    args = parse_args()
     print_banner()
     
+    if args.offline and args.no_cache:
+        print("--offline cannot be combined with --no-cache")
+        return
+    
     # 의존성 확인
     if not check_dependencies():
         return
     
+    if args.serve:
+        from query_service import serve
+        host, _, port = args.serve.rpartition(':')
+        serve(host or '127.0.0.1', int(port), years=args.years, extract=args.extract,
+              workers=args.serve_workers, executor=args.serve_executor, cache_size=args.serve_cache)
+        return
+    
     # API 키 확인 (없어도 샘플 데이터로 실행)
     api_key_available = check_api_key()
     if not api_key_available:
         print("Running with sample data...\n")
     
     try:
-        # 1단계: 데이터 수집
-        print("=" * 60)
-        print("Step 1: Data Collection")
-        print("=" * 60)
-        collector = CancerDataCollector()
-        collector.save_data()
+        if args.trace:
+            tracer.enable()
+        pipeline = Pipeline(force=args.force, profile_dir=args.profile)
+        dataset = cube = None
         
-        # 2단계: 데이터 분석
-        print("\n" + "=" * 60)
-        print("Step 2: Data Analysis")
-        print("=" * 60)
-        analyzer = CancerDataAnalyzer()
-        if analyzer.load_data():
-            report = analyzer.generate_summary_report()
-            
-            # 분석 결과 요약 출력
-            print("\nAnalysis Summary:")
-            print(f"  - Total cancer cases: {report['분석_개요']['총_암_발생_건수']:,}")
-            print(f"  - Male ratio: {report['성별_분석']['남성_비율']}")
-            print(f"  - Female ratio: {report['성별_분석']['여성_비율']}")
-            print(f"  - Top cancer type: {report['상위_암종']['1위']}")
+        if 'collect' in args.only:
+            dataset, cube = run_collection(args, pipeline)
+        if 'analyze' in args.only:
+            run_analysis(args, pipeline, dataset, cube)
+        if 'visualize' in args.only:
+            run_visualization(args, pipeline, dataset, cube)
         
-        # 3단계: 시각화
-        print("\n" + "=" * 60)
-        print("Step 3: Visualization")
-        print("=" * 60)
-        visualizer = CancerDataVisualizer()
-        visualizer.generate_all_charts()
+        print()
+        pipeline.print_summary()
+        if args.import_times:
+            print()
+            print_import_times()
         
         # 완료 메시지
         print("\n" + "=" * 60)
@@ -138,6 +561,12 @@ def main():
     except Exception as e:
         print(f"Error occurred: {e}")
         print("Please report issues to GitHub Issues if problem persists")
+    finally:
+        # 실패한 실행도 어디까지 진행됐는지 볼 수 있도록 트레이스는 항상 저장
+        if args.trace:
+            tracer.save(args.trace)
+            print(f"\nSlowest methods (trace written to {args.trace}):")
+            tracer.print_summary(limit=10)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
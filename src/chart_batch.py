@@ -0,0 +1,362 @@
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+import json
+import math
+import os
+from pathlib import Path
+
+from lazy_import import lazy_import
+from chart_output import OutputProfile, output_paths, save_figure
+from population import get_population_table
+from visualizer import plt
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+# 차트 세트의 출력 파일 (전국 차트와 같은 이름)
+CHART_SET_FILES = {
+    'cancer_type': 'cancer_by_type.png',
+    'gender': 'gender_distribution.png',
+    'age': 'age_distribution.png',
+    'regional': 'regional_distribution.png'
+}
+
+# 세트를 나누는 차원 -> 출력 하위 폴더
+SET_DIRS = {'지역': 'by_region', '암종': 'by_cancer', '연도': 'by_year'}
+
+PALETTE = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FFEAA7', '#DDA0DD', '#98D8E8', '#F7DC6F']
+MUTED = '#C9CED6'
+HIGHLIGHT = '#D62728'
+
+class ChartSetJob:
+    """
+    차트 세트 하나 (예: 지역=서울특별시)
+    subset: 해당 레이블만 집계한 CancerDataset, national: 전국 CancerDataset
+    세트를 나눈 차원의 차트(지역 세트의 지역별 차트 등)는 전국 데이터에서 해당 막대를 강조해 그림
+    """
+    
+    def __init__(self, dim, label, subset, national, years):
+        self.dim = dim
+        self.label = label
+        self.subset = subset
+        self.national = national
+        self.years = years
+    
+    def output_dir(self, root):
+        return Path(root) / SET_DIRS.get(self.dim, self.dim) / str(self.label)
+
+def chart_set_jobs(cube, by=('지역', '암종')):
+    """케이스 단위 큐브에서 by 차원의 레이블마다 차트 세트 작업 생성"""
+    national = cube.to_dataset()
+    years = cube.labels['연도'] if '연도' in cube.dims else [2020]
+    return [ChartSetJob(dim, label, cube.where({dim: label}).to_dataset(), national, years)
+            for dim in by for label in cube.labels[dim]]
+
+def _bar_labels(ax, bars, texts, horizontal=False):
+    """막대 끝의 값 표시를 막대 높이/너비에 맞춰 이동"""
+    for bar, text in zip(bars, texts):
+        if horizontal:
+            value = bar.get_width()
+            text.set_position((value, bar.get_y() + bar.get_height() / 2))
+        else:
+            value = bar.get_height()
+            text.set_position((bar.get_x() + bar.get_width() / 2, value))
+        text.set_text(f'{int(value):,}')
+
+def _fit_limits(ax, values, horizontal=False):
+    top = max(float(np.max(values)), 1.0) * 1.15
+    if horizontal:
+        ax.set_xlim(0, top)
+    else:
+        ax.set_ylim(0, top)
+
+class CancerTypeChart:
+    """주요 암종별 발생 건수 + 성별 비교 (상위 8개 암종)"""
+    
+    def __init__(self, job):
+        top, highlight = self._data(job)
+        self.size = len(top)
+        self.fig, (self.ax1, self.ax2) = plt.subplots(1, 2, figsize=(16, 8))
+        x = np.arange(self.size)
+        width = 0.35
+        
+        self.total_bars = self.ax1.bar(x, top['총계'], color=PALETTE[:self.size])
+        self.total_texts = [self.ax1.text(0, 0, '', ha='center', va='bottom', fontsize=10)
+                            for _ in range(self.size)]
+        self.ax1.set_xlabel('암종')
+        self.ax1.set_ylabel('발생 건수')
+        self.ax1.set_xticks(x)
+        
+        self.male_bars = self.ax2.bar(x - width / 2, top['남성'], width, label='남성', color='#4A90E2')
+        self.female_bars = self.ax2.bar(x + width / 2, top['여성'], width, label='여성', color='#E24A90')
+        self.ax2.set_title('암종별 성별 발생 현황', fontsize=14, fontweight='bold')
+        self.ax2.set_xlabel('암종')
+        self.ax2.set_ylabel('발생 건수')
+        self.ax2.set_xticks(x)
+        self.ax2.legend()
+        self.update(job, (top, highlight))
+        self.fig.tight_layout()
+    
+    @staticmethod
+    def _data(job):
+        """(상위 암종 표, 강조할 위치 또는 None)"""
+        if job.dim != '암종':
+            return job.subset.rankings()['cancer_data'].top_n('총계', 8), None
+        top = job.national.rankings()['cancer_data'].top_n('총계', 8)
+        if job.label not in top['암종'].values:
+            focus = job.national.cancer_data[job.national.cancer_data['암종'] == job.label]
+            top = pd.concat([top.iloc[:7], focus])
+        return top, top['암종'].tolist().index(job.label)
+    
+    def fits(self, job):
+        return len(self._data(job)[0]) == self.size
+    
+    def update(self, job, data=None):
+        top, highlight = data or self._data(job)
+        for i, bar in enumerate(self.total_bars):
+            bar.set_height(top['총계'].iat[i])
+            if highlight is None:
+                bar.set_color(PALETTE[i % len(PALETTE)])
+            else:
+                bar.set_color(HIGHLIGHT if i == highlight else MUTED)
+        for bar, value in zip(self.male_bars, top['남성']):
+            bar.set_height(value)
+        for bar, value in zip(self.female_bars, top['여성']):
+            bar.set_height(value)
+        _bar_labels(self.ax1, self.total_bars, self.total_texts)
+        _fit_limits(self.ax1, top['총계'])
+        _fit_limits(self.ax2, np.concatenate([top['남성'], top['여성']]))
+        
+        self.ax1.set_xticklabels(top['암종'], rotation=45, ha='right')
+        self.ax2.set_xticklabels(top['암종'], rotation=45, ha='right')
+        self.ax1.set_title(f'주요 암종별 발생 건수 ({job.label})', fontsize=14, fontweight='bold')
+
+class GenderChart:
+    """성별 분포 파이 차트 (조각 각도와 글자 위치를 직접 갱신)"""
+    
+    EXPLODE = 0.05
+    
+    def __init__(self, job):
+        self.fig, self.ax = plt.subplots(figsize=(10, 8))
+        sizes = self._data(job)
+        self.wedges, self.texts, self.autotexts = self.ax.pie(
+            sizes, labels=['남성', '여성'], colors=['#4A90E2', '#E24A90'], autopct='%1.1f%%',
+            startangle=90, explode=(self.EXPLODE, self.EXPLODE))
+        for autotext in self.autotexts:
+            autotext.set_color('white')
+            autotext.set_fontsize(12)
+            autotext.set_fontweight('bold')
+        for text in self.texts:
+            text.set_fontsize(14)
+            text.set_fontweight('bold')
+        self.legend = self.ax.legend(self.wedges, ['', ''], loc="center left", bbox_to_anchor=(1, 0, 0.5, 1))
+        self.update(job)
+    
+    @staticmethod
+    def _data(job):
+        data = job.subset.cancer_data
+        return [int(data['남성'].sum()), int(data['여성'].sum())]
+    
+    def fits(self, job):
+        return True
+    
+    def update(self, job):
+        sizes = self._data(job)
+        total = sum(sizes) or 1
+        theta1 = 90.0
+        for wedge, text, autotext, size in zip(self.wedges, self.texts, self.autotexts, sizes):
+            theta2 = theta1 + size / total * 360
+            middle = math.radians((theta1 + theta2) / 2)
+            dx, dy = math.cos(middle), math.sin(middle)
+            center = (self.EXPLODE * dx, self.EXPLODE * dy)
+            wedge.set_center(center)
+            wedge.set_theta1(theta1)
+            wedge.set_theta2(theta2)
+            # ax.pie 기본값: labeldistance=1.1, pctdistance=0.6
+            text.set_position((center[0] + 1.1 * dx, center[1] + 1.1 * dy))
+            text.set_horizontalalignment('left' if dx > 0 else 'right')
+            autotext.set_position((center[0] + 0.6 * dx, center[1] + 0.6 * dy))
+            autotext.set_text(f'{size / total * 100:.1f}%')
+            theta1 = theta2
+        for legend_text, label, size in zip(self.legend.get_texts(), ['남성', '여성'], sizes):
+            legend_text.set_text(f'{label}: {size:,}명')
+        self.ax.set_title(f'{job.label} 암 발생 성별 분포', fontsize=16, fontweight='bold', pad=20)
+
+class AgeChart:
+    """연령대별 발생 건수 + 누적 발생 건수"""
+    
+    def __init__(self, job):
+        ages = job.subset.age_data
+        self.size = len(ages)
+        self.fig, (self.ax1, self.ax2) = plt.subplots(2, 1, figsize=(12, 10))
+        
+        self.bars = self.ax1.bar(ages['연령대'], ages['발생수'], color=plt.cm.viridis(range(self.size)))
+        self.texts = [self.ax1.text(0, 0, '', ha='center', va='bottom', fontsize=9)
+                      for _ in range(self.size)]
+        self.ax1.set_xlabel('연령대')
+        self.ax1.set_ylabel('발생 건수')
+        self.ax1.tick_params(axis='x', rotation=45)
+        
+        cumulative = ages['발생수'].cumsum()
+        self.line, = self.ax2.plot(ages['연령대'], cumulative, marker='o', linewidth=3,
+                                   markersize=8, color='#FF6B6B')
+        self.fill = self.ax2.fill_between(np.arange(self.size), cumulative, alpha=0.3, color='#FF6B6B')
+        self.ax2.set_title('연령대별 누적 발생 건수', fontsize=14, fontweight='bold')
+        self.ax2.set_xlabel('연령대')
+        self.ax2.set_ylabel('누적 발생 건수')
+        self.ax2.tick_params(axis='x', rotation=45)
+        self.ax2.grid(True, alpha=0.3)
+        self.update(job)
+        self.fig.tight_layout()
+    
+    def fits(self, job):
+        return len(job.subset.age_data) == self.size
+    
+    def update(self, job):
+        counts = job.subset.age_data['발생수'].to_numpy()
+        for bar, value in zip(self.bars, counts):
+            bar.set_height(value)
+        _bar_labels(self.ax1, self.bars, self.texts)
+        _fit_limits(self.ax1, counts)
+        
+        cumulative = counts.cumsum()
+        x = np.arange(self.size)
+        self.line.set_ydata(cumulative)
+        self.fill.set_verts([np.column_stack([np.concatenate([x, x[::-1]]),
+                                              np.concatenate([cumulative, np.zeros(self.size)])])])
+        _fit_limits(self.ax2, cumulative)
+        self.ax1.set_title(f'연령대별 암 발생 건수 ({job.label})', fontsize=14, fontweight='bold')
+
+class RegionalChart:
+    """지역별 발생 건수 + 인구 10만명당 발생률 (가로 막대, 값 순서로 정렬)"""
+    
+    def __init__(self, job):
+        regions = self._data(job)[0]
+        self.size = len(regions)
+        self.fig, (self.ax1, self.ax2) = plt.subplots(2, 1, figsize=(14, 12))
+        y = np.arange(self.size)
+        self.count_bars = self.ax1.barh(y, np.zeros(self.size), color='lightcoral')
+        self.rate_bars = self.ax2.barh(y, np.zeros(self.size), color='lightblue')
+        self.ax1.set_yticks(y)
+        self.ax2.set_yticks(y)
+        self.ax1.set_xlabel('발생 건수')
+        self.ax2.set_title('지역별 인구 10만명당 암 발생률', fontsize=14, fontweight='bold')
+        self.ax2.set_xlabel('인구 10만명당 발생률')
+        self.update(job)
+        self.fig.tight_layout()
+    
+    @staticmethod
+    def _data(job):
+        """(지역별 표, 강조할 지역 또는 None) - 지역 세트는 전국 데이터에서 해당 지역을 강조"""
+        source, focus = (job.national, job.label) if job.dim == '지역' else (job.subset, None)
+        regions = source.regional_data.copy()
+        person_years = get_population_table().lookup(regions['지역'], job.years)
+        regions['인구10만명당발생률'] = (regions['발생수'] / person_years * 100000).round(1)
+        return regions, focus
+    
+    def fits(self, job):
+        return len(self._data(job)[0]) == self.size
+    
+    def update(self, job):
+        regions, focus = self._data(job)
+        for ax, bars, column, color in ((self.ax1, self.count_bars, '발생수', 'lightcoral'),
+                                        (self.ax2, self.rate_bars, '인구10만명당발생률', 'lightblue')):
+            ordered = regions.sort_values(column, ascending=True)
+            values = ordered[column].fillna(0).to_numpy()
+            for bar, value, region in zip(bars, values, ordered['지역']):
+                bar.set_width(value)
+                bar.set_color(HIGHLIGHT if region == focus else color)
+            ax.set_yticklabels(ordered['지역'])
+            _fit_limits(ax, values, horizontal=True)
+        self.ax1.set_title(f'지역별 암 발생 건수 ({job.label})', fontsize=14, fontweight='bold')
+
+CHART_CLASSES = {
+    'cancer_type': CancerTypeChart,
+    'gender': GenderChart,
+    'age': AgeChart,
+    'regional': RegionalChart
+}
+
+class ChartSetRenderer:
+    """
+    차트 세트 렌더러
+    reuse=True면 차트마다 Figure/Axes와 막대·선 같은 아티스트를 한 번만 만들고,
+    이후 세트는 set_height/set_width/set_ydata 등으로 값만 바꿔 저장 (막대 수가 다르면 다시 만듦)
+    여백은 Figure를 만들 때 tight_layout으로 한 번만 맞추고, 저장할 때는 bbox_inches='tight'
+    (저장마다 그리기를 한 번 더 함)를 쓰지 않음 - tight=True면 전국 차트처럼 매번 맞춤
+    profiles: chart_output 저장 설정 목록 (주면 dpi, tight 대신 사용, 한 번 그린 Figure로 모두 저장)
+    """
+    
+    def __init__(self, dpi=100, reuse=True, tight=False, profiles=None):
+        self.reuse = reuse
+        self.profiles = profiles or [OutputProfile('set', dpi, ('png',), tight=tight)]
+        self._charts = {}
+    
+    def render(self, job, root):
+        """세트의 차트 4개를 저장하고 경로 목록 반환"""
+        output_dir = job.output_dir(root)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        paths = []
+        for name, chart_class in CHART_CLASSES.items():
+            chart = self._charts.get(name)
+            if chart is not None and self.reuse and chart.fits(job):
+                chart.update(job)
+            else:
+                if chart is not None:
+                    plt.close(chart.fig)
+                chart = self._charts[name] = chart_class(job)
+            paths.extend(save_figure(chart.fig, output_dir / CHART_SET_FILES[name], self.profiles))
+        return paths
+    
+    def close(self):
+        for chart in self._charts.values():
+            plt.close(chart.fig)
+        self._charts = {}
+
+# 프로세스 워커마다 하나씩 두는 렌더러 (워커가 처리하는 세트끼리 Figure를 재사용)
+_worker_renderer = None
+
+def _init_worker(dpi, reuse, tight, profiles):
+    global _worker_renderer
+    import matplotlib
+    matplotlib.use('Agg')
+    _worker_renderer = ChartSetRenderer(dpi, reuse, tight, profiles)
+
+def _render_in_worker(job, root):
+    return _worker_renderer.render(job, root)
+
+def render_chart_sets(jobs, root='charts/sets', workers=1, dpi=100, reuse=True, tight=False, profiles=None):
+    """
+    차트 세트 일괄 렌더링 (workers가 2 이상이면 프로세스 풀에 나눠 실행)
+    저장한 파일 목록은 root/index.json에 기록하고 경로 목록 반환
+    """
+    root = Path(root)
+    profiles = profiles or [OutputProfile('set', dpi, ('png',), tight=tight)]
+    paths = []
+    if workers <= 1:
+        renderer = ChartSetRenderer(dpi, reuse, tight, profiles)
+        try:
+            for job in jobs:
+                paths.extend(renderer.render(job, root))
+        finally:
+            renderer.close()
+    else:
+        # 워커마다 연속된 세트 묶음을 맡겨 Figure 재사용 효과를 유지
+        chunksize = max(1, len(jobs) // (workers * 4))
+        with ProcessPoolExecutor(workers, initializer=_init_worker,
+                                 initargs=(dpi, reuse, tight, profiles)) as executor:
+            for job_paths in executor.map(_render_in_worker, jobs, repeat(root), chunksize=chunksize):
+                paths.extend(job_paths)
+    
+    index = {
+        'sets': [{'dim': job.dim, 'label': str(job.label),
+                  'charts': [str(path) for name in CHART_SET_FILES.values()
+                             for path in output_paths(job.output_dir(root) / name, profiles)]}
+                 for job in jobs]
+    }
+    root.mkdir(parents=True, exist_ok=True)
+    tmp_path = root / 'index.json.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, root / 'index.json')
+    return paths
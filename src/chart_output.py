@@ -0,0 +1,139 @@
+import io
+from pathlib import Path
+
+from lazy_import import lazy_import
+
+Image = lazy_import('PIL.Image')
+np = lazy_import('numpy')
+backend_agg = lazy_import('matplotlib.backends.backend_agg')
+
+RASTER_FORMATS = ('png', 'webp')
+VECTOR_FORMATS = ('svg', 'pdf')
+
+class OutputProfile:
+    """
+    차트 저장 설정
+    dpi: 래스터 해상도, formats: 'png', 'webp', 'svg', 'pdf' 중 여러 개
+    tight: 여백을 잘라내는 tight bbox 계산 여부, suffix: 파일 이름 뒤에 붙는 문자열
+    """
+    
+    def __init__(self, name, dpi, formats, tight=True, suffix=''):
+        unknown = set(formats) - set(RASTER_FORMATS + VECTOR_FORMATS)
+        if unknown:
+            raise ValueError(f"unsupported chart formats: {', '.join(sorted(unknown))}")
+        self.name = name
+        self.dpi = dpi
+        self.formats = tuple(formats)
+        self.tight = tight
+        self.suffix = suffix
+    
+    def paths(self, path):
+        """path(확장자 무시)에 대한 이 설정의 출력 파일 목록"""
+        path = Path(path)
+        return [path.with_name(f"{path.stem}{self.suffix}.{fmt}") for fmt in self.formats]
+    
+    def __repr__(self):
+        return f"OutputProfile({self.name!r}, dpi={self.dpi}, formats={self.formats}, tight={self.tight})"
+
+# 기본 제공 설정 (print는 기존 차트와 같은 300dpi PNG)
+OUTPUT_PROFILES = {
+    'print': OutputProfile('print', 300, ('png',)),
+    'web': OutputProfile('web', 100, ('png', 'webp'), suffix='_web'),
+    'thumbnail': OutputProfile('thumbnail', 40, ('webp',), tight=False, suffix='_thumb'),
+    'vector': OutputProfile('vector', 300, ('svg', 'pdf')),
+}
+
+DEFAULT_PROFILES = ('print',)
+
+def resolve_profiles(profiles):
+    """설정 이름 또는 OutputProfile 목록을 OutputProfile 목록으로 변환"""
+    resolved = []
+    for profile in profiles:
+        if isinstance(profile, str):
+            if profile not in OUTPUT_PROFILES:
+                raise ValueError(f"unknown output profile: {profile} (choose from {', '.join(OUTPUT_PROFILES)})")
+            profile = OUTPUT_PROFILES[profile]
+        resolved.append(profile)
+    return resolved
+
+def output_paths(path, profiles):
+    return [p for profile in resolve_profiles(profiles) for p in profile.paths(path)]
+
+def _raster_formats(profile):
+    return [fmt for fmt in profile.formats if fmt in RASTER_FORMATS]
+
+def _encode(image, path, fmt, dpi):
+    if fmt == 'png':
+        image.save(path, format='PNG', dpi=(dpi, dpi))
+    else:
+        image.save(path, format='WEBP', quality=90, method=4)
+
+def _render_rgba(fig, dpi, bbox_inches, pad_inches):
+    """
+    Agg 캔버스로 한 번 그린 RGBA 이미지 (크기는 추정하지 않고 렌더러 버퍼에서 읽음)
+    bbox_inches='tight'면 matplotlib이 이 dpi에서 bbox를 계산하므로 같은 dpi의 단일 savefig와 픽셀이 같음
+    """
+    original = fig.canvas
+    canvas = backend_agg.FigureCanvasAgg(fig)
+    try:
+        fig.savefig(io.BytesIO(), format='rgba', dpi=dpi, bbox_inches=bbox_inches, pad_inches=pad_inches)
+        return Image.fromarray(np.array(canvas.buffer_rgba()))
+    finally:
+        fig.set_canvas(original)
+
+def save_figure(fig, path, profiles=DEFAULT_PROFILES, pad_inches=0.1):
+    """
+    Figure를 여러 출력 설정으로 저장하고 저장한 파일 목록 반환
+    래스터 출력은 tight 여부별로 가장 높은 dpi로 한 번만 그린 뒤 낮은 dpi는 축소해 인코딩,
+    벡터 형식은 형식마다 한 번씩 그림 - 벡터의 tight bbox는 여러 번 필요할 때만 미리 한 번 계산
+    """
+    profiles = resolve_profiles(profiles)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    
+    raster_groups = {}
+    for profile in profiles:
+        if _raster_formats(profile):
+            raster_groups.setdefault(profile.tight, []).append(profile)
+    tight_vectors = sum(len(profile.formats) - len(_raster_formats(profile))
+                        for profile in profiles if profile.tight)
+    
+    # 벡터 형식 하나만 tight로 저장하면 bbox 계산도 matplotlib에 맡김
+    bbox = 'tight'
+    if tight_vectors > 1:
+        fig.draw_without_rendering()
+        bbox = fig.get_tightbbox().padded(pad_inches)
+    
+    saved = []
+    for tight, group in raster_groups.items():
+        bbox_inches = 'tight' if tight else None
+        
+        if len(group) == 1 and len(_raster_formats(group[0])) == 1:
+            profile = group[0]
+            fmt = _raster_formats(profile)[0]
+            target = profile.paths(path)[profile.formats.index(fmt)]
+            fig.savefig(target, format=fmt, dpi=profile.dpi, bbox_inches=bbox_inches, pad_inches=pad_inches)
+            saved.append(target)
+            continue
+        
+        # 가장 높은 dpi로 한 번 그리고, 낮은 dpi는 실제 렌더링 크기에 dpi 비율을 곱한 크기로 축소
+        max_dpi = max(profile.dpi for profile in group)
+        rendered = _render_rgba(fig, max_dpi, bbox_inches, pad_inches)
+        
+        for profile in group:
+            image = rendered
+            if profile.dpi != max_dpi:
+                scale = profile.dpi / max_dpi
+                size = (max(1, round(rendered.width * scale)), max(1, round(rendered.height * scale)))
+                image = rendered.resize(size, Image.LANCZOS)
+            for fmt, target in zip(profile.formats, profile.paths(path)):
+                if fmt in RASTER_FORMATS:
+                    _encode(image, target, fmt, profile.dpi)
+                    saved.append(target)
+    
+    for profile in profiles:
+        for fmt, target in zip(profile.formats, profile.paths(path)):
+            if fmt in VECTOR_FORMATS:
+                fig.savefig(target, format=fmt, dpi=profile.dpi, bbox_inches=bbox if profile.tight else None)
+                saved.append(target)
+    return saved
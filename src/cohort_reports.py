@@ -0,0 +1,166 @@
+from string import Formatter
+
+from lazy_import import lazy_import
+from output_writer import OutputWriter
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+# 코호트를 나누는 차원 (보고서 한 건 = 이 차원 레이블 조합 하나)
+COHORT_DIMS = ('지역', '연도', '암종')
+
+# 코호트 결과표 컬럼 (JSON Lines/CSV 출력 순서)
+COHORT_COLUMNS = [
+    '지역', '연도', '암종', '발생수', '남성', '여성', '남성_비율', '여성_비율',
+    '인구10만명당발생률', '지역_내_순위', '지역_내_비율', '최고_위험_연령대', '최고_위험_연령대_발생수',
+]
+
+# 코호트별 Markdown 보고서 (str.format 문법, 필드는 COHORT_COLUMNS)
+MARKDOWN_TEMPLATE = """## {연도}년 {지역} {암종}
+
+- 발생 건수: {발생수:,}건 (지역 내 {지역_내_순위}위, {지역_내_비율:.1f}%)
+- 성별: 남성 {남성:,}건 ({남성_비율:.1f}%), 여성 {여성:,}건 ({여성_비율:.1f}%)
+- 인구 10만명당 발생률: {인구10만명당발생률:.2f}명
+- 최고 위험 연령대: {최고_위험_연령대} ({최고_위험_연령대_발생수:,}건)
+
+"""
+
+MARKDOWN_HEADER = "# 지역 × 연도 × 암종 코호트 보고서\n\n"
+
+REPORT_FORMATS = ('jsonl', 'md', 'csv')
+
+
+def cohort_table(cube, population=None, dims=COHORT_DIMS, min_cases=1):
+    """
+    케이스 단위 큐브에서 코호트(지역 × 연도 × 암종)별 결과표를 한 번에 계산
+    성별/연령대 주변합 배열 두 개에서 모든 코호트의 지표를 배열 연산으로 구하고, 발생 건수가 min_cases 미만인 코호트는 제외
+    population: PopulationTable (없으면 발생률은 NaN)
+    """
+    region_dim, year_dim, cancer_dim = dims
+    by_sex = cube.marginal(dims + ('성별',)).astype(np.int64)
+    by_age = cube.marginal(dims + ('연령대',))
+    sexes = cube.labels['성별']
+    
+    total = by_sex.sum(axis=-1)
+    male = by_sex[..., sexes.index('남성')] if '남성' in sexes else np.zeros_like(total)
+    female = by_sex[..., sexes.index('여성')] if '여성' in sexes else np.zeros_like(total)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        male_share = np.where(total > 0, male / total * 100, 0.0)
+        female_share = np.where(total > 0, female / total * 100, 0.0)
+        region_total = total.sum(axis=2, keepdims=True)
+        region_share = np.where(region_total > 0, total / region_total * 100, 0.0)
+    
+    # 지역·연도 안에서 암종 순위 (동률이면 레이블 순서가 앞선 암종 우선)
+    order = np.argsort(-total, axis=2, kind='stable')
+    rank = np.empty_like(order)
+    np.put_along_axis(rank, order, np.arange(1, total.shape[2] + 1).reshape(1, 1, -1), axis=2)
+    
+    top_age = by_age.argmax(axis=-1)
+    top_age_cases = np.take_along_axis(by_age, top_age[..., None], axis=-1)[..., 0]
+    
+    regions, years = cube.labels[region_dim], cube.labels[year_dim]
+    if population is not None:
+        people = np.stack([population.lookup(regions, int(year)) for year in years], axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            rate = total / people[:, :, None] * 100000
+    else:
+        rate = np.full(total.shape, np.nan)
+    
+    index = pd.MultiIndex.from_product([regions, years, cube.labels[cancer_dim]], names=list(dims))
+    table = pd.DataFrame({
+        '발생수': total.reshape(-1),
+        '남성': male.reshape(-1),
+        '여성': female.reshape(-1),
+        '남성_비율': male_share.reshape(-1).round(1),
+        '여성_비율': female_share.reshape(-1).round(1),
+        '인구10만명당발생률': rate.reshape(-1).round(2),
+        '지역_내_순위': rank.reshape(-1),
+        '지역_내_비율': region_share.reshape(-1).round(1),
+        '최고_위험_연령대': np.asarray(cube.labels['연령대'], dtype=object)[top_age.reshape(-1)],
+        '최고_위험_연령대_발생수': top_age_cases.reshape(-1).astype(np.int64),
+    }, index=index).reset_index()
+    table = table[table['발생수'] >= min_cases].reset_index(drop=True)
+    return table.rename(columns=dict(zip(dims, COHORT_DIMS)))[COHORT_COLUMNS]
+
+
+class CompiledTemplate:
+    """
+    str.format 템플릿을 한 번 파싱해 (리터럴, 필드, 형식) 조각으로 보관
+    render_batch는 필드마다 컬럼 전체를 한 번에 문자열로 바꾼 뒤 리터럴과 이어 붙여 여러 행을 한 번에 렌더링
+    """
+    
+    def __init__(self, text):
+        self.text = text
+        self.segments = []
+        for literal, field, spec, conversion in Formatter().parse(text):
+            if conversion:
+                raise ValueError(f"Template conversions are not supported: !{conversion}")
+            self.segments.append((literal, field, spec or ''))
+        self.fields = [field for _, field, _ in self.segments if field is not None]
+    
+    def render(self, row):
+        """한 행(dict) 렌더링"""
+        return self.text.format_map(row)
+    
+    @staticmethod
+    def _format_column(values, spec):
+        if not spec:
+            return values.astype(str)
+        return values.map(f"{{:{spec}}}".format)
+    
+    def render_batch(self, frame):
+        """DataFrame의 모든 행을 렌더링한 문자열 Series"""
+        rendered = pd.Series('', index=frame.index, dtype=object)
+        for literal, field, spec in self.segments:
+            if literal:
+                rendered = rendered + literal
+            if field is not None:
+                rendered = rendered + self._format_column(frame[field], spec)
+        return rendered
+
+
+class CohortReportEngine:
+    """
+    코호트 결과표를 batch_size행씩 JSON Lines, Markdown, CSV로 렌더링해 파일에 바로 기록
+    템플릿은 생성 시 한 번만 컴파일하고, 메모리에는 한 배치의 렌더링 결과만 둠
+    파일은 OutputWriter.stream으로 임시 파일에 쓴 뒤 원자적으로 교체 (manifest.json 갱신)
+    """
+    
+    def __init__(self, template=MARKDOWN_TEMPLATE, header=MARKDOWN_HEADER, batch_size=1000):
+        self.template = CompiledTemplate(template)
+        self.header = header
+        self.batch_size = batch_size
+    
+    def batches(self, table):
+        for start in range(0, len(table), self.batch_size):
+            yield table.iloc[start:start + self.batch_size]
+    
+    def write(self, table, root, name='cohort_reports', formats=REPORT_FORMATS, compression=None):
+        """root/name.<형식>에 보고서 기록, 형식 -> 파일 경로 반환"""
+        unknown = set(formats) - set(REPORT_FORMATS)
+        if unknown:
+            raise ValueError(f"Unknown report format: {', '.join(sorted(unknown))}")
+        missing = set(self.template.fields) - set(table.columns)
+        if missing:
+            raise ValueError(f"Template fields missing from the cohort table: {sorted(missing)}")
+        
+        writer = OutputWriter(root, compression=compression)
+        paths = {}
+        for fmt in formats:
+            filename = f"{name}.{fmt}"
+            with writer.stream(filename) as f:
+                if fmt == 'md':
+                    f.write(self.header.encode('utf-8'))
+                for i, batch in enumerate(self.batches(table)):
+                    f.write(self._render(batch, fmt, first=i == 0))
+            paths[fmt] = writer.output_path(filename)
+        writer.commit()
+        return paths
+    
+    def _render(self, batch, fmt, first):
+        if fmt == 'jsonl':
+            text = batch.to_json(orient='records', lines=True, force_ascii=False)
+            return (text if text.endswith('\n') else text + '\n').encode('utf-8')
+        if fmt == 'csv':
+            return batch.to_csv(index=False, header=first).encode('utf-8-sig' if first else 'utf-8')
+        return ''.join(self.template.render_batch(batch)).encode('utf-8')
@@ -0,0 +1,112 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+from lazy_import import lazy_import
+from schema import compact_frame
+
+pd = lazy_import('pandas')
+
+# 캐시 형식(또는 schema의 타입 규칙)이 바뀌면 올려서 기존 캐시를 다시 만들게 함
+CACHE_VERSION = 2
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ColumnarCache:
+    """
+    data/*.csv 옆(data/.columnar/)에 두는 Parquet 사본
+    처음 읽을 때 CSV를 파싱해 schema의 타입(반복되는 레이블은 범주형, 작은 정수)으로 바꿔 저장하고, 이후에는 사본을 읽음
+    원본 CSV의 크기/mtime이 기록과 같으면 그대로 사용, 다르면 내용 해시로 확인해 바뀐 경우만 다시 만듦
+    """
+    
+    def __init__(self, cache_dir):
+        self.cache_dir = Path(cache_dir)
+        self.counters = {'hits': 0, 'revalidated': 0, 'rebuilds': 0}
+        self._lock = threading.Lock()
+    
+    def _paths(self, source):
+        stem = Path(source).stem
+        return self.cache_dir / f"{stem}.parquet", self.cache_dir / f"{stem}.json"
+    
+    def _record(self, counter):
+        with self._lock:
+            self.counters[counter] += 1
+    
+    def stats(self):
+        with self._lock:
+            return dict(self.counters)
+    
+    def _read_meta(self, meta_path):
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+    
+    def _write_atomic(self, path, write):
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    
+    def _write_meta(self, meta_path, meta):
+        def write(tmp_path):
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2)
+        self._write_atomic(meta_path, write)
+    
+    def is_fresh(self, source, meta):
+        """
+        캐시 기록이 원본 CSV와 일치하는지 확인
+        크기/mtime이 같으면 해시를 계산하지 않고, 다르면(touch, 복사 등) 내용 해시로 판단
+        """
+        if meta is None or meta.get('version') != CACHE_VERSION:
+            return False
+        stat = os.stat(source)
+        if meta['size'] == stat.st_size and meta['mtime_ns'] == stat.st_mtime_ns:
+            return True
+        if meta['size'] != stat.st_size or meta['sha256'] != file_sha256(source):
+            return False
+        # 내용은 같으므로 새 mtime을 기록해 다음에는 해시 계산 생략
+        meta.update(mtime_ns=stat.st_mtime_ns)
+        self._write_meta(self._paths(source)[1], meta)
+        self._record('revalidated')
+        return True
+    
+    def read_csv(self, source, **read_options):
+        """원본 CSV 대신 최신 Parquet 사본을 읽음 (없거나 오래되면 CSV를 파싱해 사본 생성)"""
+        source = Path(source)
+        data_path, meta_path = self._paths(source)
+        meta = self._read_meta(meta_path)
+        if data_path.exists() and self.is_fresh(source, meta):
+            self._record('hits')
+            return pd.read_parquet(data_path)
+        
+        # 파싱 중에 원본이 바뀌어도 다음 실행에서 다시 만들도록 파싱 전 상태를 기록
+        stat = os.stat(source)
+        sha256 = file_sha256(source)
+        frame = compact_frame(pd.read_csv(source, **read_options))
+        
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            self._write_atomic(data_path, lambda tmp_path: frame.to_parquet(tmp_path, index=False))
+        except ImportError:
+            # Parquet 엔진(pyarrow)이 없으면 캐시 없이 CSV 결과만 반환
+            return frame
+        self._write_meta(meta_path, {
+            'version': CACHE_VERSION,
+            'source': source.name,
+            'size': stat.st_size,
+            'mtime_ns': stat.st_mtime_ns,
+            'sha256': sha256
+        })
+        self._record('rebuilds')
+        return frame
@@ -0,0 +1,122 @@
+from dataset import AGE_BANDS, REGIONS, SEXES, CancerDataset
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+# 케이스 단위 레코드의 기본 차원
+CASE_DIMS = ('연도', '암종', '성별', '연령대', '지역')
+
+# 차원별 표준 레이블 순서
+DEFAULT_LABELS = {'성별': SEXES, '연령대': AGE_BANDS, '지역': REGIONS}
+
+
+class CancerCube:
+    """
+    (연도, 암종, 성별, 연령대, 지역) 등 여러 차원에 대한 발생 건수 큐브
+    레코드를 NumPy 다차원 배열에 한 번에 집계하고, 주변합(marginal)은 한 번 계산한 뒤 재사용
+    """
+    
+    def __init__(self, dims, labels, counts):
+        self.dims = tuple(dims)
+        self.labels = {dim: list(labels[dim]) for dim in self.dims}
+        self.counts = counts
+        self._positions = {dim: {label: i for i, label in enumerate(self.labels[dim])}
+                           for dim in self.dims}
+        self._marginals = {}
+        
+    @classmethod
+    def from_records(cls, df, dims=CASE_DIMS, count_col=None, labels=None):
+        """
+        레코드로 큐브 생성
+        count_col이 없으면 한 행을 한 건(케이스 단위), 있으면 해당 컬럼을 건수로 합산(집계 테이블)
+        labels: 차원 -> 레이블 순서 (없는 레이블은 등장 순서대로 뒤에 추가)
+        """
+        labels = {**DEFAULT_LABELS, **(labels or {})}
+        dim_labels = {}
+        codes = []
+        valid = np.ones(len(df), dtype=bool)
+        for dim in dims:
+            # 해시 한 번으로 코드화한 뒤, 적은 수의 고유값만 표준 순서 위치로 변환
+            raw_codes, uniques = pd.factorize(df[dim])
+            order = list(labels.get(dim, []))
+            position = {label: i for i, label in enumerate(order)}
+            for value in uniques:
+                if value not in position:
+                    position[value] = len(order)
+                    order.append(value)
+            mapping = np.array([position[value] for value in uniques] + [-1], dtype=np.int64)
+            code = mapping[raw_codes]
+            valid &= code >= 0
+            dim_labels[dim] = order
+            codes.append(code)
+        
+        # 모든 차원의 코드를 하나의 평면 인덱스로 바꿔 bincount 한 번으로 집계
+        shape = tuple(len(dim_labels[dim]) for dim in dims)
+        flat = np.ravel_multi_index([code[valid] for code in codes], shape)
+        weights = None if count_col is None else df[count_col].to_numpy()[valid]
+        counts = np.bincount(flat, weights=weights, minlength=int(np.prod(shape)))
+        return cls(dims, dim_labels, np.rint(counts).astype(np.int64).reshape(shape))
+    
+    def where(self, filters):
+        """filters(차원 -> 레이블 또는 레이블 목록)로 잘라낸 부분 큐브"""
+        if not filters:
+            return self
+        counts = self.counts
+        labels = dict(self.labels)
+        for dim, wanted in filters.items():
+            if not isinstance(wanted, (list, tuple, set)):
+                wanted = [wanted]
+            axis = self.dims.index(dim)
+            counts = np.take(counts, [self._positions[dim][label] for label in wanted], axis=axis)
+            labels[dim] = wanted
+        return CancerCube(self.dims, labels, counts)
+    
+    def marginal(self, dims, filters=None):
+        """dims 차원만 남기고 나머지를 합산한 배열 (필터가 없으면 결과를 캐시)"""
+        dims = tuple(dims)
+        if filters:
+            return self.where(filters).marginal(dims)
+        if dims not in self._marginals:
+            other_axes = tuple(i for i, dim in enumerate(self.dims) if dim not in dims)
+            summed = self.counts.sum(axis=other_axes)
+            remaining = [dim for dim in self.dims if dim in dims]
+            self._marginals[dims] = np.transpose(summed, [remaining.index(dim) for dim in dims])
+        return self._marginals[dims]
+    
+    def total(self, filters=None):
+        """전체 건수"""
+        return int(self.marginal((), filters))
+    
+    def series(self, dim, filters=None):
+        """한 차원의 건수 (레이블 순서 유지)"""
+        cube = self.where(filters)
+        return pd.Series(cube.marginal((dim,)), index=pd.Index(cube.labels[dim], name=dim), name='발생수')
+    
+    def shares(self, dim, filters=None):
+        """한 차원의 구성비(%)"""
+        counts = self.series(dim, filters)
+        total = counts.sum()
+        return counts / total * 100 if total else counts.astype(float)
+    
+    def top_n(self, dim, n, filters=None):
+        """건수 상위 n개 (동률이면 레이블 순서가 앞선 것 우선, nlargest와 동일)"""
+        counts = self.series(dim, filters)
+        order = np.argsort(-counts.to_numpy(), kind='stable')[:n]
+        return counts.iloc[order]
+    
+    def to_dataset(self):
+        """암종별 성별, 연령대별, 지역별 주변합으로 collector와 같은 형식의 CancerDataset 생성"""
+        by_sex = self.marginal(('암종', '성별'))
+        cancer_data = pd.DataFrame({'암종': self.labels['암종']})
+        for sex in SEXES:
+            cancer_data[sex] = by_sex[:, self.labels['성별'].index(sex)]
+        cancer_data['총계'] = by_sex.sum(axis=1)
+        return CancerDataset(cancer_data, self.to_frame(('연령대',)), self.to_frame(('지역',)))
+    
+    def to_frame(self, dims, filters=None):
+        """dims 조합별 건수를 긴 형식 DataFrame으로 반환"""
+        cube = self.where(filters)
+        values = cube.marginal(dims)
+        index = pd.MultiIndex.from_product([cube.labels[dim] for dim in dims], names=list(dims))
+        return pd.DataFrame({'발생수': values.reshape(-1)}, index=index).reset_index()
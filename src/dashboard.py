@@ -0,0 +1,297 @@
+import base64
+import itertools
+import json
+import os
+from pathlib import Path
+from string import Template
+
+from dataset import CancerDataset
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+go = lazy_import('plotly.graph_objects')
+pio = lazy_import('plotly.io')
+plotly_offline = lazy_import('plotly.offline')
+plotly_subplots = lazy_import('plotly.subplots')
+
+# plotly.js 포함 방식: inline(파일마다 내장, 단독으로 열림), shared(출력 폴더에 하나만 저장), cdn
+PLOTLY_JS_MODES = ('inline', 'shared', 'cdn')
+SHARED_PLOTLY_JS = 'plotly.min.js'
+
+DEFAULT_TITLE = "2020년 한국 암 발생 통계 대시보드"
+
+HTML_TEMPLATE = Template("""<!DOCTYPE html>
+<html>
+<head><meta charset="utf-8" /><title>$title</title>$plotly_script</head>
+<body>
+<div id="dashboard" style="height:900px; width:100%;"></div>
+<script>Plotly.newPlot("dashboard", $data, $layout, {"responsive": true});</script>
+</body>
+</html>
+""")
+
+# 정수 배열을 담을 수 있는 가장 작은 타입 (plotly.js typed array 코드)
+_INT_DTYPES = [('i1', 'int8'), ('u1', 'uint8'), ('i2', 'int16'), ('u2', 'uint16'),
+               ('i4', 'int32'), ('u4', 'uint32')]
+
+def typed_array(values):
+    """숫자 배열을 plotly.js typed array 형식({dtype, bdata: base64})으로 변환 (JSON 숫자 목록보다 작음)"""
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu' and len(values):
+        low, high = values.min(), values.max()
+        for code, dtype in _INT_DTYPES:
+            info = np.iinfo(dtype)
+            if info.min <= low and high <= info.max:
+                return {'dtype': code, 'bdata': base64.b64encode(values.astype(dtype).tobytes()).decode('ascii')}
+    return {'dtype': 'f8', 'bdata': base64.b64encode(values.astype('float64').tobytes()).decode('ascii')}
+
+def trace_arrays(cancer_data, age_data, regional_data, rankings=None):
+    """
+    대시보드 트레이스별 데이터 배열 (트레이스 순서대로, 스타일은 build_dashboard_figure에서 한 번만 설정)
+    'marker.color'처럼 점으로 구분한 키는 중첩 속성
+    rankings: CancerDataset.rankings() (없으면 세 표로 새로 만듦)
+    """
+    if rankings is None:
+        rankings = CancerDataset(cancer_data, age_data, regional_data).rankings()
+    top_cancers = rankings['cancer_data'].top_n('총계', 8)
+    top_regions = rankings['regional_data'].top_n('발생수', 10)
+    return [
+        {'x': top_cancers['암종'].tolist(), 'y': top_cancers['남성'].to_numpy()},
+        {'x': top_cancers['암종'].tolist(), 'y': top_cancers['여성'].to_numpy()},
+        {'values': np.array([cancer_data['남성'].sum(), cancer_data['여성'].sum()])},
+        {'x': age_data['연령대'].tolist(), 'y': age_data['발생수'].to_numpy(),
+         'marker.color': age_data['발생수'].to_numpy()},
+        {'x': top_regions['지역'].tolist(), 'y': top_regions['발생수'].to_numpy(),
+         'marker.color': top_regions['발생수'].to_numpy()}
+    ]
+
+def build_dashboard_figure(cancer_data, age_data, regional_data, title=DEFAULT_TITLE, rankings=None):
+    """인터랙티브 대시보드 Figure (2x2: 암종별 성별, 성별 분포, 연령별, 지역별)"""
+    arrays = trace_arrays(cancer_data, age_data, regional_data, rankings)
+    fig = plotly_subplots.make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('암종별 성별 발생 현황', '성별 분포', '연령별 분포', '지역별 발생률'),
+        specs=[[{"type": "bar"}, {"type": "pie"}],
+               [{"type": "bar"}, {"type": "bar"}]]
+    )
+    
+    # 1. 암종별 성별 발생 현황 (3D 그라데이션 효과)
+    fig.add_trace(
+        go.Bar(x=arrays[0]['x'], y=arrays[0]['y'],
+              name='남성',
+              marker=dict(
+                  color='#4A90E2',
+                  line=dict(color='#2563EB', width=2),
+                  pattern_shape="/",  # 패턴 추가
+                  opacity=0.9
+              ),
+              texttemplate='%{y:d}',
+              textposition='outside',
+              textfont=dict(size=10, color='#2563EB')),
+        row=1, col=1
+    )
+    fig.add_trace(
+        go.Bar(x=arrays[1]['x'], y=arrays[1]['y'],
+              name='여성',
+              marker=dict(
+                  color='#E24A90',
+                  line=dict(color='#BE185D', width=2),
+                  pattern_shape="\\",  # 패턴 추가
+                  opacity=0.9
+              ),
+              texttemplate='%{y:d}',
+              textposition='outside',
+              textfont=dict(size=10, color='#BE185D')),
+        row=1, col=1
+    )
+    
+    # 2. 성별 분포 (3D 파이차트 효과)
+    fig.add_trace(
+        go.Pie(labels=['남성', '여성'],
+              values=arrays[2]['values'],
+              name="성별 분포",
+              marker=dict(
+                  colors=['#4A90E2', '#E24A90'],
+                  line=dict(color='#FFFFFF', width=3)
+              ),
+              textfont=dict(size=12, color='white'),
+              textinfo='label+percent+value',
+              hole=0.3,  # 도넛 형태로 입체감
+              pull=[0.1, 0.1]),  # 조각 분리 효과
+        row=1, col=2
+    )
+    
+    # 3. 연령별 분포 (그라데이션 효과)
+    fig.add_trace(
+        go.Bar(x=arrays[3]['x'], y=arrays[3]['y'],
+              name='연령별',
+              marker=dict(
+                  color=arrays[3]['marker.color'],
+                  colorscale='Viridis',  # 그라데이션 컬러스케일
+                  line=dict(color='#333333', width=1),
+                  opacity=0.8
+              ),
+              texttemplate='%{y:d}',
+              textposition='outside',
+              textfont=dict(size=10)),
+        row=2, col=1
+    )
+    
+    # 4. 지역별 상위 10개 (그라데이션 효과)
+    fig.add_trace(
+        go.Bar(x=arrays[4]['x'], y=arrays[4]['y'],
+              name='지역별',
+              marker=dict(
+                  color=arrays[4]['marker.color'],
+                  colorscale='Blues',  # 파란색 그라데이션
+                  line=dict(color='#1E3A8A', width=1),
+                  opacity=0.85
+              ),
+              texttemplate='%{y:d}',
+              textposition='outside',
+              textfont=dict(size=10)),
+        row=2, col=2
+    )
+    
+    # 레이아웃 업데이트 (3D 및 입체감 효과)
+    fig.update_layout(
+        height=900,
+        showlegend=True,
+        title_text=title,
+        title_font=dict(size=20, color='#1f2937'),
+        plot_bgcolor='rgba(248,250,252,0.8)',
+        paper_bgcolor='rgba(255,255,255,0.95)',
+        annotations=[
+            dict(
+                text="<b>📄 데이터 출처 및 저작권</b><br>" +
+                     "• <b>국립암센터 국가암정보센터</b>: www.cancer.go.kr<br>" +
+                     "• 중앙암등록본부 (국립암센터): ncc.re.kr<br>" +
+                     "• KOSIS 국가통계포털: kosis.kr<br>" +
+                     "• 공공데이터포털: data.go.kr<br>" +
+                     "• e-나라지표: index.go.kr<br>" +
+                     "<br><b>⚠️ 이용 조건</b><br>" +
+                     "• 저작자표시-비영리-변경금지<br>" +
+                     "• 포트폴리오/학습 목적만 허용<br>" +
+                     "• 상업적 이용 절대 금지<br>" +
+                     "<i>© 국립암센터 - 비영리 포트폴리오 프로젝트</i>",
+                xref="paper", yref="paper",
+                x=0.98, y=0.25, xanchor="right", yanchor="bottom",
+                showarrow=False,
+                font=dict(size=10, color="gray"),
+                bgcolor="rgba(255,255,255,0.95)",
+                bordercolor="rgba(209,213,219,1)",
+                borderwidth=2,
+                borderpad=8
+            )
+        ]
+    )
+    
+    # 각 서브플롯에 그림자 효과 추가
+    fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(235,236,240,0.6)')
+    fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(235,236,240,0.6)')
+    
+    # 범례 스타일링
+    fig.update_layout(
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=1.02,
+            xanchor="right",
+            x=1,
+            bgcolor="rgba(255,255,255,0.8)",
+            bordercolor="rgba(209,213,219,1)",
+            borderwidth=1
+        )
+    )
+    return fig
+
+def _script_json(value):
+    """<script> 안에 넣을 압축 JSON ('</'가 태그를 닫지 않도록 이스케이프)"""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
+
+class DashboardTemplate:
+    """
+    대시보드 HTML 일괄 생성기
+    Figure는 처음 한 번만 만들어 스타일/레이아웃 JSON을 템플릿으로 보관하고,
+    이후에는 트레이스 데이터 배열(typed array)과 제목만 바꿔 HTML 템플릿에 채워 씀
+    plotly_js: 'inline', 'shared'(출력 폴더에 plotly.min.js 하나), 'cdn'
+    """
+    
+    def __init__(self, plotly_js='shared', output_dir='charts'):
+        if plotly_js not in PLOTLY_JS_MODES:
+            raise ValueError(f"plotly_js must be one of {PLOTLY_JS_MODES}, got {plotly_js!r}")
+        self.plotly_js = plotly_js
+        self.output_dir = Path(output_dir)
+        self._spec = None
+    
+    def _load_spec(self, dataset):
+        """첫 대시보드의 Figure를 JSON 템플릿으로 변환 (이후 Figure 검증/생성 비용 없음)"""
+        fig = build_dashboard_figure(dataset.cancer_data, dataset.age_data, dataset.regional_data,
+                                     rankings=dataset.rankings())
+        self._spec = json.loads(pio.to_json(fig, validate=False))
+    
+    def _plotly_script(self, path):
+        if self.plotly_js == 'cdn':
+            return f'<script src="https://cdn.plot.ly/plotly-{plotly_offline.get_plotlyjs_version()}.min.js"></script>'
+        if self.plotly_js == 'inline':
+            return f'<script type="text/javascript">{plotly_offline.get_plotlyjs()}</script>'
+        
+        # shared: 출력 폴더에 한 번만 저장하고 상대 경로로 참조
+        asset = self.output_dir / SHARED_PLOTLY_JS
+        if not asset.exists():
+            asset.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = asset.with_suffix('.tmp')
+            tmp_path.write_text(plotly_offline.get_plotlyjs(), encoding='utf-8')
+            os.replace(tmp_path, asset)
+        src = Path(os.path.relpath(asset.resolve(), path.resolve().parent)).as_posix()
+        return f'<script src="{src}"></script>'
+    
+    def render(self, dataset, title=DEFAULT_TITLE, path=None):
+        """대시보드 HTML 문자열 (path: shared 모드에서 plotly.min.js 상대 경로 계산용)"""
+        if self._spec is None:
+            self._load_spec(dataset)
+        
+        data = []
+        arrays = trace_arrays(dataset.cancer_data, dataset.age_data, dataset.regional_data,
+                              dataset.rankings())
+        for trace, fields in zip(self._spec['data'], arrays):
+            trace = dict(trace)
+            for key, values in fields.items():
+                value = values if isinstance(values, list) else typed_array(values)
+                if key.startswith('marker.'):
+                    trace['marker'] = dict(trace['marker'], **{key.split('.', 1)[1]: value})
+                else:
+                    trace[key] = value
+            data.append(trace)
+        layout = dict(self._spec['layout'], title=dict(self._spec['layout']['title'], text=title))
+        
+        path = Path(path) if path is not None else self.output_dir / 'dashboard.html'
+        return HTML_TEMPLATE.substitute(
+            title=title,
+            plotly_script=self._plotly_script(path),
+            data=_script_json(data),
+            layout=_script_json(layout)
+        )
+    
+    def write(self, path, dataset, title=DEFAULT_TITLE):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.render(dataset, title, path), encoding='utf-8')
+        return path
+    
+    def write_many(self, dashboards):
+        """(경로, CancerDataset, 제목) 목록을 같은 템플릿으로 저장하고 저장한 경로 목록 반환"""
+        return [self.write(path, dataset, title) for path, dataset, title in dashboards]
+
+def cube_dashboards(cube, output_dir, by=('연도', '지역')):
+    """
+    케이스 단위 큐브를 by 차원 조합별로 잘라 write_many용 (경로, CancerDataset, 제목) 생성
+    예: output_dir/2020/서울특별시.html
+    """
+    output_dir = Path(output_dir)
+    for combination in itertools.product(*(cube.labels[dim] for dim in by)):
+        subset = cube.where(dict(zip(by, combination)))
+        path = output_dir.joinpath(*(str(label) for label in combination[:-1]), f"{combination[-1]}.html")
+        title = ' '.join(f"{label}년" if dim == '연도' else str(label)
+                         for dim, label in zip(by, combination)) + " 암 발생 통계 대시보드"
+        yield path, subset.to_dataset(), title
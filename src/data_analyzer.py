@@ -1,45 +1,183 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
 from pathlib import Path
-import json
 
-# 한글 폰트 설정
-plt.rcParams['font.family'] = 'DejaVu Sans'
-plt.rcParams['axes.unicode_minus'] = False
+from cube import CASE_DIMS, CancerCube
+from dataset import SEXES, CancerDataset, year_label
+from dataset_store import YearPartitionedStore
+from instrumentation import instrumented
+from memo import AnalysisMemo, frame_fingerprint, memoized
+from output_writer import OutputWriter
+from population import get_population_table
+from ranking import RankingIndex
+from schema import compact_frame, format_size, memory_bytes
+from standardization import DEFAULT_STRATA, age_standardized_rates
 
+@instrumented('analyzer')
 class CancerDataAnalyzer:
-    def __init__(self):
+    # 분석에 필요한 테이블별 컬럼 (연도별 데이터셋에서 이 컬럼만 읽음)
+    ANALYSIS_COLUMNS = {
+        'cancer_by_type_gender': ['암종', '남성', '여성', '총계'],
+        'cancer_by_age': ['연령대', '발생수'],
+        'cancer_by_region': ['지역', '발생수']
+    }
+    
+    # 보고서 파일 (reports/ 기준 이름, 압축하면 .gz/.zst가 붙음)
+    REPORT_FILES = ('cancer_analysis_report.json', 'cancer_analysis_summary.txt')
+    
+    def __init__(self, dataset=None, memo_size=64, compression=None):
+        """
+        dataset: 이미 메모리에 있는 CancerDataset (없으면 data/ 디렉토리에서 로드)
+        memo_size: 분석 결과 캐시 최대 항목 수
+        compression: 보고서 압축 방식 (None, 'gzip', 'zstd')
+        """
+        self.dataset = dataset
+        self.compression = compression
+        self.rankings = {}
+        self._cube_rankings = {}
+        self.memo = AnalysisMemo(memo_size)
+        self._fingerprints = {}
         self.data_dir = Path('data')
         self.charts_dir = Path('charts')
         self.reports_dir = Path('reports')
+        self.years = [2020]
         
         # 디렉토리 생성
         self.charts_dir.mkdir(exist_ok=True)
         self.reports_dir.mkdir(exist_ok=True)
         
-    def load_data(self):
-        """데이터 로드"""
+    def load_data(self, years=None, columns=None):
+        """
+        데이터 로드
+        years를 지정하면 연도별 데이터셋(data/dataset)에서 해당 연도만 읽음
+        columns: 테이블 이름 -> 읽을 컬럼 목록 (기본값: ANALYSIS_COLUMNS)
+        """
         print("Loading data...")
         
         try:
-            self.cancer_data = pd.read_csv(self.data_dir / 'cancer_by_type_gender.csv')
-            self.age_data = pd.read_csv(self.data_dir / 'cancer_by_age.csv')
-            self.regional_data = pd.read_csv(self.data_dir / 'cancer_by_region.csv')
-            print("Data loading completed!")
+            if years is None:
+                dataset = self.dataset or CancerDataset.from_csv(self.data_dir)
+                self.cancer_data, self.age_data, self.regional_data = dataset.frames()
+                self._build_cubes(self.cancer_data, self.age_data, self.regional_data)
+                self.rankings = dataset.rankings()
+            else:
+                self._load_dataset(years, columns or self.ANALYSIS_COLUMNS)
+            self._update_fingerprints()
+            print(f"Data loading completed! ({format_size(self.memory_usage())} in memory)")
         except FileNotFoundError:
             print("Data files not found. Please run data_collector.py first.")
             return False
         return True
     
+    def _load_dataset(self, years, columns):
+        """연도별 파티션 데이터셋에서 필요한 연도/컬럼만 로드"""
+        store = YearPartitionedStore(self.data_dir / 'dataset')
+        cancer_data = store.read('cancer_by_type_gender', years, columns.get('cancer_by_type_gender'))
+        age_data = store.read('cancer_by_age', years, columns.get('cancer_by_age'))
+        regional_data = store.read('cancer_by_region', years, columns.get('cancer_by_region'))
+        self.years = sorted(cancer_data['연도'].unique().tolist())
+        self._build_cubes(cancer_data, age_data, regional_data)
+        
+        # 여러 연도를 읽은 경우 기간 합계로 분석
+        self.cancer_data = compact_frame(self._sum_over_years(cancer_data, '암종'))
+        self.age_data = compact_frame(self._sum_over_years(age_data, '연령대'))
+        self.regional_data = compact_frame(self._sum_over_years(regional_data, '지역'))
+        self.rankings = CancerDataset(self.cancer_data, self.age_data, self.regional_data).rankings()
+    
+    def load_cases(self, cases, dims=CASE_DIMS, count_col=None):
+        """
+        케이스 단위 레코드(한 행 = 한 건)를 하나의 큐브로 집계해 로드
+        count_col: 이미 차원 조합별로 집계된 레코드의 건수 컬럼 (예: RegistryAggregator.cases()의 '발생수')
+        분석용 테이블(암종별/연령별/지역별)은 큐브의 주변합에서 만듦
+        """
+        print(f"Aggregating {len(cases):,} case records...")
+        dims = [dim for dim in dims if dim in cases.columns]
+        return self.load_cube(CancerCube.from_records(cases, dims, count_col=count_col))
+    
+    def load_cube(self, cube):
+        """
+        이미 만든 케이스 단위 큐브를 로드 (예: --extract로 수집하며 만든 큐브)
+        연도 차원이 있으면 분석 연도와 인년(person-years)도 큐브의 연도를 따름
+        """
+        self.cubes = {'type_sex': cube, 'age': cube, 'region': cube}
+        self._cube_rankings = {}
+        if '연도' in cube.dims:
+            self.years = sorted(cube.labels['연도'])
+        
+        dataset = cube.to_dataset().compact()
+        self.cancer_data, self.age_data, self.regional_data = dataset.frames()
+        self.rankings = dataset.rankings()
+        self._update_fingerprints()
+        return True
+    
+    def _build_cubes(self, cancer_data, age_data, regional_data):
+        """집계 테이블을 분석용 큐브로 변환 (연도 컬럼이 있으면 연도 차원 포함)"""
+        def year_dim(df):
+            return ('연도',) if '연도' in df.columns else ()
+        
+        by_sex = cancer_data.melt(id_vars=list(year_dim(cancer_data)) + ['암종'], value_vars=SEXES,
+                                  var_name='성별', value_name='발생수')
+        self.cubes = {
+            'type_sex': CancerCube.from_records(by_sex, year_dim(cancer_data) + ('암종', '성별'),
+                                                count_col='발생수'),
+            'age': CancerCube.from_records(age_data, year_dim(age_data) + ('연령대',), count_col='발생수'),
+            'region': CancerCube.from_records(regional_data, year_dim(regional_data) + ('지역',),
+                                              count_col='발생수')
+        }
+        self._cube_rankings = {}
+    
+    def _update_fingerprints(self):
+        """
+        로드한 입력 데이터의 지문 갱신
+        캐시 키에 지문이 들어가므로 바뀐 테이블에 의존하는 결과만 다시 계산됨
+        """
+        self._fingerprints = {
+            'cancer_data': frame_fingerprint(self.cancer_data),
+            'age_data': frame_fingerprint(self.age_data),
+            'regional_data': frame_fingerprint(self.regional_data),
+            'years': ','.join(str(year) for year in self.years)
+        }
+    
+    def ranking(self, dim, partition_by=()):
+        """
+        큐브에서 만든 dim 레이블의 발생수 순위 (partition_by: 연도, 지역, 성별 등 파티션 차원)
+        데이터를 로드할 때마다 (dim, partition_by)별로 한 번만 만듦
+        """
+        key = (dim, tuple(partition_by))
+        if dim in partition_by:
+            raise ValueError(f"Cannot partition a ranking of '{dim}' by '{dim}' itself")
+        if key not in self._cube_rankings:
+            wanted = {dim, *partition_by}
+            cube = next((cube for cube in self.cubes.values() if wanted <= set(cube.dims)), None)
+            if cube is None:
+                raise ValueError(f"No loaded cube has the dimensions {sorted(wanted)}")
+            self._cube_rankings[key] = RankingIndex.from_cube(cube, dim, partition_by)
+        return self._cube_rankings[key]
+    
+    def memory_usage(self):
+        """로드한 세 테이블의 메모리 사용량(바이트)"""
+        return sum(memory_bytes(frame) for frame in (self.cancer_data, self.age_data, self.regional_data))
+    
+    def dependency_fingerprints(self):
+        """분석별 의존 입력 이름 -> 지문 (인구 테이블은 파일 버전)"""
+        return dict(self._fingerprints, population=get_population_table().version)
+    
+    @staticmethod
+    def _sum_over_years(df, key):
+        """연도 컬럼을 제외하고 key별 합계 (원래 행 순서 유지)"""
+        return df.drop(columns=['연도']).groupby(key, sort=False, as_index=False).sum()
+    
+    def _year_label(self):
+        """보고서에 표시할 분석 연도 (예: 2020년, 2018-2020년)"""
+        return year_label(self.years)
+    
+    @memoized('cancer_data')
     def analyze_gender_distribution(self):
         """성별 암 발생 분포 분석"""
         print("Analyzing gender distribution...")
         
-        # 성별 총 발생 수 계산
-        total_male = self.cancer_data['남성'].sum()
-        total_female = self.cancer_data['여성'].sum()
+        # 성별 총 발생 수 계산 (큐브의 성별 주변합)
+        by_sex = self.cubes['type_sex'].series('성별')
+        total_male = by_sex['남성']
+        total_female = by_sex['여성']
         
         gender_stats = {
             '남성': total_male,
@@ -50,69 +188,83 @@ class CancerDataAnalyzer:
         
         return gender_stats
     
+    @memoized('cancer_data')
     def analyze_top_cancers(self, top_n=10):
         """상위 암종 분석"""
         print(f"Analyzing top {top_n} cancer types...")
         
-        # 총 발생 수 기준 정렬
-        top_cancers = self.cancer_data.nlargest(top_n, '총계')
+        # 총 발생 수 기준 상위 (로드할 때 만든 순위 인덱스에서 앞 top_n개만 읽음)
+        top_cancers = self.rankings['cancer_data'].top_n('총계', top_n).reset_index(drop=True)
         
         return top_cancers
     
+    @memoized('age_data')
     def analyze_age_distribution(self):
         """연령별 분포 분석"""
         print("Analyzing age distribution...")
         
-        # 연령대별 비율 계산
-        total_cases = self.age_data['발생수'].sum()
-        self.age_data['비율'] = (self.age_data['발생수'] / total_cases * 100).round(2)
+        # 연령대별 비율 계산 (원본 age_data는 수정하지 않음)
+        age_cube = self.cubes['age']
+        total_cases = age_cube.total()
+        age_distribution = compact_frame(self.age_data.assign(
+            비율=self.age_data['연령대'].map(age_cube.shares('연령대')).round(2)))
         
         # 고위험 연령대 식별 (발생수 상위 3개)
-        high_risk_ages = self.age_data.nlargest(3, '발생수')
+        top = self.rankings['age_data'].top_keys('발생수', 3)
+        high_risk_ages = age_distribution.set_index('연령대').loc[top].reset_index()
         
         return {
             'total_cases': total_cases,
             'high_risk_ages': high_risk_ages,
-            'age_distribution': self.age_data
+            'age_distribution': age_distribution
         }
     
+    @memoized('regional_data', 'years', 'population')
     def analyze_regional_distribution(self):
         """지역별 분포 분석"""
         print("Analyzing regional distribution...")
         
-        # 인구 대비 발생률 계산을 위한 예시 인구 데이터
-        population_data = {
-            '서울특별시': 9720846,
-            '부산광역시': 3378016,
-            '대구광역시': 2401110,
-            '인천광역시': 2947217,
-            '광주광역시': 1441970,
-            '대전광역시': 1454679,
-            '울산광역시': 1124459,
-            '세종특별자치시': 355831,
-            '경기도': 13379311,
-            '강원도': 1518500,
-            '충청북도': 1595460,
-            '충청남도': 2123692,
-            '전라북도': 1792476,
-            '전라남도': 1838353,
-            '경상북도': 2625961,
-            '경상남도': 3309918,
-            '제주특별자치도': 672948
-        }
-        
-        # 인구 10만명당 발생률 계산
-        self.regional_data['인구'] = self.regional_data['지역'].map(population_data)
-        self.regional_data['인구10만명당발생률'] = (self.regional_data['발생수'] / self.regional_data['인구'] * 100000).round(2)
+        # 인구 10만명당 발생률 계산 (여러 연도는 연도별 인구를 합산한 인년 기준 연평균 발생률)
+        person_years = get_population_table().lookup(self.regional_data['지역'], self.years)
+        regional_stats = compact_frame(self.regional_data.assign(
+            인구=person_years / len(self.years),
+            인구10만명당발생률=(self.regional_data['발생수'] / person_years * 100000).round(2)))
         
-        # 발생률 상위 지역
-        high_incidence_regions = self.regional_data.nlargest(5, '인구10만명당발생률')
+        # 발생률 상위 지역 (발생률은 인구 참조표에 따라 달라지므로 여기서 순위 인덱스를 만듦)
+        ranking = RankingIndex(regional_stats, '지역', ['인구10만명당발생률', '발생수'])
+        high_incidence_regions = ranking.top_n('인구10만명당발생률', 5)
         
         return {
             'high_incidence_regions': high_incidence_regions,
-            'regional_stats': self.regional_data
+            'regional_stats': regional_stats,
+            'ranking': ranking
         }
     
+    def analyze_age_standardized_rates(self, population, standard='segi', strata=DEFAULT_STRATA):
+        """
+        층별 연령표준화 발생률 (load_cases로 연령대와 층 차원이 모두 있는 큐브를 만든 경우)
+        population: 연도/지역/성별 등 + 연령대 + 인구 컬럼의 긴 형식 표
+        standard: 'segi', 'who2000' 또는 연령대별 표준인구 배열
+        """
+        print(f"Analyzing age-standardized rates ({standard if isinstance(standard, str) else 'custom'})...")
+        
+        cube = self.cubes['type_sex']
+        missing = (set(strata) | {'연령대'}) - set(cube.dims)
+        if missing:
+            raise ValueError(f"Age-standardized rates need case-level data with {sorted(missing)} "
+                             "(use load_cases)")
+        
+        cases = cube.to_frame(tuple(strata) + ('연령대',))
+        return age_standardized_rates(cases, population, strata, standard)
+    
+    def _report_writer(self):
+        return OutputWriter(self.reports_dir, compression=self.compression)
+    
+    def report_paths(self):
+        """generate_summary_report가 쓰는 파일 경로 (압축 설정 반영)"""
+        writer = self._report_writer()
+        return [writer.output_path(name) for name in self.REPORT_FILES]
+    
     def generate_summary_report(self):
         """종합 분석 보고서 생성"""
         print("Generating summary report...")
@@ -123,10 +275,13 @@ class CancerDataAnalyzer:
         age_analysis = self.analyze_age_distribution()
         regional_analysis = self.analyze_regional_distribution()
         
+        # 발생률 컬럼은 float32이므로 표시 전에 소수 둘째 자리 float로 변환
+        top_rate = round(float(regional_analysis['high_incidence_regions'].iloc[0]['인구10만명당발생률']), 2)
+        
         # 보고서 생성
         report = {
             "분석_개요": {
-                "분석_연도": "2020년",
+                "분석_연도": self._year_label(),
                 "총_암_발생_건수": int(self.cancer_data['총계'].sum()),
                 "분석_암종_수": len(self.cancer_data),
                 "분석_지역_수": len(self.regional_data)
@@ -149,20 +304,16 @@ class CancerDataAnalyzer:
             },
             "지역별_분석": {
                 "최고_발생률_지역": regional_analysis['high_incidence_regions'].iloc[0]['지역'],
-                "최고_발생률": f"{regional_analysis['high_incidence_regions'].iloc[0]['인구10만명당발생률']}명/10만명"
+                "최고_발생률": f"{top_rate}명/10만명"
             }
         }
         
-        # JSON 형태로 저장
-        with open(self.reports_dir / 'cancer_analysis_report.json', 'w', encoding='utf-8') as f:
-            json.dump(report, f, ensure_ascii=False, indent=2)
-        
         # 텍스트 보고서 생성
         report_text = f"""
-# 2020년 한국 암 발생 통계 분석 보고서
+# {report['분석_개요']['분석_연도']} 한국 암 발생 통계 분석 보고서
 
 ## 📊 분석 개요
-- 분석 연도: 2020년
+- 분석 연도: {report['분석_개요']['분석_연도']}
 - 총 암 발생 건수: {report['분석_개요']['총_암_발생_건수']:,}건
 - 분석 암종 수: {report['분석_개요']['분석_암종_수']}개
 - 분석 지역 수: {report['분석_개요']['분석_지역_수']}개
@@ -185,11 +336,14 @@ class CancerDataAnalyzer:
 - 발생률: {report['지역별_분석']['최고_발생률']}
 
 ---
-*본 보고서는 2020년 공공데이터를 기반으로 작성되었습니다.*
+*본 보고서는 {report['분석_개요']['분석_연도']} 공공데이터를 기반으로 작성되었습니다.*
 """
         
-        with open(self.reports_dir / 'cancer_analysis_summary.txt', 'w', encoding='utf-8') as f:
-            f.write(report_text)
+        # JSON과 텍스트 보고서를 동시에 쓰고 각각 원자적으로 교체 (reports/manifest.json 갱신)
+        writer = self._report_writer()
+        writer.add_json('cancer_analysis_report.json', report)
+        writer.add_text('cancer_analysis_summary.txt', report_text)
+        writer.commit()
         
         print("Analysis report generated successfully!")
         return report
@@ -1,22 +1,79 @@
-import requests
-import pandas as pd
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, wait
 from dotenv import load_dotenv
 import time
 
+from dataset import CancerDataset
+from dataset_store import DATASET_TABLES, YEAR_COLUMN, YearPartitionedStore
+from html_tables import CANCER_NAMES, extract_cancer_tables
+from http_cache import CacheMissError, ResponseCache
+from instrumentation import instrumented
+from lazy_import import lazy_import
+from schema import compact_frame, memory_report
+from streaming_ingest import RegistryAggregator
+
+# 무거운 라이브러리는 처음 사용할 때 import
+pd = lazy_import('pandas')
+requests = lazy_import('requests')
+
 # 환경변수 로드
 load_dotenv()
 
+@instrumented('collector')
 class CancerDataCollector:
-    def __init__(self):
+    # 수집 대상 엔드포인트 (데이터 종류 -> 경로)
+    API_ENDPOINTS = {
+        'statistics': 'data.do',      # 통계로 보는 암
+        'cancer_data': 'cancerData.do', # 내가 알고 싶은 암 데이터
+        'prevention': 'prevention.do'   # 암예방과 검진
+    }
+    
+    # 수집 소스가 실제로 제공하는 연도 (API 응답 변환 결과, 샘플 데이터 모두 2020년 참조 표뿐)
+    AVAILABLE_YEARS = (2020,)
+    
+    def __init__(self, base_url=None, fetch_mode='concurrent', max_workers=4,
+                 endpoint_timeout=15, total_timeout=30,
+                 cache_dir='.cache/http', cache_ttl=24 * 3600, offline=False,
+                 max_retries=3, pool_size=None):
+        """
+        fetch_mode: 'concurrent'(엔드포인트 동시 요청) 또는 'sequential'(순차 요청)
+        max_workers: 동시 요청 수 상한
+        endpoint_timeout: 엔드포인트별 제한 시간(초)
+        total_timeout: 전체 수집 제한 시간(초)
+        cache_dir: 응답 캐시 디렉토리 (None이면 캐시 사용 안 함)
+        cache_ttl: 캐시 항목을 재검증 없이 사용하는 시간(초)
+        offline: True이면 네트워크 요청 없이 캐시된 응답만 사용
+        max_retries: 5xx/429/연결 오류 시 엔드포인트별 재시도 횟수 (지수 백오프 + jitter, Retry-After 존중)
+        pool_size: keep-alive 커넥션 풀 크기 (기본값: max(max_workers, 10))
+        """
+        if offline and cache_dir is None:
+            raise ValueError("offline mode requires a response cache (cache_dir)")
+        
         self.api_key = os.getenv('CANCER_API_KEY')
-        self.base_url = "https://www.cancer.go.kr/api"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Korean-Cancer-Statistics-Analyzer/1.0',
-            'Accept': 'application/json, text/html'
-        })
+        self.base_url = base_url or "https://www.cancer.go.kr/api"
+        self.api_endpoints = dict(self.API_ENDPOINTS)
+        self.fetch_mode = fetch_mode
+        self.max_workers = max_workers
+        self.endpoint_timeout = endpoint_timeout
+        self.total_timeout = total_timeout
+        self.offline = offline
+        self.cache = ResponseCache(cache_dir, ttl=cache_ttl) if cache_dir is not None else None
+        # save_data_from_extract로 집계한 케이스 단위 큐브 (지역별/암종별 차트 세트용)
+        self.cube = None
+        
+        # transport는 requests를 import하므로 수집기를 만들 때 import
+        from transport import ResilientTransport, RetryPolicy
+        
+        # 동시 요청 수만큼 커넥션을 재사용할 수 있도록 풀 크기 조정, 엔드포인트별 회로 차단기
+        self.transport = ResilientTransport(
+            pool_size=pool_size or max(max_workers, 10),
+            retry=RetryPolicy(max_retries=max_retries),
+            headers={
+                'User-Agent': 'Korean-Cancer-Statistics-Analyzer/1.0',
+                'Accept': 'application/json, text/html'
+            })
+        self.session = self.transport.session
         
     def fetch_cancer_statistics(self, year=2020):
         """암 발생 통계 데이터 수집"""
@@ -31,47 +88,21 @@ class CancerDataCollector:
     
     def _fetch_real_api_data(self, year):
         """실제 국가암정보센터 API에서 데이터 수집"""
-        api_endpoints = {
-            'statistics': 'data.do',      # 통계로 보는 암
-            'cancer_data': 'cancerData.do', # 내가 알고 싶은 암 데이터
-            'prevention': 'prevention.do'   # 암예방과 검진
-        }
+        # 국가암정보센터 API는 별도 인증키가 필요없을 수 있음
+        params = {}
+        if self.api_key and self.api_key != 'your_api_key_here':
+            params['serviceKey'] = self.api_key
         
-        all_data = {}
+        deadline = time.monotonic() + self.total_timeout
         
-        for data_type, endpoint in api_endpoints.items():
-            try:
-                url = f"{self.base_url}/{endpoint}"
-                
-                # 국가암정보센터 API는 별도 인증키가 필요없을 수 있음
-                params = {}
-                if self.api_key and self.api_key != 'your_api_key_here':
-                    params['serviceKey'] = self.api_key
-                
-                print(f"Requesting {url}...")
-                response = self.session.get(url, params=params, timeout=15)
-                
-                if response.status_code == 200:
-                    try:
-                        # JSON 응답 시도
-                        data = response.json()
-                        print(f"SUCCESS: {data_type} JSON data collected successfully")
-                        all_data[data_type] = data
-                    except json.JSONDecodeError:
-                        # HTML 응답일 경우 HTML 파싱
-                        html_content = response.text
-                        if html_content and len(html_content) > 100:
-                            print(f"SUCCESS: {data_type} HTML data collected successfully ({len(html_content)} chars)")
-                            all_data[data_type] = self._parse_html_statistics(html_content, data_type)
-                        else:
-                            print(f"WARNING: Empty response for {data_type}")
-                else:
-                    print(f"WARNING: API request failed for {data_type}: {response.status_code}")
-                    
-            except requests.RequestException as e:
-                print(f"WARNING: Network error for {data_type}: {e}")
-            except Exception as e:
-                print(f"WARNING: Unexpected error for {data_type}: {e}")
+        if self.fetch_mode == 'sequential':
+            all_data = {}
+            for data_type, endpoint in self.api_endpoints.items():
+                data = self._fetch_endpoint(data_type, endpoint, params, deadline)
+                if data is not None:
+                    all_data[data_type] = data
+        else:
+            all_data = self._fetch_endpoints_concurrently(params, deadline)
         
         if all_data:
             return self._convert_api_data(all_data)
@@ -79,24 +110,110 @@ class CancerDataCollector:
             print("API data collection failed, falling back to sample data...")
             return self._fetch_sample_data()
     
-    def _parse_html_statistics(self, html_content, data_type):
-        """HTML에서 통계 데이터 추출"""
-        # 간단한 HTML 파싱 (실제로는 BeautifulSoup 등 사용 권장)
-        import re
+    def _fetch_endpoints_concurrently(self, params, deadline):
+        """모든 엔드포인트를 스레드 풀에서 동시에 요청"""
+        all_data = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        futures = {
+            executor.submit(self._fetch_endpoint, data_type, endpoint, params, deadline): data_type
+            for data_type, endpoint in self.api_endpoints.items()
+        }
         
+        try:
+            done, not_done = wait(futures, timeout=max(0, deadline - time.monotonic()))
+        finally:
+            # 전체 제한 시간을 넘긴 요청은 기다리지 않음 (각 요청은 자체 제한 시간으로 종료됨)
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+        
+        for future in done:
+            data = future.result()
+            if data is not None:
+                all_data[futures[future]] = data
+        for future in not_done:
+            print(f"WARNING: Overall deadline exceeded for {futures[future]}")
+        
+        return all_data
+    
+    def _fetch_endpoint(self, data_type, endpoint, params, deadline):
+        """단일 엔드포인트 요청 및 응답 파싱 (실패 시 None)"""
+        url = f"{self.base_url}/{endpoint}"
+        # 엔드포인트별 제한 시간은 실제 요청을 시작한 시점부터 계산
+        deadline = min(deadline, time.monotonic() + self.endpoint_timeout)
+        
+        try:
+            status_code, content = self._http_get(url, params, deadline)
+            
+            if status_code != 200:
+                print(f"WARNING: API request failed for {data_type}: {status_code}")
+                return None
+            
+            try:
+                # JSON 응답 시도
+                data = json.loads(content)
+                print(f"SUCCESS: {data_type} JSON data collected successfully")
+                return data
+            except json.JSONDecodeError:
+                # HTML 응답일 경우 HTML 파싱
+                if content and len(content) > 100:
+                    print(f"SUCCESS: {data_type} HTML data collected successfully ({len(content)} chars)")
+                    return self._parse_html_statistics(content, data_type)
+                print(f"WARNING: Empty response for {data_type}")
+                
+        except CacheMissError:
+            print(f"WARNING: Offline mode - no cached response for {data_type}")
+        except requests.RequestException as e:
+            print(f"WARNING: Network error for {data_type}: {e}")
+        except Exception as e:
+            print(f"WARNING: Unexpected error for {data_type}: {e}")
+        return None
+    
+    def _http_get(self, url, params, deadline):
+        """캐시를 거쳐 (상태 코드, 본문 텍스트) 반환"""
+        if self.cache is None:
+            status_code, content, _ = self._http_get_network(url, params, deadline)
+            return status_code, content
+        
+        entry = self.cache.get(url, params)
+        if entry is not None and (self.offline or self.cache.is_fresh(entry)):
+            self.cache.record('hits')
+            return 200, entry['content']
+        if self.offline:
+            self.cache.record('misses')
+            raise CacheMissError(url)
+        
+        # 만료된 항목은 조건부 요청으로 재검증 (변경 없으면 304)
+        headers = self.cache.conditional_headers(entry) if entry is not None else {}
+        status_code, content, response_headers = self._http_get_network(url, params, deadline, headers)
+        
+        if status_code == 304 and entry is not None:
+            self.cache.record('revalidated')
+            self.cache.refresh(url, params, entry, response_headers)
+            return 200, entry['content']
+        
+        self.cache.record('misses')
+        if status_code == 200:
+            self.cache.store(url, params, content, response_headers)
+        return status_code, content
+    
+    def _http_get_network(self, url, params, deadline, headers=None):
+        """제한 시각(deadline)까지 응답 본문을 읽어 (상태 코드, 본문 텍스트, 응답 헤더) 반환"""
+        print(f"Requesting {url}...")
+        response = self.transport.get(url, params=params, headers=headers, deadline=deadline)
+        content = response.content.decode(response.encoding or 'utf-8', errors='replace')
+        return response.status_code, content, response.headers
+    
+    def _parse_html_statistics(self, html_content, data_type):
+        """HTML에서 통계 데이터 추출 (표의 암종 행에서 남성/여성/총계 숫자를 한 번에 읽음)"""
         if data_type == 'statistics':
-            # 통계 데이터에서 숫자 패턴 찾기
-            numbers = re.findall(r'[\d,]+', html_content)
-            cancer_names = ['위암', '폐암', '간암', '대장암', '유방암', '갑상선암', '전립선암']
+            rows, mentioned = extract_cancer_tables(html_content)
             
-            # HTML에서 암종 이름과 숫자 매칭 시도
+            # 표에서 숫자를 찾은 암종은 값과 함께, 본문에서 언급만 된 암종은 표시만 남김
             extracted_data = {}
-            for i, cancer in enumerate(cancer_names):
-                if cancer in html_content:
-                    extracted_data[cancer] = {
-                        'found_in_html': True,
-                        'position': i
-                    }
+            for i, cancer in enumerate(CANCER_NAMES):
+                if cancer in rows or cancer in mentioned:
+                    extracted_data[cancer] = dict(rows.get(cancer, {}), found_in_html=True, position=i)
             
             return extracted_data if extracted_data else None
         
@@ -155,9 +272,9 @@ class CancerDataCollector:
         
         return df
     
-    def fetch_age_statistics(self):
+    def fetch_age_statistics(self, year=2020):
         """연령별 암 발생 통계"""
-        print("Collecting age-based cancer statistics...")
+        print(f"Collecting {year} age-based cancer statistics...")
         
         age_data = {
             '0-9세': 243,
@@ -174,9 +291,9 @@ class CancerDataCollector:
         df = pd.DataFrame(list(age_data.items()), columns=['연령대', '발생수'])
         return df
     
-    def fetch_regional_statistics(self):
+    def fetch_regional_statistics(self, year=2020):
         """지역별 암 발생 통계"""
-        print("Collecting regional cancer statistics...")
+        print(f"Collecting {year} regional cancer statistics...")
         
         regional_data = {
             '서울특별시': 23456,
@@ -201,25 +318,110 @@ class CancerDataCollector:
         df = pd.DataFrame(list(regional_data.items()), columns=['지역', '발생수'])
         return df
     
-    def save_data(self):
-        """데이터 수집 및 저장"""
+    @classmethod
+    def check_years(cls, years):
+        """수집 소스가 제공하지 않는 연도가 있으면 ValueError (다른 연도에 2020년 값을 붙여 저장하지 않도록)"""
+        unavailable = sorted(set(years) - set(cls.AVAILABLE_YEARS))
+        if unavailable:
+            raise ValueError(f"the data source only provides {', '.join(map(str, cls.AVAILABLE_YEARS))} "
+                             f"statistics, cannot collect {', '.join(map(str, unavailable))} "
+                             "(load other years into data/dataset separately and run with --only analyze visualize)")
+    
+    def collect_year(self, year):
+        """한 연도의 통계 테이블 수집 (테이블 이름 -> DataFrame)"""
+        self.check_years([year])
+        tables = {
+            'cancer_by_type_gender': self.fetch_cancer_statistics(year),
+            'cancer_by_age': self.fetch_age_statistics(year),
+            'cancer_by_region': self.fetch_regional_statistics(year)
+        }
+        return {name: compact_frame(df) for name, df in tables.items()}
+    
+    def collect_years(self, years, max_workers=None):
+        """여러 연도를 병렬로 수집 (연도 -> 테이블 딕셔너리)"""
+        years = sorted(set(years))
+        self.check_years(years)
+        with ThreadPoolExecutor(max_workers=max_workers or len(years)) as executor:
+            results = executor.map(self.collect_year, years)
+            return dict(zip(years, results))
+    
+    def save_dataset(self, years, dataset_dir='data/dataset', max_workers=None):
+        """여러 연도를 수집해 연도별 파티션 Parquet 데이터셋으로 저장 (연도 -> 테이블 딕셔너리 반환)"""
+        print(f"Starting batch collection for {len(set(years))} years...")
+        
+        store = YearPartitionedStore(dataset_dir)
+        collected = self.collect_years(years, max_workers)
+        for year, tables in collected.items():
+            store.write_year(year, tables)
+        
+        print("Batch collection completed!")
+        print(f"Saved dataset: {dataset_dir}/<table>/{YEAR_COLUMN}=<year>/ ({', '.join(map(str, store.years()))})")
+        return collected
+    
+    def save_data_from_extract(self, path, chunksize=500_000):
+        """
+        케이스 단위 레지스트리 추출본(CSV)을 스트리밍으로 집계해 save_data와 같은 CSV로 저장
+        메모리는 입력 행 수가 아니라 집계 키 수에 비례
+        """
+        print(f"Streaming registry extract: {path}")
+        
+        aggregator = RegistryAggregator().ingest_csv(path, chunksize=chunksize)
+        self.cube = aggregator.cube()
+        dataset = self._compact(self.cube.to_dataset())
+        dataset.to_csv('data')
+        
+        print(f"Aggregated {aggregator.rows:,} case rows into {len(aggregator.totals):,} keys")
+        print("Saved files:")
+        print("  - data/cancer_by_type_gender.csv")
+        print("  - data/cancer_by_age.csv") 
+        print("  - data/cancer_by_region.csv")
+        return dataset
+    
+    def _compact(self, dataset):
+        """schema 타입(범주형 레이블, 작은 정수 건수)으로 변환하고 변환 전후 메모리 출력"""
+        compacted = dataset.compact()
+        print("In-memory tables (schema dtypes):")
+        print(memory_report(dataset.tables(), compacted.tables()))
+        return compacted
+    
+    def save_data(self, year=2020, tables=None):
+        """
+        데이터 수집 및 저장 (수집한 데이터를 CancerDataset으로 반환)
+        tables: collect_year로 이미 수집한 테이블 (있으면 다시 요청하지 않고 그대로 저장)
+        """
         print("Starting data collection...")
         
-        # 각종 통계 데이터 수집
-        cancer_stats = self.fetch_cancer_statistics()
-        age_stats = self.fetch_age_statistics()
-        regional_stats = self.fetch_regional_statistics()
+        if tables is not None:
+            dataset = CancerDataset(*(tables[name] for name in DATASET_TABLES))
+        else:
+            # 각종 통계 데이터 수집
+            dataset = self._compact(CancerDataset(
+                cancer_data=self.fetch_cancer_statistics(year),
+                age_data=self.fetch_age_statistics(year),
+                regional_data=self.fetch_regional_statistics(year)
+            ))
         
         # CSV 파일로 저장
-        cancer_stats.to_csv('data/cancer_by_type_gender.csv', index=False, encoding='utf-8-sig')
-        age_stats.to_csv('data/cancer_by_age.csv', index=False, encoding='utf-8-sig')
-        regional_stats.to_csv('data/cancer_by_region.csv', index=False, encoding='utf-8-sig')
+        dataset.to_csv('data')
         
         print("Data collection completed!")
         print("Saved files:")
         print("  - data/cancer_by_type_gender.csv")
         print("  - data/cancer_by_age.csv") 
         print("  - data/cancer_by_region.csv")
+        
+        stats = self.cache.stats() if self.cache is not None else {}
+        if any(stats.values()):
+            print(f"HTTP cache: {stats['hits']} hits, {stats['revalidated']} revalidated, "
+                  f"{stats['misses']} misses, {stats['evictions']} evictions")
+        
+        metrics = self.transport.metrics.snapshot()
+        if metrics['requests']:
+            print(f"HTTP transport: {metrics['requests']} requests, {metrics['retries']} retries "
+                  f"({metrics['retry_wait_s']}s waiting), {metrics['failures']} failures, "
+                  f"{metrics['circuit_rejected']} rejected by open circuits")
+        
+        return dataset
 
 if __name__ == "__main__":
     collector = CancerDataCollector()
@@ -0,0 +1,112 @@
+from pathlib import Path
+
+from columnar_cache import ColumnarCache
+from dataset_store import DATASET_TABLES, YEAR_COLUMN, YearPartitionedStore
+from lazy_import import lazy_import
+from output_writer import OutputWriter
+from ranking import RankingIndex
+from schema import compact_frame
+
+pd = lazy_import('pandas')
+
+# 표준 레이블 순서 (집계 결과를 이 순서로 정렬)
+SEXES = ['남성', '여성']
+AGE_BANDS = ['0-9세', '10-19세', '20-29세', '30-39세', '40-49세',
+             '50-59세', '60-69세', '70-79세', '80세 이상']
+REGIONS = ['서울특별시', '부산광역시', '대구광역시', '인천광역시', '광주광역시',
+           '대전광역시', '울산광역시', '세종특별자치시', '경기도', '강원도',
+           '충청북도', '충청남도', '전라북도', '전라남도', '경상북도',
+           '경상남도', '제주특별자치도']
+
+
+def year_label(years):
+    """보고서/차트에 표시할 연도 (예: 2020년, 2018-2020년)"""
+    years = sorted(years)
+    if len(years) == 1:
+        return f"{years[0]}년"
+    return f"{years[0]}-{years[-1]}년"
+
+
+class CancerDataset:
+    """수집기, 분석기, 시각화 모듈이 함께 사용하는 데이터 묶음 (디스크를 거치지 않고 전달)"""
+    
+    # 속성 이름 -> data/ 디렉토리의 CSV 파일
+    FILES = {
+        'cancer_data': 'cancer_by_type_gender.csv',
+        'age_data': 'cancer_by_age.csv',
+        'regional_data': 'cancer_by_region.csv'
+    }
+    
+    # 속성 이름 -> (키 컬럼, 순위를 매기는 지표 컬럼)
+    RANKED = {
+        'cancer_data': ('암종', ['총계', '남성', '여성']),
+        'age_data': ('연령대', ['발생수']),
+        'regional_data': ('지역', ['발생수'])
+    }
+    
+    def __init__(self, cancer_data, age_data, regional_data):
+        self.cancer_data = cancer_data
+        self.age_data = age_data
+        self.regional_data = regional_data
+        self._rankings = None
+        
+    @classmethod
+    def from_csv(cls, data_dir='data', cache=True):
+        """
+        data/ 디렉토리의 CSV에서 로드 (파일이 없으면 FileNotFoundError)
+        cache=True면 data/.columnar/의 Parquet 사본을 사용 (CSV가 바뀌면 다시 만듦)
+        """
+        data_dir = Path(data_dir)
+        if not cache:
+            return cls(**{attr: compact_frame(pd.read_csv(data_dir / filename))
+                          for attr, filename in cls.FILES.items()})
+        columnar = ColumnarCache(data_dir / '.columnar')
+        return cls(**{attr: columnar.read_csv(data_dir / filename) for attr, filename in cls.FILES.items()})
+    
+    @classmethod
+    def from_store(cls, dataset_dir='data/dataset', years=None):
+        """
+        연도별 파티션 데이터셋에서 years(없으면 전체)를 읽어 기간 합계로 로드
+        (CancerDataset, 읽은 연도 목록) 반환 (파티션이 없으면 FileNotFoundError)
+        """
+        store = YearPartitionedStore(dataset_dir)
+        frames = {table: store.read(table, years) for table in DATASET_TABLES}
+        read_years = sorted(frames[DATASET_TABLES[0]][YEAR_COLUMN].unique().tolist())
+        summed = [frames[table].drop(columns=[YEAR_COLUMN]).groupby(key, sort=False, as_index=False).sum()
+                  for table, (key, _) in zip(DATASET_TABLES, cls.RANKED.values())]
+        return cls(*summed).compact(), read_years
+    
+    def to_csv(self, data_dir='data', workers=3):
+        """
+        data/ 디렉토리에 CSV로 저장 (세 파일을 동시에 쓰고 각각 원자적으로 교체, data/manifest.json 갱신)
+        다음 단계가 그대로 읽으므로 압축하지 않음
+        """
+        writer = OutputWriter(data_dir, workers=workers)
+        for attr, filename in self.FILES.items():
+            writer.add_csv(filename, getattr(self, attr))
+        return writer.commit()
+    
+    def compact(self):
+        """schema 규칙으로 컬럼 타입을 줄인 새 CancerDataset (레이블은 범주형, 건수는 작은 정수)"""
+        return CancerDataset(*(compact_frame(getattr(self, attr)) for attr in self.FILES))
+    
+    def rankings(self):
+        """
+        속성 이름 -> RankingIndex (처음 호출할 때 한 번 만들고 재사용)
+        같은 CancerDataset을 받은 분석기, 보고서, 차트가 정렬 결과를 공유
+        """
+        if self._rankings is None:
+            self._rankings = {attr: RankingIndex(getattr(self, attr), key, metrics)
+                              for attr, (key, metrics) in self.RANKED.items()}
+        return self._rankings
+    
+    def tables(self):
+        """표 이름(CSV 파일 이름에서 확장자 제외) -> DataFrame"""
+        return {Path(filename).stem: getattr(self, attr) for attr, filename in self.FILES.items()}
+    
+    def frames(self):
+        """
+        (cancer_data, age_data, regional_data)의 얕은 복사본
+        데이터는 공유하고, 받는 쪽에서 컬럼을 추가해도 원본에는 영향이 없음
+        """
+        return tuple(getattr(self, attr).copy(deep=False) for attr in self.FILES)
@@ -0,0 +1,62 @@
+import os
+import threading
+from pathlib import Path
+
+from lazy_import import lazy_import
+
+pd = lazy_import('pandas')
+
+# 연도 파티션 컬럼 (디렉토리 이름: 연도=2020)
+YEAR_COLUMN = '연도'
+
+# 저장소에 보관하는 테이블 (save_data의 CSV 파일명과 동일)
+DATASET_TABLES = ('cancer_by_type_gender', 'cancer_by_age', 'cancer_by_region')
+
+
+class YearPartitionedStore:
+    """연도별로 파티션된 Parquet 데이터셋 (data/dataset/<테이블>/연도=<연도>/part-0.parquet)"""
+    
+    def __init__(self, root='data/dataset'):
+        self.root = Path(root)
+        
+    def _partition_path(self, table, year):
+        return self.root / table / f"{YEAR_COLUMN}={year}" / 'part-0.parquet'
+    
+    def exists(self):
+        """저장된 파티션이 하나라도 있는지 확인"""
+        return bool(self.years())
+    
+    def write_year(self, year, tables):
+        """한 연도의 테이블들을 파티션으로 저장 (같은 연도는 덮어씀)"""
+        for table, df in tables.items():
+            path = self._partition_path(table, year)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            
+            # 연도는 디렉토리 이름에 있으므로 파일에는 저장하지 않음
+            frame = df.drop(columns=[YEAR_COLUMN], errors='ignore')
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            frame.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, path)
+    
+    def years(self, table=DATASET_TABLES[0]):
+        """저장된 연도 목록"""
+        table_dir = self.root / table
+        if not table_dir.exists():
+            return []
+        prefix = f"{YEAR_COLUMN}="
+        return sorted(int(p.name[len(prefix):]) for p in table_dir.iterdir()
+                      if p.name.startswith(prefix) and (p / 'part-0.parquet').exists())
+    
+    def read(self, table, years=None, columns=None):
+        """필요한 연도와 컬럼만 읽어 하나의 DataFrame으로 반환 (연도 컬럼 포함)"""
+        available = self.years(table)
+        selected = available if years is None else [y for y in available if y in set(years)]
+        if not selected:
+            raise FileNotFoundError(f"No partitions for {table} (years={years})")
+        
+        frames = []
+        for year in selected:
+            frame = pd.read_parquet(self._partition_path(table, year), columns=columns)
+            frame.insert(0, YEAR_COLUMN, year)
+            frames.append(frame)
+        return pd.concat(frames, ignore_index=True)
@@ -0,0 +1,181 @@
+from html import unescape
+import re
+
+# 통계 표에서 찾는 암종
+CANCER_NAMES = ('위암', '폐암', '간암', '대장암', '유방암', '갑상선암', '전립선암', '자궁경부암')
+
+# 헤더 셀 텍스트 -> 컬럼 이름
+HEADER_ALIASES = {
+    '남성': '남성', '남자': '남성', '남': '남성',
+    '여성': '여성', '여자': '여성', '여': '여성',
+    '총계': '총계', '합계': '총계', '계': '총계', '전체': '총계', '발생수': '총계',
+}
+
+# 헤더 없이 숫자 셀만 있는 행의 컬럼 순서
+DEFAULT_COLUMNS = ('남성', '여성', '총계')
+
+# 셀 하나에 보관하는 최대 글자 수 (거대한 셀이 있어도 메모리가 늘지 않도록)
+MAX_CELL_CHARS = 256
+
+# 행 하나에 보관하는 최대 글자 수 (넘는 부분은 버림)
+MAX_ROW_CHARS = 64 * 1024
+
+# 조각 끝에서 다음 조각으로 넘기는 미완성 태그/텍스트의 최대 길이 (넘으면 그대로 처리)
+MAX_PENDING_CHARS = 64 * 1024
+
+# 주석 또는 행/표/스크립트 태그 (셀 태그는 필요한 행에서만 나눔)
+TOKEN_RE = re.compile(r'<!--.*?-->|<(/?)(table|tr|script|style)\b[^>]*>', re.S | re.I)
+CELL_RE = re.compile(r'<(t[dh])\b[^>]*>', re.I)
+MARKUP_RE = re.compile(r'<[^>]*>')
+
+
+def parse_count(text):
+    """'12,345' 같은 셀 텍스트를 정수로 (숫자가 아니면 None)"""
+    text = text.strip().replace(',', '')
+    return int(text) if text.isdigit() else None
+
+
+class StatisticsTableParser:
+    """
+    HTML을 조각 단위로 받아(feed) 한 번에 훑으며 암종 행의 남성/여성/총계 숫자를 추출
+    행/표 태그만 정규식 하나로 토큰화하고, 암종 이름이나 헤더 단어가 있는 행만 셀로 나눔
+    현재 행과 조각 경계에 걸친 미완성 태그만 보관하므로 메모리는 페이지 크기와 무관
+    헤더 행에서 남성/여성/총계 컬럼 위치를 찾고, 없으면 숫자 셀을 남성, 여성, 총계 순으로 봄
+    암종 셀은 '위암(C16)', '위암 (남 기준)'처럼 이름이 포함된 셀도 인정 (정확히 같은 셀 우선)
+    같은 암종 행이 여러 번 나오면 처음 나온 행을 사용
+    본문, 행, 주석, 스크립트 어디든 이름이 나온 암종은 mentioned에 기록
+    """
+    
+    def __init__(self, cancer_names=CANCER_NAMES):
+        self.cancer_names = tuple(cancer_names)
+        self.rows = {}
+        self.mentioned = set()
+        self._keywords = ('암',) + tuple(HEADER_ALIASES)
+        self._pending = ''
+        self._columns = None
+        self._row = None
+        self._row_chars = 0
+        self._skip = None
+    
+    def feed(self, chunk):
+        data = self._pending + chunk
+        # 마지막 완성된 태그 뒤(미완성 태그, 조각 경계에서 잘린 텍스트)는 다음 조각과 합쳐 처리
+        end = data.rfind('>') + 1
+        comment = data.rfind('<!--', 0, end)
+        if comment != -1 and data.find('-->', comment + 4) == -1:
+            end = comment
+        if len(data) - end > MAX_PENDING_CHARS:
+            end = len(data)
+        self._pending = data[end:]
+        self._scan(data, end)
+    
+    def close(self):
+        data, self._pending = self._pending, ''
+        self._scan(data, len(data))
+        self._finish_row()
+    
+    def _scan(self, data, end):
+        position = 0
+        for match in TOKEN_RE.finditer(data, 0, end):
+            if match.start() > position:
+                self._text(data[position:match.start()])
+            position = match.end()
+            self._mention(match.group())
+            closing, tag = match.group(1, 2)
+            if tag is not None:
+                self._tag(tag.lower(), closing == '/')
+        if end > position:
+            self._text(data[position:end])
+    
+    def _tag(self, tag, closing):
+        if self._skip is not None:
+            # script/style 안의 태그 모양 문자열은 무시
+            if closing and tag == self._skip:
+                self._skip = None
+            return
+        if tag in ('script', 'style'):
+            if not closing:
+                self._skip = tag
+            return
+        self._finish_row()
+        if tag == 'table':
+            self._columns = None
+        elif not closing:
+            self._row = []
+            self._row_chars = 0
+    
+    def _mention(self, text):
+        if '암' in text:
+            for name in self.cancer_names:
+                if name in text:
+                    self.mentioned.add(name)
+    
+    def _text(self, text):
+        self._mention(text)
+        if self._skip is None and self._row is not None and self._row_chars < MAX_ROW_CHARS:
+            self._row.append(text)
+            self._row_chars += len(text)
+    
+    def _cell_name(self, cell):
+        """셀에 들어 있는 암종 이름 (여러 개면 셀에서 먼저 나오는 이름, 없으면 None)"""
+        if '암' not in cell:
+            return None
+        found = [(cell.find(name), -len(name), name) for name in self.cancer_names if name in cell]
+        return min(found)[2] if found else None
+    
+    def _finish_row(self):
+        row, self._row = self._row, None
+        if not row:
+            return
+        html = ''.join(row)
+        # 암종 이름도 헤더 단어도 없는 행은 셀로 나누지 않음
+        if not any(keyword in html for keyword in self._keywords):
+            return
+        
+        parts = CELL_RE.split(html)
+        header_row = any(tag.lower() == 'th' for tag in parts[1::2])
+        cells = []
+        for text in parts[2::2]:
+            if '<' in text:
+                text = MARKUP_RE.sub('', text)
+            if '&' in text:
+                text = unescape(text)
+            cells.append(text.strip()[:MAX_CELL_CHARS])
+        self._row_cells(cells, header_row)
+    
+    def _row_cells(self, cells, header_row):
+        headers = {index: HEADER_ALIASES[cell] for index, cell in enumerate(cells) if cell in HEADER_ALIASES}
+        if headers and (header_row or self._columns is None):
+            self._columns = headers
+            return
+        
+        name = next((cell for cell in cells if cell in self.cancer_names), None)
+        if name is None:
+            name = next(filter(None, map(self._cell_name, cells)), None)
+        if name is None:
+            return
+        if name in self.rows:
+            return
+        if self._columns:
+            values = {column: parse_count(cells[index]) for index, column in self._columns.items() if index < len(cells)}
+        else:
+            numbers = [value for value in map(parse_count, cells) if value is not None]
+            values = dict(zip(DEFAULT_COLUMNS if len(numbers) > 1 else ('총계',), numbers))
+        values = {column: value for column, value in values.items() if value is not None}
+        if values:
+            self.rows[name] = values
+
+
+def extract_cancer_tables(source, cancer_names=CANCER_NAMES, chunk_size=64 * 1024):
+    """
+    HTML 문자열 또는 문자열 조각의 iterable에서 암종별 숫자 행 추출
+    반환값: (암종 -> {'남성', '여성', '총계' 중 찾은 값}, 본문에서 언급된 암종 집합)
+    """
+    parser = StatisticsTableParser(cancer_names)
+    chunks = source
+    if isinstance(source, str):
+        chunks = (source[i:i + chunk_size] for i in range(0, len(source), chunk_size))
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.close()
+    return parser.rows, parser.mentioned
@@ -0,0 +1,111 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+
+class CacheMissError(Exception):
+    """오프라인 모드에서 캐시에 응답이 없을 때 발생"""
+
+
+class ResponseCache:
+    """URL과 파라미터 기준의 디스크 응답 캐시 (TTL 및 용량 기반 LRU 정리)"""
+    
+    def __init__(self, cache_dir='.cache/http', ttl=24 * 3600, max_bytes=50 * 1024 * 1024):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self.counters = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+        
+    def _key(self, url, params):
+        """URL과 정렬된 파라미터로 캐시 키 생성 (인증키는 해시 안에만 남음)"""
+        raw = json.dumps([url, sorted((params or {}).items())], ensure_ascii=False)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+    
+    def _path(self, url, params):
+        return self.cache_dir / f"{self._key(url, params)}.json"
+    
+    def record(self, counter):
+        """적중/미스 카운터 증가"""
+        with self._lock:
+            self.counters[counter] += 1
+    
+    def stats(self):
+        """카운터 사본 반환"""
+        with self._lock:
+            return dict(self.counters)
+    
+    def get(self, url, params):
+        """저장된 항목 반환 (없으면 None), 조회 시 LRU 순서 갱신"""
+        path = self._path(url, params)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+            os.utime(path)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        return entry
+    
+    def is_fresh(self, entry):
+        """TTL 이내에 저장(또는 재검증)된 항목인지 확인"""
+        return time.time() - entry['stored_at'] < self.ttl
+    
+    def conditional_headers(self, entry):
+        """재검증용 조건부 요청 헤더"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+    
+    def store(self, url, params, content, headers):
+        """응답 본문과 검증자(ETag/Last-Modified) 저장"""
+        entry = {
+            'url': url,
+            'stored_at': time.time(),
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'content': content
+        }
+        self._write(self._path(url, params), entry)
+        self.record('stores')
+        self._evict()
+        
+    def refresh(self, url, params, entry, headers):
+        """304 응답 후 저장 시각과 검증자 갱신"""
+        entry['stored_at'] = time.time()
+        entry['etag'] = headers.get('ETag', entry.get('etag'))
+        entry['last_modified'] = headers.get('Last-Modified', entry.get('last_modified'))
+        self._write(self._path(url, params), entry)
+        
+    def _write(self, path, entry):
+        # 동시 요청 중에도 반쯤 쓰인 파일이 읽히지 않도록 임시 파일 후 교체
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        
+    def _evict(self):
+        """전체 용량이 max_bytes를 넘으면 가장 오래 사용하지 않은 항목부터 삭제"""
+        with self._lock:
+            files = []
+            for path in self.cache_dir.glob('*.json'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((stat.st_mtime, stat.st_size, path))
+            
+            total = sum(size for _, size, _ in files)
+            for _, size, path in sorted(files):
+                if total <= self.max_bytes:
+                    break
+                path.unlink(missing_ok=True)
+                total -= size
+                self.counters['evictions'] += 1
@@ -0,0 +1,173 @@
+from contextlib import contextmanager
+import cProfile
+import functools
+import json
+import os
+from pathlib import Path
+import sys
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+def _read_proc_io():
+    """프로세스 누적 읽기/쓰기 바이트 (/proc/self/io의 rchar, wchar; 파일·소켓 포함), 없으면 None"""
+    try:
+        with open('/proc/self/io') as f:
+            fields = dict(line.split(': ') for line in f.read().splitlines())
+        return int(fields['rchar']), int(fields['wchar'])
+    except (OSError, KeyError, ValueError):
+        return None
+
+def _current_rss():
+    """현재 RSS(바이트), /proc이 없으면 None"""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return None
+
+def _max_rss():
+    """프로세스 시작 이후 최대 RSS(바이트) - ru_maxrss 단위는 Linux KB, macOS 바이트"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+class Tracer:
+    """
+    구간(span)별 벽시계 시간, CPU 시간, RSS, 읽기/쓰기 바이트를 기록해 Chrome trace 형식으로 저장
+    비활성 상태에서는 측정하지 않음 (계측된 메서드는 검사 한 번만 추가됨)
+    I/O 바이트는 프로세스 전체 카운터이므로 스레드가 겹치는 구간에는 다른 스레드의 I/O도 포함됨
+    """
+    
+    def __init__(self):
+        self.enabled = False
+        self.events = []
+        self._lock = threading.Lock()
+        self._origin = time.perf_counter()
+    
+    def enable(self):
+        self.enabled = True
+        self._origin = time.perf_counter()
+    
+    @contextmanager
+    def span(self, name, category='function'):
+        """with 블록 하나를 구간으로 기록"""
+        if not self.enabled:
+            yield
+            return
+        
+        rss_before = _current_rss()
+        io_before = _read_proc_io()
+        cpu_before = time.thread_time()
+        process_cpu_before = time.process_time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            cpu = time.thread_time() - cpu_before
+            process_cpu = time.process_time() - process_cpu_before
+            max_rss = _max_rss()
+            io_after = _read_proc_io()
+            rss_after = _current_rss()
+            
+            # cpu_ms: 이 스레드의 CPU 시간, process_cpu_ms: 모든 스레드 합계
+            args = {'cpu_ms': round(cpu * 1000, 3), 'process_cpu_ms': round(process_cpu * 1000, 3)}
+            if max_rss is not None:
+                args['max_rss_mb'] = round(max_rss / 2**20, 1)
+            if rss_after is not None:
+                args['rss_mb'] = round(rss_after / 2**20, 1)
+                args['rss_delta_mb'] = round((rss_after - rss_before) / 2**20, 1)
+            if io_before is not None and io_after is not None:
+                args['read_bytes'] = io_after[0] - io_before[0]
+                args['write_bytes'] = io_after[1] - io_before[1]
+            
+            event = {
+                'name': name, 'cat': category, 'ph': 'X',
+                'ts': round((start - self._origin) * 1e6, 1),
+                'dur': round((end - start) * 1e6, 1),
+                'pid': os.getpid(), 'tid': threading.get_ident(),
+                'args': args
+            }
+            with self._lock:
+                self.events.append(event)
+    
+    def save(self, path):
+        """Chrome trace 형식 JSON 저장 (chrome://tracing 또는 ui.perfetto.dev에서 열기)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            events = list(self.events)
+        trace = {
+            'traceEvents': events,
+            'displayTimeUnit': 'ms',
+            'otherData': {'argv': sys.argv, 'pid': os.getpid()}
+        }
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, ensure_ascii=False)
+    
+    def print_summary(self, category=None, limit=15):
+        """이름별 호출 수와 누적 시간 (category를 주면 해당 구간만)"""
+        totals = {}
+        for event in self.events:
+            if category is not None and event['cat'] != category:
+                continue
+            count, wall, cpu = totals.get(event['name'], (0, 0.0, 0.0))
+            totals[event['name']] = (count + 1, wall + event['dur'] / 1e6, cpu + event['args']['cpu_ms'] / 1e3)
+        
+        print(f"  {'span':<56} {'calls':>6} {'wall(s)':>9} {'cpu(s)':>9}")
+        for name, (count, wall, cpu) in sorted(totals.items(), key=lambda item: -item[1][1])[:limit]:
+            print(f"  {name:<56} {count:>6} {wall:>9.3f} {cpu:>9.3f}")
+
+# 프로세스 전역 트레이서 (main.py --trace로 활성화)
+tracer = Tracer()
+
+def span(name, category='function'):
+    return tracer.span(name, category)
+
+def traced(name=None, category='function'):
+    """함수 호출을 구간으로 기록하는 데코레이터"""
+    def decorate(func):
+        span_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(span_name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorate
+
+def instrumented(category):
+    """클래스 데코레이터: 클래스에 정의된 모든 메서드(__init__ 외 특수 메서드 제외)를 traced로 감쌈"""
+    def decorate(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith('__') and attr != '__init__':
+                continue
+            if isinstance(value, (staticmethod, classmethod)):
+                setattr(cls, attr, type(value)(traced(f"{cls.__name__}.{attr}", category)(value.__func__)))
+            elif callable(value) and not isinstance(value, type):
+                setattr(cls, attr, traced(f"{cls.__name__}.{attr}", category)(value))
+        return cls
+    return decorate
+
+@contextmanager
+def profiled(path):
+    """path가 있으면 블록을 cProfile로 실행하고 .prof 파일로 저장 (snakeviz, pstats로 확인)"""
+    if path is None:
+        yield
+        return
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield
+    finally:
+        profiler.disable()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        profiler.dump_stats(path)
@@ -0,0 +1,63 @@
+import importlib
+import sys
+import threading
+import time
+
+# 모듈 이름 -> 최초 import에 걸린 시간(초)
+_import_times = {}
+_lock = threading.RLock()
+
+
+class LazyModule:
+    """처음 속성에 접근할 때 실제로 import 하는 모듈 대리 객체"""
+    
+    def __init__(self, name, on_import=None):
+        self._name = name
+        self._on_import = on_import
+        self._module = None
+        
+    def _load(self):
+        if self._module is None:
+            with _lock:
+                if self._module is None:
+                    already_loaded = self._name in sys.modules
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    if not already_loaded:
+                        _import_times[self._name] = time.perf_counter() - start
+                    if self._on_import is not None:
+                        self._on_import(module)
+                    self._module = module
+        return self._module
+    
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+    
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name, on_import=None):
+    """
+    무거운 라이브러리를 사용 시점까지 늦게 import
+    on_import: 실제 import 직후 한 번 호출할 함수 (스타일 설정 등)
+    """
+    return LazyModule(name, on_import)
+
+
+def import_times():
+    """지금까지 지연 import된 모듈과 소요 시간(초)"""
+    with _lock:
+        return dict(_import_times)
+
+
+def print_import_times():
+    """지연 import 소요 시간 출력 (python -X importtime 요약과 비슷한 형식)"""
+    times = import_times()
+    print("Lazy import times:")
+    if not times:
+        print("  (no heavy modules imported)")
+    for name, seconds in sorted(times.items(), key=lambda item: -item[1]):
+        print(f"  {seconds * 1000:9.1f} ms  {name}")
+    print(f"  {sum(times.values()) * 1000:9.1f} ms  total")
@@ -0,0 +1,85 @@
+from collections import OrderedDict
+import functools
+import hashlib
+import inspect
+import threading
+
+from lazy_import import lazy_import
+
+pd = lazy_import('pandas')
+
+def frame_fingerprint(df):
+    """데이터프레임 내용(컬럼 이름/타입 + 값)의 지문"""
+    digest = hashlib.sha1()
+    digest.update(repr([(str(c), str(t)) for c, t in df.dtypes.items()]).encode('utf-8'))
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()[:16]
+
+class AnalysisMemo:
+    """분석 결과 LRU 캐시 (키: 메서드 이름 + 의존 데이터 지문 + 파라미터)"""
+    
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get_or_compute(self, key, compute):
+        """캐시에 있으면 반환, 없으면 계산해서 저장"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        
+        # 계산은 잠금 밖에서 (같은 키를 동시에 계산하면 결과가 같으므로 나중 값으로 덮어씀)
+        value = compute()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+    
+    def invalidate(self, dependency=None):
+        """dependency 지문에 의존하는 항목만 (None이면 전체) 삭제"""
+        with self._lock:
+            if dependency is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if dependency in k[1]]:
+                del self._entries[key]
+    
+    def stats(self):
+        return {'entries': len(self._entries), 'hits': self.hits,
+                'misses': self.misses, 'evictions': self.evictions}
+
+def memoized(*dependencies):
+    """
+    분석 메서드 메모이제이션 데코레이터
+    dependencies: 결과가 의존하는 입력 이름 (self.dependency_fingerprints()의 키)
+    기본값을 채운 인자로 키를 만들므로 f()와 f(10)은 같은 항목을 가리킴
+    반환값은 호출자끼리 공유되므로 수정하지 말 것
+    """
+    def decorate(method):
+        signature = inspect.signature(method)
+        
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = tuple((name, value) for name, value in bound.arguments.items() if name != 'self')
+            fingerprints = self.dependency_fingerprints()
+            key = (method.__name__, tuple(fingerprints[d] for d in dependencies), params)
+            try:
+                hash(key)
+            except TypeError:
+                # 배열/데이터프레임 같은 해시 불가능한 인자는 캐시하지 않음
+                return method(self, *args, **kwargs)
+            return self.memo.get_or_compute(key, lambda: method(self, *args, **kwargs))
+        return wrapper
+    return decorate
@@ -0,0 +1,269 @@
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+
+# 매니페스트 형식이 바뀌면 올림
+MANIFEST_VERSION = 1
+MANIFEST_NAME = 'manifest.json'
+
+# 압축 방식 -> 파일 확장자
+COMPRESSION_SUFFIXES = {'gzip': '.gz', 'zstd': '.zst'}
+
+
+def _zstd():
+    """zstd 모듈 (Python 3.14+의 compression.zstd, 없으면 zstandard 패키지)"""
+    try:
+        from compression import zstd
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        raise ImportError("zstd compression needs Python 3.14+ or the 'zstandard' package") from None
+
+
+def check_compression(compression):
+    """압축 방식 이름 확인 (지원하지 않거나 모듈이 없으면 ValueError/ImportError)"""
+    if compression is None:
+        return
+    if compression not in COMPRESSION_SUFFIXES:
+        raise ValueError(f"Unknown compression: {compression} (choose from {', '.join(COMPRESSION_SUFFIXES)})")
+    if compression == 'zstd':
+        _zstd()
+
+
+def compress_bytes(data, compression):
+    if compression == 'gzip':
+        # mtime=0: 같은 내용이면 같은 바이트 (체크섬 비교 가능)
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if compression == 'zstd':
+        return _zstd().compress(data)
+    return data
+
+
+class _HashingFile:
+    """쓰는 바이트의 크기와 SHA-256을 세면서 파일에 기록"""
+    
+    def __init__(self, f):
+        self._file = f
+        self.size = 0
+        self.sha256 = hashlib.sha256()
+    
+    def write(self, data):
+        self.size += len(data)
+        self.sha256.update(data)
+        return self._file.write(data)
+    
+    def flush(self):
+        self._file.flush()
+
+
+class _CountingFile:
+    """쓰는 바이트 수(압축 전)를 세는 write 전용 래퍼"""
+    
+    def __init__(self, f):
+        self._file = f
+        self.size = 0
+    
+    def write(self, data):
+        self.size += len(data)
+        return self._file.write(data)
+
+
+def _compressing_writer(f, compression):
+    """f에 압축해 쓰는 파일 객체 (닫아도 f는 닫지 않음)"""
+    if compression == 'gzip':
+        return gzip.GzipFile(fileobj=f, mode='wb', compresslevel=6, mtime=0)
+    zstd = _zstd()
+    if hasattr(zstd, 'ZstdFile'):
+        return zstd.ZstdFile(f, 'wb')
+    return zstd.ZstdCompressor().stream_writer(f, closefd=False)
+
+
+def read_output(path):
+    """OutputWriter가 쓴 파일의 원래 바이트 (확장자가 .gz/.zst면 압축 해제)"""
+    path = Path(path)
+    data = path.read_bytes()
+    if path.suffix == '.gz':
+        return gzip.decompress(data)
+    if path.suffix == '.zst':
+        return _zstd().decompress(data)
+    return data
+
+
+class OutputWriter:
+    """
+    산출물 여러 개를 모았다가(add) 한 번에 쓰는 출력기 (commit)
+    각 파일은 같은 디렉토리의 임시 파일에 쓰고 fsync한 뒤 os.replace로 교체하므로
+    읽는 쪽에서는 이전 파일 또는 완성된 새 파일만 보임
+    서로 독립적인 산출물은 스레드 풀에서 동시에 직렬화/압축/기록하고,
+    모두 끝나면 root/manifest.json에 파일별 크기와 SHA-256을 기록
+    다른 압축 설정으로 썼던 같은 이름의 이전 파일(예: report.json.gz 대신 쓴 report.json)은 지움
+    """
+    
+    def __init__(self, root, compression=None, workers=4, manifest=MANIFEST_NAME):
+        check_compression(compression)
+        self.root = Path(root)
+        self.compression = compression
+        self.workers = workers
+        self.manifest = manifest
+        self._artifacts = {}
+        self._streamed = {}
+        self._lock = threading.Lock()
+    
+    def output_path(self, name, compress=True):
+        """root 기준 이름 -> 실제로 쓰는 경로 (압축하면 확장자 추가)"""
+        suffix = COMPRESSION_SUFFIXES.get(self.compression, '') if compress else ''
+        return self.root / f"{name}{suffix}"
+    
+    def add(self, name, render, compress=True):
+        """
+        산출물 추가 (render()는 파일 내용 바이트를 반환, commit 때 작업 스레드에서 호출됨)
+        compress=False면 writer의 압축 설정과 관계없이 원본 그대로 씀
+        """
+        self._artifacts[name] = (render, compress)
+        return self.output_path(name, compress)
+    
+    def add_text(self, name, text, encoding='utf-8', compress=True):
+        return self.add(name, lambda: text.encode(encoding), compress)
+    
+    def add_json(self, name, value, compress=True, **options):
+        options = {'ensure_ascii': False, 'indent': 2, **options}
+        return self.add(name, lambda: json.dumps(value, **options).encode('utf-8'), compress)
+    
+    def add_csv(self, name, frame, encoding='utf-8-sig', compress=True):
+        return self.add(name, lambda: frame.to_csv(index=False).encode(encoding), compress)
+    
+    @contextmanager
+    def stream(self, name, compress=True):
+        """
+        큰 산출물을 조각 단위로 쓰는 파일 객체 (write(bytes)만 지원)
+        with 블록이 정상 종료되면 원자적으로 교체하고 매니페스트 항목은 다음 commit 때 기록,
+        예외가 나면 임시 파일을 지우고 기존 파일은 그대로 둠
+        """
+        compression = self.compression if compress else None
+        path = self.output_path(name, compress)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                hashed = _HashingFile(f)
+                target = hashed if compression is None else _compressing_writer(hashed, compression)
+                raw = _CountingFile(target)
+                try:
+                    yield raw
+                finally:
+                    if target is not hashed:
+                        target.close()
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._streamed[path.relative_to(self.root).as_posix()] = {
+                'size': hashed.size,
+                'sha256': hashed.sha256.hexdigest(),
+                'compression': compression,
+                'raw_size': raw.size,
+            }
+    
+    def _write(self, name, render, compress):
+        """한 산출물을 임시 파일에 쓰고 원자적으로 교체, 매니페스트 항목 반환"""
+        raw = render()
+        compression = self.compression if compress else None
+        data = compress_bytes(raw, compression)
+        path = self.output_path(name, compress)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return path.relative_to(self.root).as_posix(), {
+            'size': len(data),
+            'sha256': hashlib.sha256(data).hexdigest(),
+            'compression': compression,
+            'raw_size': len(raw),
+        }
+    
+    def commit(self):
+        """
+        모은 산출물을 모두 쓰고 매니페스트 갱신 (파일 경로 -> 매니페스트 항목 반환)
+        하나라도 실패하면 매니페스트는 그대로 두고 첫 예외를 다시 발생시킴
+        """
+        artifacts, self._artifacts = self._artifacts, {}
+        with self._lock:
+            entries, self._streamed = self._streamed, {}
+        if not artifacts and not entries:
+            return {}
+        if artifacts:
+            workers = max(1, min(self.workers, len(artifacts)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(self._write, name, render, compress)
+                           for name, (render, compress) in artifacts.items()]
+            entries.update(future.result() for future in futures)
+        self._remove_stale_variants(entries)
+        if self.manifest:
+            self._update_manifest(entries)
+        return entries
+    
+    def _remove_stale_variants(self, entries):
+        """방금 쓴 파일과 이름은 같고 압축 확장자만 다른 파일 삭제 (남겨 두면 읽는 쪽이 이전 내용을 봄)"""
+        for name, entry in entries.items():
+            suffix = COMPRESSION_SUFFIXES.get(entry['compression'], '')
+            base = name[:len(name) - len(suffix)]
+            for variant in [base] + [base + other for other in COMPRESSION_SUFFIXES.values()]:
+                if variant != name and variant not in entries:
+                    (self.root / variant).unlink(missing_ok=True)
+    
+    def read_manifest(self):
+        try:
+            with open(self.root / self.manifest, 'r', encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {'version': MANIFEST_VERSION, 'files': {}}
+        if manifest.get('version') != MANIFEST_VERSION:
+            return {'version': MANIFEST_VERSION, 'files': {}}
+        return manifest
+    
+    def _update_manifest(self, entries):
+        """기존 매니페스트에 새 항목을 합쳐 기록 (더 이상 없는 파일의 항목은 제거)"""
+        manifest = self.read_manifest()
+        files = {name: entry for name, entry in manifest['files'].items() if (self.root / name).exists()}
+        files.update(entries)
+        manifest['files'] = dict(sorted(files.items()))
+        
+        path = self.root / self.manifest
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+    
+    def verify(self):
+        """매니페스트와 실제 파일 비교: 크기나 SHA-256이 다르거나 없는 파일 목록"""
+        mismatched = []
+        for name, entry in self.read_manifest()['files'].items():
+            path = self.root / name
+            try:
+                data = path.read_bytes()
+            except FileNotFoundError:
+                mismatched.append(name)
+                continue
+            if len(data) != entry['size'] or hashlib.sha256(data).hexdigest() != entry['sha256']:
+                mismatched.append(name)
+        return mismatched
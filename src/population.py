@@ -0,0 +1,109 @@
+import hashlib
+import threading
+from pathlib import Path
+
+from dataset import AGE_BANDS, REGIONS, SEXES
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+# 기본 인구 참조표 (연도 × 지역 × 성별 × 연령대, 합계 행은 성별/연령대 '계')
+DEFAULT_POPULATION_PATH = Path(__file__).resolve().parent.parent / 'data' / 'population.csv'
+
+# 성별/연령대 합계를 나타내는 레이블
+TOTAL = '계'
+
+_tables = {}
+_lock = threading.Lock()
+
+
+class PopulationTable:
+    """
+    연도 × 지역 × 성별 × 연령대 인구 참조표
+    NumPy 4차원 배열과 정수 인덱스로 보관해 조회는 O(1), 여러 지역 조회는 배열 인덱싱 한 번으로 처리
+    """
+    
+    def __init__(self, years, regions, sexes, ages, values, version):
+        self.years = list(years)
+        self.regions = list(regions)
+        self.sexes = list(sexes)
+        self.ages = list(ages)
+        self.values = values
+        self.version = version
+        
+        self.year_index = {year: i for i, year in enumerate(self.years)}
+        self.region_index = {region: i for i, region in enumerate(self.regions)}
+        self.sex_index = {sex: i for i, sex in enumerate(self.sexes)}
+        self.age_index = {age: i for i, age in enumerate(self.ages)}
+        self._region_lookup = pd.Index(self.regions)
+        
+    @classmethod
+    def from_frame(cls, df, version):
+        """연도/지역/성별/연령대/인구 컬럼의 긴 형식 표로 생성 (없는 조합은 NaN)"""
+        years = sorted(int(year) for year in df['연도'].unique())
+        regions = REGIONS + [r for r in df['지역'].unique() if r not in set(REGIONS)]
+        sexes = [TOTAL] + SEXES + [s for s in df['성별'].unique() if s not in {TOTAL, *SEXES}]
+        ages = [TOTAL] + AGE_BANDS + [a for a in df['연령대'].unique() if a not in {TOTAL, *AGE_BANDS}]
+        
+        values = np.full((len(years), len(regions), len(sexes), len(ages)), np.nan)
+        codes = tuple(
+            pd.Index(labels).get_indexer(column)
+            for labels, column in ((years, df['연도'].astype(int)), (regions, df['지역']),
+                                   (sexes, df['성별']), (ages, df['연령대']))
+        )
+        values[codes] = df['인구'].to_numpy(dtype=float)
+        return cls(years, regions, sexes, ages, values, version)
+    
+    @classmethod
+    def load(cls, path=DEFAULT_POPULATION_PATH):
+        """CSV에서 로드 (버전은 파일 내용 해시)"""
+        path = Path(path)
+        version = hashlib.sha256(path.read_bytes()).hexdigest()[:12]
+        df = pd.read_csv(path, encoding='utf-8-sig')
+        return cls.from_frame(df, version=f"{path.name}@{version}")
+    
+    def resolve_year(self, year):
+        """표에 있는 연도 중 가장 가까운 연도 (해당 연도 인구가 없을 때 대체)"""
+        if year in self.year_index:
+            return year
+        return min(self.years, key=lambda available: (abs(available - year), -available))
+    
+    def get(self, year, region, sex=TOTAL, age=TOTAL):
+        """단일 값 조회 (O(1))"""
+        return self.values[self.year_index[self.resolve_year(year)], self.region_index[region],
+                           self.sex_index[sex], self.age_index[age]]
+    
+    def lookup(self, regions, years, sex=TOTAL, age=TOTAL):
+        """
+        지역 배열의 인구를 한 번에 조회 (알 수 없는 지역은 NaN)
+        years가 여러 개면 연도별 인구를 합산 (인년, person-years)
+        """
+        if np.ndim(years) == 0:
+            years = [years]
+        year_codes = [self.year_index[self.resolve_year(year)] for year in years]
+        region_codes = self._region_lookup.get_indexer(regions)
+        
+        per_year = self.values[year_codes, :, self.sex_index[sex], self.age_index[age]]
+        result = per_year.sum(axis=0)[region_codes]
+        result[region_codes < 0] = np.nan
+        return result
+    
+    def to_frame(self, include_totals=False):
+        """긴 형식 표 (연령표준화 등에 사용, 기본값은 성별/연령대 합계 행 제외)"""
+        index = pd.MultiIndex.from_product([self.years, self.regions, self.sexes, self.ages],
+                                           names=['연도', '지역', '성별', '연령대'])
+        frame = pd.DataFrame({'인구': self.values.reshape(-1)}, index=index).reset_index()
+        frame = frame[frame['인구'].notna()]
+        if not include_totals:
+            frame = frame[(frame['성별'] != TOTAL) & (frame['연령대'] != TOTAL)]
+        return frame.reset_index(drop=True)
+
+
+def get_population_table(path=DEFAULT_POPULATION_PATH):
+    """프로세스당 한 번만 로드해 공유하는 인구 참조표"""
+    path = Path(path)
+    with _lock:
+        if path not in _tables:
+            _tables[path] = PopulationTable.load(path)
+        return _tables[path]
@@ -0,0 +1,289 @@
+import asyncio
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http import HTTPStatus
+import json
+from urllib.parse import parse_qs, urlsplit
+
+from data_analyzer import CancerDataAnalyzer
+from population import get_population_table
+
+class QueryError(Exception):
+    """잘못된 질의 (HTTP 오류 응답으로 변환)"""
+    
+    def __init__(self, message, status=HTTPStatus.BAD_REQUEST):
+        super().__init__(message)
+        self.status = status
+
+def load_analyzer(years=None, extract=None):
+    """
+    서비스용 분석기 로드
+    extract: 케이스 단위 추출본 CSV (모든 분석에서 연도/지역/암종 필터 가능)
+    years: 연도별 데이터셋에서 읽을 연도 (없으면 data/*.csv)
+    """
+    analyzer = CancerDataAnalyzer()
+    if extract:
+        from streaming_ingest import RegistryAggregator
+        aggregator = RegistryAggregator()
+        aggregator.ingest_csv(extract)
+        analyzer.load_cases(aggregator.cases(), count_col='발생수')
+    elif not analyzer.load_data(years=years):
+        raise FileNotFoundError("No data to serve")
+    return analyzer
+
+class AnalysisQueries:
+    """분석기 큐브에 대한 필터 가능한 질의 (워커 스레드/프로세스에서 실행되는 동기 코드)"""
+    
+    # 쿼리 파라미터 -> 큐브 차원
+    FILTER_PARAMS = {'year': '연도', 'region': '지역', 'cancer': '암종'}
+    
+    def __init__(self, analyzer):
+        self.analyzer = analyzer
+        self.routes = {
+            '/gender': self.gender,
+            '/top-cancers': self.top_cancers,
+            '/age': self.age,
+            '/regional': self.regional,
+            '/health': self.health
+        }
+    
+    def execute(self, path, params):
+        """질의 실행 후 (상태 코드, JSON 바이트) 반환"""
+        try:
+            handler = self.routes.get(path)
+            if handler is None:
+                raise QueryError(f"Unknown endpoint: {path}", HTTPStatus.NOT_FOUND)
+            status, result = HTTPStatus.OK, handler(params)
+        except QueryError as e:
+            status, result = e.status, {'error': str(e)}
+        except Exception as e:
+            status, result = HTTPStatus.INTERNAL_SERVER_ERROR, {'error': f"{type(e).__name__}: {e}"}
+        return int(status), json.dumps(result, ensure_ascii=False).encode('utf-8')
+    
+    def _filters(self, cube, params):
+        """쿼리 파라미터를 큐브 필터로 변환 (쉼표로 여러 값 지정)"""
+        filters = {}
+        for param, dim in self.FILTER_PARAMS.items():
+            if param not in params:
+                continue
+            values = params[param].split(',')
+            if dim == '연도':
+                try:
+                    values = [int(value) for value in values]
+                except ValueError:
+                    raise QueryError(f"Invalid year: {params[param]}")
+            if dim not in cube.dims:
+                # 단일 연도 데이터는 연도 차원이 없으므로 해당 연도만 허용
+                if dim == '연도':
+                    unknown = sorted(set(values) - set(self.analyzer.years))
+                    if not unknown:
+                        continue
+                    raise QueryError(f"Unknown {param}: {', '.join(map(str, unknown))}",
+                                     HTTPStatus.NOT_FOUND)
+                raise QueryError(f"Filter '{param}' is not available for this analysis "
+                                 "with the loaded data")
+            unknown = [value for value in values if value not in cube.labels[dim]]
+            if unknown:
+                raise QueryError(f"Unknown {param}: {', '.join(map(str, unknown))}",
+                                 HTTPStatus.NOT_FOUND)
+            filters[dim] = values
+        return filters
+    
+    def _top(self, cube, dim, n, filters):
+        """
+        dim 레이블의 발생수 상위 n개 Series
+        필터가 모두 값 하나면 분석기의 파티션별 순위 인덱스에서 읽고,
+        여러 값을 합치는 필터나 dim 자체를 거르는 필터는 큐브에서 집계
+        """
+        if dim in filters or any(len(values) > 1 for values in filters.values()):
+            return cube.top_n(dim, n, filters)
+        partition_by = tuple(d for d in cube.dims if d in filters)
+        ranking = self.analyzer.ranking(dim, partition_by)
+        top = ranking.top_n('발생수', n, tuple(filters[d][0] for d in partition_by))
+        return top.set_index(dim)['발생수']
+    
+    def _years(self, filters):
+        return filters.get('연도', self.analyzer.years)
+    
+    def gender(self, params):
+        cube = self.analyzer.cubes['type_sex']
+        by_sex = cube.series('성별', self._filters(cube, params))
+        total = by_sex.sum()
+        return {sex: {'발생수': int(count), '비율': round(count / total * 100, 2) if total else 0.0}
+                for sex, count in by_sex.items()}
+    
+    def top_cancers(self, params):
+        try:
+            n = int(params.get('n', 10))
+        except ValueError:
+            raise QueryError(f"Invalid n: {params['n']}")
+        if n < 1:
+            raise QueryError(f"n must be at least 1, got {n}")
+        cube = self.analyzer.cubes['type_sex']
+        filters = self._filters(cube, params)
+        by_sex = cube.to_frame(('암종', '성별'), filters).pivot(index='암종', columns='성별',
+                                                                values='발생수')
+        top = self._top(cube, '암종', n, filters)
+        return [{'암종': cancer, **{sex: int(by_sex.at[cancer, sex]) for sex in by_sex.columns},
+                 '총계': int(count)}
+                for cancer, count in top.items()]
+    
+    def age(self, params):
+        cube = self.analyzer.cubes['age']
+        filters = self._filters(cube, params)
+        counts = cube.series('연령대', filters)
+        shares = cube.shares('연령대', filters).round(2)
+        return {
+            'total_cases': int(counts.sum()),
+            'high_risk_ages': self._top(cube, '연령대', 3, filters).index.tolist(),
+            'age_distribution': [{'연령대': age, '발생수': int(count), '비율': float(shares[age])}
+                                 for age, count in counts.items()]
+        }
+    
+    def regional(self, params):
+        cube = self.analyzer.cubes['region']
+        filters = self._filters(cube, params)
+        counts = cube.series('지역', filters)
+        years = self._years(filters)
+        person_years = get_population_table().lookup(counts.index, years)
+        rates = (counts.to_numpy() / person_years * 100000).round(2)
+        stats = [{'지역': region, '발생수': int(count), '인구': float(population / len(years)),
+                  '인구10만명당발생률': float(rate)}
+                 for region, count, population, rate in zip(counts.index, counts, person_years, rates)]
+        return {
+            'high_incidence_regions': [row['지역'] for row in
+                                       sorted(stats, key=lambda row: -row['인구10만명당발생률'])[:5]],
+            'regional_stats': stats
+        }
+    
+    def health(self, params):
+        return {'status': 'ok', 'years': [int(year) for year in self.analyzer.years]}
+
+# 프로세스 워커마다 한 번 로드하는 질의 객체
+_worker_queries = None
+
+def _init_worker(years, extract):
+    global _worker_queries
+    _worker_queries = AnalysisQueries(load_analyzer(years, extract))
+
+def _execute_in_worker(path, params):
+    return _worker_queries.execute(path, params)
+
+class QueryService:
+    """
+    분석 질의 asyncio HTTP 서비스
+    이벤트 루프는 연결/캐시만 처리하고 집계는 워커 풀(스레드 또는 프로세스)에서 실행
+    같은 질의는 응답 캐시(LRU)에서 바로 반환하고, 처리 중인 같은 질의는 결과를 공유
+    """
+    
+    def __init__(self, years=None, extract=None, workers=4, executor='thread', cache_size=256):
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._inflight = {}
+        self.stats = {'requests': 0, 'cache_hits': 0, 'computed': 0}
+        
+        if executor == 'process':
+            # 프로세스마다 데이터를 따로 로드 (GIL 없이 집계를 병렬 실행)
+            self.queries = None
+            self._pool = ProcessPoolExecutor(workers, initializer=_init_worker,
+                                             initargs=(years, extract))
+        else:
+            # 한 번 로드한 분석기를 스레드 워커가 공유 (분석 메서드는 원본 데이터를 수정하지 않음)
+            self.queries = AnalysisQueries(load_analyzer(years, extract))
+            self._pool = ThreadPoolExecutor(workers)
+    
+    async def query(self, path, params):
+        """(상태 코드, JSON 바이트, 캐시 여부) 반환"""
+        self.stats['requests'] += 1
+        key = (path, tuple(sorted(params.items())))
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            self.stats['cache_hits'] += 1
+            return (*self._cache[key], True)
+        if key in self._inflight:
+            self.stats['cache_hits'] += 1
+            return (*await asyncio.shield(self._inflight[key]), True)
+        
+        loop = asyncio.get_running_loop()
+        if self.queries is not None:
+            future = loop.run_in_executor(self._pool, self.queries.execute, path, params)
+        else:
+            future = loop.run_in_executor(self._pool, _execute_in_worker, path, params)
+        self._inflight[key] = future
+        try:
+            status, body = await future
+        finally:
+            del self._inflight[key]
+        self.stats['computed'] += 1
+        
+        if status == HTTPStatus.OK and self.cache_size > 0:
+            self._cache[key] = (status, body)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return status, body, False
+    
+    async def handle_connection(self, reader, writer):
+        """HTTP/1.1 keep-alive 연결 처리 (GET만 지원)"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+                if headers.get('content-length'):
+                    await reader.readexactly(int(headers['content-length']))
+                
+                method, target, version = request_line.decode('utf-8', 'replace').split()
+                if method != 'GET':
+                    status, body, cached = HTTPStatus.METHOD_NOT_ALLOWED, b'{"error": "GET only"}', False
+                else:
+                    url = urlsplit(target)
+                    params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+                    if url.path == '/stats':
+                        status, cached = HTTPStatus.OK, False
+                        body = json.dumps(dict(self.stats, cache_entries=len(self._cache))).encode('utf-8')
+                    else:
+                        status, body, cached = await self.query(url.path, params)
+                
+                keep_alive = (headers.get('connection', '').lower() != 'close'
+                              and version == 'HTTP/1.1')
+                status = HTTPStatus(status)
+                writer.write(f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                             "Content-Type: application/json; charset=utf-8\r\n"
+                             f"Content-Length: {len(body)}\r\n"
+                             f"X-Cache: {'HIT' if cached else 'MISS'}\r\n"
+                             f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                             "\r\n".encode('latin-1') + body)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        finally:
+            writer.close()
+    
+    async def serve(self, host='127.0.0.1', port=8000):
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        host, port = server.sockets[0].getsockname()[:2]
+        print(f"Serving on http://{host}:{port}", flush=True)
+        async with server:
+            await server.serve_forever()
+    
+    def close(self):
+        self._pool.shutdown(cancel_futures=True)
+
+def serve(host='127.0.0.1', port=8000, **options):
+    """서비스 실행 (Ctrl+C로 종료)"""
+    service = QueryService(**options)
+    try:
+        asyncio.run(service.serve(host, port))
+    except KeyboardInterrupt:
+        print("\nShutting down...")
+    finally:
+        service.close()
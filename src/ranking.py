@@ -0,0 +1,103 @@
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+
+class RankingIndex:
+    """
+    표의 지표 컬럼별 내림차순 정렬 순서를 한 번 계산해 두고 top-N/순위/백분위 질의에 재사용
+    partition_by 컬럼(연도, 지역, 성별 등)이 있으면 파티션마다 따로 순위를 매김 (질의할 때 partition 지정)
+    동률은 원래 행 순서가 앞선 행 우선, 결측값은 맨 뒤 (nlargest(keep='first')와 같음, 결측값의 순위/백분위는 None)
+    top_n은 정렬된 위치 배열의 앞 k개만 읽고, rank/percentile은 미리 계산한 값을 조회
+    """
+    
+    def __init__(self, frame, key, metrics, partition_by=()):
+        self.frame = frame
+        self.key = key
+        self.metrics = list(metrics)
+        self.partition_by = tuple(partition_by)
+        
+        if self.partition_by:
+            codes, uniques = pd.factorize(pd.MultiIndex.from_frame(frame[list(self.partition_by)]))
+            self._partitions = {tuple(labels): code for code, labels in enumerate(uniques)}
+        else:
+            codes = np.zeros(len(frame), dtype=np.int64)
+            self._partitions = {(): 0}
+        self._positions = {(int(code), label): i for i, (code, label) in enumerate(zip(codes, frame[key]))}
+        
+        groups = pd.Series(codes, index=pd.RangeIndex(len(frame)))
+        self._order, self._rank, self._below, self._size = {}, {}, {}, {}
+        for metric in self.metrics:
+            values = frame[metric].to_numpy(dtype=float)
+            valid = ~np.isnan(values)
+            # 파티션 -> 값 내림차순 -> 원래 행 순서로 정렬 (결측값은 파티션 끝)
+            order = np.lexsort((np.arange(len(frame)), np.where(valid, -values, np.inf), codes))
+            series = pd.Series(values).groupby(groups)
+            self._order[metric] = order
+            self._size[metric] = np.bincount(codes[valid], minlength=len(self._partitions))
+            self._rank[metric] = series.rank(method='first', ascending=False).to_numpy()
+            # 같은 파티션에서 값이 더 작은 항목 수
+            self._below[metric] = series.rank(method='min').to_numpy() - 1
+        self._counts = np.bincount(codes, minlength=len(self._partitions))
+        self._starts = np.concatenate([[0], np.cumsum(self._counts)[:-1]])
+    
+    @classmethod
+    def from_cube(cls, cube, dim, partition_by=()):
+        """큐브의 (partition_by + dim) 주변합으로 dim 레이블의 발생수('발생수') 순위 생성"""
+        if dim in partition_by:
+            raise ValueError(f"Cannot partition a ranking of '{dim}' by '{dim}' itself")
+        frame = cube.to_frame(tuple(partition_by) + (dim,))
+        return cls(frame, dim, ['발생수'], partition_by)
+    
+    def partitions(self):
+        return list(self._partitions)
+    
+    def _code(self, partition):
+        if partition is None:
+            partition = ()
+        elif not isinstance(partition, tuple):
+            partition = (partition,)
+        try:
+            return self._partitions[partition]
+        except KeyError:
+            if len(partition) != len(self.partition_by):
+                raise ValueError(f"Partition must give values for {self.partition_by}") from None
+            raise KeyError(f"Unknown partition: {partition}") from None
+    
+    def order(self, metric, partition=None):
+        """파티션의 행 위치를 지표 내림차순으로 (결측값은 맨 뒤)"""
+        code = self._code(partition)
+        start = self._starts[code]
+        return self._order[metric][start:start + self._counts[code]]
+    
+    def _top(self, metric, n, partition):
+        # 결측값 행은 order의 맨 뒤에 있으므로 지표가 있는 행 수까지만 자름
+        code = self._code(partition)
+        return self.order(metric, partition)[:min(n, self._size[metric][code])]
+    
+    def top_n(self, metric, n, partition=None):
+        """지표 상위 n개 행 (원래 인덱스 유지, 결측값 행 제외)"""
+        return self.frame.iloc[self._top(metric, n, partition)]
+    
+    def top_keys(self, metric, n, partition=None):
+        """지표 상위 n개 키 목록 (결측값 제외)"""
+        return self.frame[self.key].iloc[self._top(metric, n, partition)].tolist()
+    
+    def _position(self, key, partition):
+        return self._positions.get((self._code(partition), key))
+    
+    def rank(self, metric, key, partition=None):
+        """키의 1부터 시작하는 순위 (없거나 지표가 결측이면 None)"""
+        position = self._position(key, partition)
+        if position is None or np.isnan(self._rank[metric][position]):
+            return None
+        return int(self._rank[metric][position])
+    
+    def percentile(self, metric, key, partition=None):
+        """같은 파티션에서 지표가 키보다 작은 항목의 비율(%) (최상위 100, 최하위 0)"""
+        position = self._position(key, partition)
+        if position is None or np.isnan(self._below[metric][position]):
+            return None
+        size = self._size[metric][self._code(partition)]
+        return float(self._below[metric][position] / (size - 1) * 100) if size > 1 else 100.0
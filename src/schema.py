@@ -0,0 +1,92 @@
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+# 컬럼 종류: label(범주형 레이블), count(정수 건수), rate(비율/발생률) - 목록에 없는 컬럼은 그대로 둠
+COLUMN_KINDS = {
+    '암종': 'label',
+    '연령대': 'label',
+    '지역': 'label',
+    '성별': 'label',
+    '연도': 'count',
+    '남성': 'count',
+    '여성': 'count',
+    '총계': 'count',
+    '발생수': 'count',
+    '비율': 'rate',
+    '인구10만명당발생률': 'rate',
+}
+
+# 건수 컬럼의 최소 정수 타입
+# groupby 합계와 컬럼 간 덧셈은 입력 타입을 유지하므로 int8/int16까지 줄이면 합산 중 넘칠 수 있음
+MIN_COUNT_DTYPE = 'int32'
+
+# 레이블 값 수 / 행 수가 이 비율 이하일 때만 범주형으로 변환
+# (값이 거의 모두 다르면 범주형이 오히려 크고 느림)
+CATEGORY_RATIO = 0.5
+
+RATE_DTYPE = 'float32'
+
+
+def count_dtype(values, minimum=MIN_COUNT_DTYPE):
+    """값 범위를 담을 수 있는 가장 작은 정수 타입 (minimum보다 작게는 줄이지 않음)"""
+    if len(values) == 0:
+        return np.dtype(minimum)
+    low, high = int(values.min()), int(values.max())
+    for dtype in ('int8', 'int16', 'int32', 'int64'):
+        dtype = np.dtype(dtype)
+        if dtype.itemsize < np.dtype(minimum).itemsize:
+            continue
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    return np.dtype('int64')
+
+
+def compact_frame(df, category_ratio=CATEGORY_RATIO):
+    """
+    COLUMN_KINDS에 따라 컬럼 타입을 줄인 새 DataFrame 반환 (원본은 수정하지 않음)
+    결측값이 있거나 정수가 아닌 건수 컬럼은 그대로 둠
+    """
+    columns = {}
+    for column in df.columns:
+        kind = COLUMN_KINDS.get(column)
+        series = df[column]
+        if kind == 'label':
+            if not isinstance(series.dtype, pd.CategoricalDtype) and \
+                    series.nunique() <= len(series) * category_ratio:
+                columns[column] = series.astype('category')
+        elif kind == 'count':
+            if pd.api.types.is_integer_dtype(series.dtype) and not isinstance(series.dtype, pd.CategoricalDtype):
+                dtype = count_dtype(series)
+                if dtype != series.dtype:
+                    columns[column] = series.astype(dtype)
+        elif kind == 'rate':
+            if pd.api.types.is_float_dtype(series.dtype):
+                columns[column] = series.astype(RATE_DTYPE)
+    return df.assign(**columns) if columns else df
+
+
+def memory_bytes(df):
+    return int(df.memory_usage(deep=True).sum())
+
+
+def format_size(size):
+    """바이트 수를 B/KB/MB/GB 단위 문자열로"""
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.1f} {unit}" if unit != 'B' else f"{size} B"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def memory_report(before, after):
+    """표 이름 -> DataFrame 두 묶음(변환 전/후)의 메모리 비교 문자열"""
+    lines = [f"  {'table':<24} {'before':>10} {'after':>10} {'saved':>6}"]
+    rows = [(name, memory_bytes(frame), memory_bytes(after[name])) for name, frame in before.items()]
+    rows.append(('total', sum(row[1] for row in rows), sum(row[2] for row in rows)))
+    for name, size_before, size_after in rows:
+        saved = 1 - size_after / size_before if size_before else 0.0
+        lines.append(f"  {name:<24} {format_size(size_before):>10} {format_size(size_after):>10} {saved:>6.0%}")
+    return '\n'.join(lines)
@@ -0,0 +1,207 @@
+import math
+from statistics import NormalDist
+
+from dataset import AGE_BANDS
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+# 표준인구 (AGE_BANDS 순서의 10세 단위 연령대, 인구 10만 명 기준)
+STANDARD_POPULATIONS = {
+    # Segi(1960) 세계표준인구
+    'segi': [22000, 18000, 16000, 12000, 12000, 9000, 7000, 3000, 1000],
+    # WHO 세계표준인구 (2000-2025)
+    'who2000': [17550, 17070, 16150, 14760, 12630, 9920, 6680, 3730, 1545],
+}
+
+# 기본 층 구분
+DEFAULT_STRATA = ('연도', '지역', '암종', '성별')
+
+# 감마 분위수 계산의 반복 한도와 수렴 기준
+_MAX_ITERATIONS = 200
+_EPSILON = 1e-12
+_TINY = 1e-300
+
+
+def standard_weights(standard='segi'):
+    """표준인구 이름 또는 연령대별 인구 배열을 합이 1인 가중치로 변환"""
+    if isinstance(standard, str):
+        if standard not in STANDARD_POPULATIONS:
+            raise ValueError(f"Unknown standard population: {standard} "
+                             f"(choose from {', '.join(STANDARD_POPULATIONS)})")
+        standard = STANDARD_POPULATIONS[standard]
+    weights = np.asarray(standard, dtype=float)
+    if weights.shape != (len(AGE_BANDS),):
+        raise ValueError(f"Standard population needs {len(AGE_BANDS)} age bands, got {weights.shape}")
+    return weights / weights.sum()
+
+
+def _regularized_gamma(a, x, log_gamma):
+    """정규화된 하부 불완전 감마함수 P(a, x) (x < a + 1이면 급수, 아니면 연분수)"""
+    result = np.zeros_like(x)
+    log_prefix = a * np.log(np.where(x > 0, x, 1.0)) - x - log_gamma
+    
+    series = (x > 0) & (x < a + 1)
+    if series.any():
+        ap, xs = a[series], x[series]
+        term = 1.0 / ap
+        total = term.copy()
+        for _ in range(_MAX_ITERATIONS):
+            ap = ap + 1
+            term = term * xs / ap
+            total += term
+            if (np.abs(term) < np.abs(total) * _EPSILON).all():
+                break
+        result[series] = total * np.exp(log_prefix[series])
+    
+    fraction = x >= a + 1
+    if fraction.any():
+        # 상부 Q(a, x)의 연분수 (수정 Lentz 방법)
+        af = a[fraction]
+        b = x[fraction] + 1 - af
+        c = np.full_like(b, 1 / _TINY)
+        d = 1 / b
+        h = d.copy()
+        for i in range(1, _MAX_ITERATIONS):
+            an = -i * (i - af)
+            b = b + 2
+            d = an * d + b
+            d = np.where(np.abs(d) < _TINY, _TINY, d)
+            c = b + an / c
+            c = np.where(np.abs(c) < _TINY, _TINY, c)
+            d = 1 / d
+            delta = d * c
+            h *= delta
+            if (np.abs(delta - 1) < _EPSILON).all():
+                break
+        result[fraction] = 1 - np.exp(log_prefix[fraction]) * h
+    return result
+
+
+def _gamma_ppf(q, a):
+    """
+    감마 분포(척도 1)의 분위수
+    초기값(a > 1이면 Wilson-Hilferty, 아니면 원점 근처 근사)에서 P(a, x) = q를 Halley 방법으로 풂
+    """
+    q, a = np.broadcast_arrays(np.asarray(q, dtype=float), np.asarray(a, dtype=float))
+    result = np.full(q.shape, np.nan)
+    valid = (a > 0) & np.isfinite(a) & (q >= 0) & (q <= 1)
+    result[valid & (q == 0)] = 0.0
+    result[valid & (q == 1)] = np.inf
+    solve = valid & (q > 0) & (q < 1)
+    if not solve.any():
+        return result
+    
+    p, a = q[solve], a[solve]
+    log_gamma = np.array([math.lgamma(value) for value in a])
+    large = a > 1
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        z = np.array([NormalDist().inv_cdf(value) for value in p])
+        wilson = np.maximum(1e-3, a * (1 - 1 / (9 * a) - z / (3 * np.sqrt(a))) ** 3)
+        t = 1 - a * (0.253 + a * 0.12)
+        small = np.where(p < t, (p / t) ** (1 / a), 1 - np.log1p(-(p - t) / (1 - t)))
+        x = np.where(large, wilson, small)
+        
+        for _ in range(_MAX_ITERATIONS):
+            error = _regularized_gamma(a, x, log_gamma) - p
+            density = np.exp((a - 1) * np.log(x) - x - log_gamma)
+            u = error / density
+            step = u / (1 - 0.5 * np.minimum(1, u * ((a - 1) / x - 1)))
+            step = np.where(np.isfinite(step), step, 0.0)
+            x_new = x - step
+            x_new = np.where(x_new <= 0, 0.5 * x, x_new)
+            done = np.abs(x_new - x) <= _EPSILON * x_new
+            x = x_new
+            if done.all():
+                break
+    result[solve] = x
+    return result
+
+
+def _chi2_ppf(q, df):
+    """카이제곱 분포의 분위수 (자유도 df/2인 감마 분포 분위수의 2배)"""
+    return 2 * _gamma_ppf(q, np.asarray(df, dtype=float) / 2)
+
+
+def direct_standardize(counts, population, weights, confidence=0.95, per=100000):
+    """
+    직접표준화 (배열 연산)
+    counts, population: (층 수, 연령대 수) 배열
+    weights: 연령대별 표준인구 가중치 (합 1)
+    반환값: (표준화율, 하한, 상한) - 신뢰구간은 Fay-Feuer 감마 방법
+    """
+    counts = np.asarray(counts, dtype=float)
+    population = np.asarray(population, dtype=float)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rates = counts / population
+        asr = rates @ weights
+        variance = (counts / population ** 2) @ weights ** 2
+        # 한 건이 추가될 때의 최대 증가분 (0건 층의 상한 계산에 필요)
+        max_weight = (weights / population).max(axis=1)
+        
+        alpha = 1 - confidence
+        # 0건 층의 하한은 0, 인구가 없어 표준화율이 NaN인 층은 하한도 NaN
+        lower = np.where(asr > 0,
+                         variance / (2 * asr) * _chi2_ppf(alpha / 2, 2 * asr ** 2 / variance),
+                         np.where(asr == 0, 0.0, np.nan))
+        upper_variance = variance + max_weight ** 2
+        upper = (upper_variance / (2 * (asr + max_weight))
+                 * _chi2_ppf(1 - alpha / 2, 2 * (asr + max_weight) ** 2 / upper_variance))
+    
+    return asr * per, lower * per, upper * per
+
+
+def age_standardized_rates(cases, population, strata=DEFAULT_STRATA, standard='segi',
+                           confidence=0.95, per=100000,
+                           age_col='연령대', count_col='발생수', pop_col='인구'):
+    """
+    층별 연령표준화 발생률과 신뢰구간
+    모든 층(연도 × 지역 × 암종 × 성별 등)을 층마다 반복하지 않고 한 번의 배열 연산으로 계산
+    cases: 층 컬럼 + 연령대 + 발생수 (긴 형식)
+    population: 층 컬럼 일부(예: 연도, 지역, 성별) + 연령대 + 인구 (없는 층 컬럼은 공통 인구로 사용)
+                층 × 연령대 중 인구가 없는 칸이 있으면 ValueError
+    반환값: 층별 발생수, 인구, 조발생률, 연령표준화발생률, 하한, 상한
+    """
+    strata = list(strata)
+    weights = standard_weights(standard)
+    n_ages = len(AGE_BANDS)
+    
+    # 층과 연령대를 정수 코드로 바꿔 (층 수, 연령대 수) 행렬에 한 번에 집계
+    stratum_codes = cases.groupby(strata, sort=True, observed=True).ngroup().to_numpy()
+    age_codes = pd.Categorical(cases[age_col], categories=AGE_BANDS).codes
+    if (age_codes < 0).any():
+        unknown = sorted(set(cases.loc[age_codes < 0, age_col]))
+        raise ValueError(f"Unknown age bands: {unknown}")
+    n_strata = int(stratum_codes.max()) + 1 if len(stratum_codes) else 0
+    counts = np.bincount(stratum_codes * n_ages + age_codes, weights=cases[count_col].to_numpy(),
+                         minlength=n_strata * n_ages).reshape(n_strata, n_ages)
+    
+    # 층 × 연령대 격자에 인구를 병합 (인구표에 없는 층 컬럼은 무시)
+    keys = (cases[strata].assign(_stratum=stratum_codes)
+            .drop_duplicates('_stratum').sort_values('_stratum').reset_index(drop=True))
+    grid = keys.loc[keys.index.repeat(n_ages)].reset_index(drop=True)
+    grid[age_col] = np.tile(AGE_BANDS, n_strata)
+    join_cols = [col for col in strata if col in population.columns] + [age_col]
+    pop_table = population.groupby(join_cols, observed=True, as_index=False)[pop_col].sum()
+    merged = grid.merge(pop_table, on=join_cols, how='left')
+    missing = merged[pop_col].isna().to_numpy()
+    if missing.any():
+        # 연령대별 인구가 없으면 (예: 합계 '계' 행만 있는 인구표) 모든 표준화율이 NaN이 되므로 오류
+        bands = [band for band in AGE_BANDS if band in set(merged.loc[missing, age_col])]
+        rows = merged.loc[missing, strata].drop_duplicates()
+        raise ValueError(f"Population table has no rows for age bands {bands} in {len(rows)} strata, "
+                         f"e.g. {rows.head(5).to_dict('records')}")
+    populations = merged[pop_col].to_numpy(dtype=float).reshape(n_strata, n_ages)
+    
+    asr, lower, upper = direct_standardize(counts, populations, weights, confidence, per)
+    
+    result = keys.drop(columns='_stratum')
+    result['발생수'] = counts.sum(axis=1).astype(np.int64)
+    result['인구'] = populations.sum(axis=1)
+    result['조발생률'] = result['발생수'] / result['인구'] * per
+    result['연령표준화발생률'] = asr
+    result['하한'] = lower
+    result['상한'] = upper
+    return result
@@ -0,0 +1,108 @@
+from cube import CASE_DIMS, CancerCube
+from dataset import AGE_BANDS
+from lazy_import import lazy_import
+
+np = lazy_import('numpy')
+pd = lazy_import('pandas')
+
+# 추출본에서 읽는 컬럼 ('나이'가 있으면 연령대 대신 정수 나이를 사용)
+EXTRACT_COLUMNS = ('연도', '암종', '성별', '연령대', '나이', '지역')
+
+# 레지스트리 성별 코드 -> 표준 레이블
+SEX_ALIASES = {'M': '남성', 'F': '여성', '1': '남성', '2': '여성', '남': '남성', '여': '여성'}
+
+# 나이 -> 연령대 구간 경계 (AGE_BANDS 순서)
+AGE_BINS = [0, 10, 20, 30, 40, 50, 60, 70, 80, float('inf')]
+
+
+class RegistryAggregator:
+    """
+    케이스 단위(한 행 = 한 건) 레지스트리 추출본을 청크 단위로 집계
+    메모리 사용량은 입력 행 수가 아니라 집계 키(연도 × 암종 × 성별 × 연령 × 지역) 수에 비례
+    """
+    
+    def __init__(self, max_partials=16):
+        """max_partials: 합치기 전에 모아 둘 청크별 부분 집계 수"""
+        self.max_partials = max_partials
+        self._partials = []
+        self.rows = 0
+        
+    def add_chunk(self, chunk):
+        """청크 하나를 집계 키별 건수로 줄여 누적"""
+        keys = [col for col in EXTRACT_COLUMNS if col in chunk.columns]
+        self._partials.append(chunk.groupby(keys, observed=True, sort=False).size())
+        self.rows += len(chunk)
+        
+        # 부분 집계는 키 수 크기이므로 몇 개씩 모아 한 번에 합침 (청크마다 인덱스 정렬/병합을 피함)
+        if len(self._partials) >= self.max_partials:
+            self._compact()
+            
+    def _compact(self):
+        combined = pd.concat(self._partials)
+        levels = list(range(combined.index.nlevels))
+        self._partials = [combined.groupby(level=levels, sort=False).sum()]
+        
+    @property
+    def totals(self):
+        """지금까지의 집계 키별 건수"""
+        if not self._partials:
+            return None
+        if len(self._partials) > 1:
+            self._compact()
+        return self._partials[0]
+        
+    def add_rows(self, rows, chunksize=100_000):
+        """딕셔너리 행을 내는 이터러블/제너레이터를 chunksize 단위로 집계"""
+        batch = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunksize:
+                self.add_chunk(pd.DataFrame(batch))
+                batch = []
+        if batch:
+            self.add_chunk(pd.DataFrame(batch))
+            
+    def ingest_csv(self, path, chunksize=500_000, encoding='utf-8-sig'):
+        """대용량 CSV를 필요한 컬럼만 chunksize 행씩 읽어 집계"""
+        header = pd.read_csv(path, nrows=0, encoding=encoding).columns
+        usecols = [col for col in EXTRACT_COLUMNS if col in header]
+        dtype = {col: 'category' for col in usecols if col != '나이'}
+        
+        for chunk in pd.read_csv(path, usecols=usecols, dtype=dtype, chunksize=chunksize,
+                                 encoding=encoding):
+            self.add_chunk(chunk)
+            # totals는 부분 집계를 합치므로 진행 상황에는 쓰지 않음 (합치는 주기는 max_partials)
+            print(f"  ...{self.rows:,} rows aggregated ({len(self._partials)} partial(s) pending)")
+        return self
+    
+    def cases(self):
+        """
+        집계 결과를 (연도, 암종, 성별, 연령대, 지역, 발생수) 형식으로 정리
+        성별 코드와 나이 구간 변환은 행이 아니라 집계 키에만 적용
+        """
+        if self.totals is None:
+            raise ValueError("No registry rows have been aggregated")
+        
+        frame = self.totals.rename('발생수').reset_index()
+        frame['성별'] = frame['성별'].astype(str).map(lambda sex: SEX_ALIASES.get(sex, sex))
+        if '나이' in frame.columns:
+            frame['연령대'] = pd.cut(frame.pop('나이').astype(float), AGE_BINS,
+                                  labels=AGE_BANDS, right=False).astype(str)
+        if '연도' in frame.columns:
+            frame['연도'] = frame['연도'].astype(int)
+        
+        dims = [dim for dim in CASE_DIMS if dim in frame.columns]
+        frame = frame.astype({dim: str for dim in dims if dim != '연도'})
+        frame = frame.groupby(dims, sort=False, as_index=False)['발생수'].sum()
+        frame['발생수'] = frame['발생수'].astype(np.int64)
+        return frame
+    
+    def cube(self):
+        """집계 결과 전체를 CancerCube로 반환 (지역별/암종별 코호트 분석용)"""
+        cases = self.cases()
+        dims = [dim for dim in CASE_DIMS if dim in cases.columns]
+        return CancerCube.from_records(cases, dims, count_col='발생수')
+    
+    def to_dataset(self):
+        """save_data와 같은 세 개의 표(암종별 성별, 연령대별, 지역별)로 변환"""
+        return self.cube().to_dataset()
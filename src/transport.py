@@ -0,0 +1,235 @@
+from collections import namedtuple
+from email.utils import parsedate_to_datetime
+import datetime
+import random
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+# 본문까지 읽은 응답 (스트리밍 응답은 재시도 전에 닫아야 하므로 본문을 모두 읽어 반환)
+TransportResponse = namedtuple('TransportResponse', ['status_code', 'content', 'headers', 'encoding'])
+
+
+class CircuitOpenError(requests.RequestException):
+    """엔드포인트의 회로 차단기가 열려 있어 요청하지 않음"""
+
+
+class DeadlineExceeded(requests.Timeout):
+    """전체 제한 시각을 넘김 (재시도하지 않음)"""
+
+
+class RetryPolicy:
+    """
+    재시도 정책: 지수 백오프 + full jitter (0 ~ min(backoff_max, backoff_base * 2^시도))
+    Retry-After 헤더가 있으면 그 시간만큼 기다림 (backoff_max를 넘으면 재시도하지 않음)
+    """
+    
+    def __init__(self, max_retries=3, backoff_base=0.5, backoff_max=8.0,
+                 retry_statuses=(429, 500, 502, 503, 504), seed=None):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.retry_statuses = frozenset(retry_statuses)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+    
+    def backoff(self, attempt):
+        """attempt번째 재시도 전 대기 시간(초)"""
+        with self._lock:
+            return self._random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+    
+    @staticmethod
+    def retry_after(headers):
+        """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로, 없거나 잘못된 값이면 None"""
+        value = headers.get('Retry-After') if headers else None
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=datetime.timezone.utc)
+        return max(0.0, (when - datetime.datetime.now(datetime.timezone.utc)).total_seconds())
+
+
+class CircuitBreaker:
+    """
+    엔드포인트별 회로 차단기
+    연속 실패가 failure_threshold번이면 열림 -> reset_timeout초 동안 요청을 바로 거절 ->
+    이후 시험 요청 하나만 허용(half-open), 성공하면 닫히고 실패하면 다시 열림
+    """
+    
+    def __init__(self, failure_threshold=5, reset_timeout=30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+    
+    def allow(self):
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = 'half_open'
+                self._trial_in_flight = False
+            if self.state == 'half_open' and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+            self._trial_in_flight = False
+    
+    def record_failure(self):
+        """실패 기록, 이번 실패로 회로가 열렸으면 True"""
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == 'half_open' or (self.state == 'closed' and self.failures >= self.failure_threshold):
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+                return True
+            return False
+
+
+class TransportMetrics:
+    """요청/재시도/대기 시간/회로 차단 카운터 (스레드 안전)"""
+    
+    FIELDS = ('requests', 'attempts', 'retries', 'retry_wait_s', 'failures', 'circuit_opened', 'circuit_rejected')
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = dict.fromkeys(self.FIELDS, 0)
+    
+    def add(self, field, value=1):
+        with self._lock:
+            self._values[field] += value
+    
+    def snapshot(self):
+        with self._lock:
+            values = dict(self._values)
+        values['retry_wait_s'] = round(values['retry_wait_s'], 3)
+        return values
+
+
+class ResilientTransport:
+    """
+    재시도, 백오프, 회로 차단기를 갖춘 HTTP GET 전송 계층
+    pool_size: 호스트별 keep-alive 커넥션 수 (동시 요청 수 이상이어야 연결을 재사용함)
+    """
+    
+    def __init__(self, pool_size=10, retry=None, failure_threshold=5, reset_timeout=30.0,
+                 headers=None, session=None):
+        self.retry = retry or RetryPolicy()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.metrics = TransportMetrics()
+        self._breakers = {}
+        self._lock = threading.Lock()
+        
+        self.session = session or requests.Session()
+        self.session.headers.update({'Connection': 'keep-alive'})
+        self.session.headers.update(headers or {})
+        # 재시도는 이 계층에서 하므로 urllib3 자체 재시도는 끔
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                                                max_retries=0)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def breaker(self, url):
+        """URL의 엔드포인트(스킴, 호스트, 경로)별 회로 차단기"""
+        parts = urlsplit(url)
+        key = f"{parts.scheme}://{parts.netloc}{parts.path}"
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[key]
+    
+    def breaker_states(self):
+        with self._lock:
+            return {key: breaker.state for key, breaker in self._breakers.items()}
+    
+    def _attempt(self, url, params, headers, deadline, chunk_size):
+        """한 번 요청하고 제한 시각까지 본문을 읽음"""
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceeded(f"Deadline exceeded before requesting {url}")
+        response = self.session.get(url, params=params, headers=headers, timeout=remaining, stream=True)
+        try:
+            if response.status_code != 200:
+                return TransportResponse(response.status_code, b'', response.headers, response.encoding)
+            # timeout은 소켓 단위이므로 본문을 나눠 읽으며 전체 제한 시각을 확인
+            chunks = []
+            for chunk in response.iter_content(chunk_size=chunk_size):
+                if time.monotonic() > deadline:
+                    raise DeadlineExceeded(f"Deadline exceeded while reading {url}")
+                chunks.append(chunk)
+        finally:
+            response.close()
+        return TransportResponse(response.status_code, b''.join(chunks), response.headers, response.encoding)
+    
+    def get(self, url, params=None, headers=None, deadline=None, chunk_size=64 * 1024):
+        """
+        GET 요청 (재시도 가능한 상태 코드와 연결 오류는 정책에 따라 재시도)
+        재시도를 다 써도 실패하면 마지막 응답을 반환하거나 마지막 예외를 다시 발생시킴
+        회로가 열려 있으면 CircuitOpenError, 제한 시각을 넘기면 DeadlineExceeded
+        """
+        deadline = deadline if deadline is not None else time.monotonic() + 30
+        breaker = self.breaker(url)
+        self.metrics.add('requests')
+        
+        attempt = 0
+        while True:
+            if not breaker.allow():
+                self.metrics.add('circuit_rejected')
+                raise CircuitOpenError(f"Circuit open for {url}")
+            
+            self.metrics.add('attempts')
+            error = response = None
+            try:
+                response = self._attempt(url, params, headers, deadline, chunk_size)
+            except DeadlineExceeded:
+                breaker.record_failure()
+                self.metrics.add('failures')
+                raise
+            except (requests.ConnectionError, requests.Timeout, requests.exceptions.ChunkedEncodingError) as e:
+                error = e
+            
+            if error is None and response.status_code not in self.retry.retry_statuses:
+                # 4xx 등은 서버가 정상 응답한 것이므로 회로 차단기에는 성공으로 기록
+                breaker.record_success()
+                return response
+            
+            if breaker.record_failure():
+                self.metrics.add('circuit_opened')
+            
+            delay = self.retry.backoff(attempt)
+            retry_after = self.retry.retry_after(response.headers) if response is not None else None
+            if retry_after is not None:
+                delay = retry_after
+            give_up = (attempt >= self.retry.max_retries
+                       or (retry_after is not None and retry_after > self.retry.backoff_max)
+                       or time.monotonic() + delay >= deadline)
+            if give_up:
+                self.metrics.add('failures')
+                if error is not None:
+                    raise error
+                return response
+            
+            self.metrics.add('retries')
+            self.metrics.add('retry_wait_s', delay)
+            time.sleep(delay)
+            attempt += 1
@@ -1,21 +1,78 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 from pathlib import Path
+from chart_output import DEFAULT_PROFILES, output_paths, save_figure
+from dashboard import DashboardTemplate
+from dataset import CancerDataset, year_label
+from instrumentation import instrumented
+from lazy_import import lazy_import
+from population import get_population_table
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import time
+import traceback
 import warnings
 warnings.filterwarnings('ignore')
 
-# 스타일 설정
-plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+def _apply_chart_style(pyplot):
+    """pyplot을 처음 import할 때 한 번만 적용하는 스타일 설정"""
+    # 한글 폰트 설정
+    pyplot.rcParams['font.family'] = 'DejaVu Sans'
+    pyplot.rcParams['axes.unicode_minus'] = False
+    
+    # 스타일 설정
+    pyplot.style.use('seaborn-v0_8')
+    sns.set_palette("husl")
+
+# 무거운 시각화 라이브러리는 차트를 실제로 그릴 때 import
+plt = lazy_import('matplotlib.pyplot', on_import=_apply_chart_style)
+sns = lazy_import('seaborn')
+
+# 차트 작업: 메서드 이름 -> (진행 메시지, 출력 파일)
+CHART_TASKS = {
+    'create_cancer_type_chart': ("Creating cancer type charts...", 'cancer_by_type.png'),
+    'create_gender_distribution_chart': ("Creating gender distribution pie chart...", 'gender_distribution.png'),
+    'create_age_distribution_chart': ("Creating age distribution charts...", 'age_distribution.png'),
+    'create_regional_map_chart': ("Creating regional distribution charts...", 'regional_distribution.png'),
+    'create_interactive_dashboard': ("Creating interactive dashboard...", 'interactive_dashboard.html'),
+}
+
+def _use_agg_backend():
+    """작업자 프로세스 초기화: 화면 없이 렌더링하는 Agg 백엔드 사용"""
+    import matplotlib
+    matplotlib.use('Agg')
 
+def _render_chart_worker(method_name, charts_dir, cancer_data, age_data, regional_data, options=None):
+    """프로세스 풀 작업자: 차트 하나를 그리고 (메서드 이름, 소요 시간, 오류) 반환"""
+    start = time.perf_counter()
+    try:
+        visualizer = CancerDataVisualizer(**(options or {}))
+        visualizer.charts_dir = Path(charts_dir)
+        visualizer.cancer_data = cancer_data
+        visualizer.age_data = age_data
+        visualizer.regional_data = regional_data
+        getattr(visualizer, method_name)()
+        error = None
+    except Exception:
+        error = traceback.format_exc()
+    return method_name, time.perf_counter() - start, error
+
+@instrumented('visualizer')
 class CancerDataVisualizer:
-    def __init__(self):
+    def __init__(self, dataset=None, dashboard_js='inline', output_profiles=DEFAULT_PROFILES, years=None):
+        """
+        dataset: 이미 메모리에 있는 CancerDataset (없으면 data/ 디렉토리에서 로드)
+        years: 데이터가 다루는 연도 (차트 제목과 발생률의 인구 기준, 없으면 2020년)
+               dataset 없이 지정하면 data/dataset의 해당 연도 파티션을 기간 합계로 읽어 그림
+        dashboard_js: 대시보드의 plotly.js 포함 방식 ('inline', 'shared', 'cdn')
+        output_profiles: 차트 저장 설정 이름 목록 (chart_output.OUTPUT_PROFILES) 또는
+                         차트 파일 이름(확장자 제외) -> 설정 목록 dict (없는 차트는 기본 설정)
+        """
+        self.dataset = dataset
+        self.dashboard_js = dashboard_js
+        self.output_profiles = output_profiles
+        self.years = list(years) if years else [2020]
+        self._from_store = dataset is None and bool(years)
         self.data_dir = Path('data')
         self.charts_dir = Path('charts')
+        self._view = None
         
         # 차트 디렉토리 생성
         self.charts_dir.mkdir(exist_ok=True)
@@ -23,24 +80,54 @@ class CancerDataVisualizer:
     def load_data(self):
         """데이터 로드"""
         try:
-            self.cancer_data = pd.read_csv(self.data_dir / 'cancer_by_type_gender.csv')
-            self.age_data = pd.read_csv(self.data_dir / 'cancer_by_age.csv')
-            self.regional_data = pd.read_csv(self.data_dir / 'cancer_by_region.csv')
+            if self._from_store:
+                dataset, self.years = CancerDataset.from_store(self.data_dir / 'dataset', self.years)
+            else:
+                dataset = self.dataset or CancerDataset.from_csv(self.data_dir)
+            self.cancer_data, self.age_data, self.regional_data = dataset.frames()
+            self._view = dataset
             return True
         except FileNotFoundError:
             print("Data files not found.")
             return False
     
+    def chart_profiles(self, file_name):
+        """차트 파일 하나에 적용할 저장 설정 목록"""
+        if isinstance(self.output_profiles, dict):
+            return self.output_profiles.get(Path(file_name).stem, DEFAULT_PROFILES)
+        return self.output_profiles
+    
+    def chart_outputs(self, method_name):
+        """차트 메서드가 만드는 파일 목록 (대시보드는 HTML 하나)"""
+        file_name = CHART_TASKS[method_name][1]
+        if file_name.endswith('.html'):
+            return [self.charts_dir / file_name]
+        return output_paths(self.charts_dir / file_name, self.chart_profiles(file_name))
+    
+    def view(self):
+        """
+        차트가 읽는 CancerDataset (load_data로 받은 데이터셋이면 분석기와 순위 인덱스를 공유)
+        작업자 프로세스처럼 표를 직접 지정한 경우에는 그 표로 한 번 만듦
+        """
+        if self._view is None:
+            self._view = CancerDataset(self.cancer_data, self.age_data, self.regional_data)
+        return self._view
+    
+    def _save_chart(self, fig, file_name):
+        """설정별 파일로 저장하고 Figure 닫기"""
+        save_figure(fig, self.charts_dir / file_name, self.chart_profiles(file_name))
+        plt.close(fig)
+    
     def create_cancer_type_chart(self):
         """암종별 발생 현황 차트"""
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 8))
         
         # 1. 총 발생 건수 차트
-        top_cancers = self.cancer_data.nlargest(8, '총계')
+        top_cancers = self.view().rankings()['cancer_data'].top_n('총계', 8)
         bars1 = ax1.bar(range(len(top_cancers)), top_cancers['총계'], 
                        color=['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', 
                              '#FFEAA7', '#DDA0DD', '#98D8E8', '#F7DC6F'])
-        ax1.set_title('주요 암종별 발생 건수 (2020년)', fontsize=14, fontweight='bold')
+        ax1.set_title(f'주요 암종별 발생 건수 ({year_label(self.years)})', fontsize=14, fontweight='bold')
         ax1.set_xlabel('암종')
         ax1.set_ylabel('발생 건수')
         ax1.set_xticks(range(len(top_cancers)))
@@ -68,8 +155,7 @@ class CancerDataVisualizer:
         ax2.legend()
         
         plt.tight_layout()
-        plt.savefig(self.charts_dir / 'cancer_by_type.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_chart(fig, 'cancer_by_type.png')
         
     def create_gender_distribution_chart(self):
         """성별 분포 파이 차트"""
@@ -97,14 +183,13 @@ class CancerDataVisualizer:
             text.set_fontsize(14)
             text.set_fontweight('bold')
         
-        ax.set_title('2020년 암 발생 성별 분포', fontsize=16, fontweight='bold', pad=20)
+        ax.set_title(f'{year_label(self.years)} 암 발생 성별 분포', fontsize=16, fontweight='bold', pad=20)
         
         # 범례 추가
         ax.legend(wedges, [f'{label}: {size:,}명' for label, size in zip(labels, sizes)],
                  loc="center left", bbox_to_anchor=(1, 0, 0.5, 1))
         
-        plt.savefig(self.charts_dir / 'gender_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_chart(fig, 'gender_distribution.png')
         
     def create_age_distribution_chart(self):
         """연령별 분포 차트"""
@@ -136,24 +221,15 @@ class CancerDataVisualizer:
         ax2.grid(True, alpha=0.3)
         
         plt.tight_layout()
-        plt.savefig(self.charts_dir / 'age_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_chart(fig, 'age_distribution.png')
         
     def create_regional_map_chart(self):
         """지역별 발생 현황 차트"""
-        # 인구 데이터 추가
-        population_data = {
-            '서울특별시': 9720846, '부산광역시': 3378016, '대구광역시': 2401110,
-            '인천광역시': 2947217, '광주광역시': 1441970, '대전광역시': 1454679,
-            '울산광역시': 1124459, '세종특별자치시': 355831, '경기도': 13379311,
-            '강원도': 1518500, '충청북도': 1595460, '충청남도': 2123692,
-            '전라북도': 1792476, '전라남도': 1838353, '경상북도': 2625961,
-            '경상남도': 3309918, '제주특별자치도': 672948
-        }
-        
-        self.regional_data['인구'] = self.regional_data['지역'].map(population_data)
+        # 인구 데이터 추가 (공유 인구 참조표, 여러 연도면 인년 기준 연평균 발생률)
+        person_years = get_population_table().lookup(self.regional_data['지역'], self.years)
+        self.regional_data['인구'] = person_years / len(self.years)
         self.regional_data['인구10만명당발생률'] = (self.regional_data['발생수'] / 
-                                                    self.regional_data['인구'] * 100000).round(1)
+                                                    person_years * 100000).round(1)
         
         fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(14, 12))
         
@@ -172,184 +248,80 @@ class CancerDataVisualizer:
         ax2.set_xlabel('인구 10만명당 발생률')
         
         plt.tight_layout()
-        plt.savefig(self.charts_dir / 'regional_distribution.png', dpi=300, bbox_inches='tight')
-        plt.close()
+        self._save_chart(fig, 'regional_distribution.png')
         
     def create_interactive_dashboard(self):
-        """인터랙티브 대시보드 생성"""
-        # Plotly를 사용한 인터랙티브 차트
-        fig = make_subplots(
-            rows=2, cols=2,
-            subplot_titles=('암종별 성별 발생 현황', '성별 분포', '연령별 분포', '지역별 발생률'),
-            specs=[[{"type": "bar"}, {"type": "pie"}],
-                   [{"type": "bar"}, {"type": "bar"}]]
-        )
-        
-        # 1. 암종별 성별 발생 현황 (3D 그라데이션 효과)
-        top_cancers = self.cancer_data.nlargest(8, '총계')
-        fig.add_trace(
-            go.Bar(x=top_cancers['암종'], y=top_cancers['남성'],
-                  name='남성', 
-                  marker=dict(
-                      color='#4A90E2',
-                      line=dict(color='#2563EB', width=2),
-                      pattern_shape="/",  # 패턴 추가
-                      opacity=0.9
-                  ),
-                  text=top_cancers['남성'],
-                  textposition='outside',
-                  textfont=dict(size=10, color='#2563EB')),
-            row=1, col=1
-        )
-        fig.add_trace(
-            go.Bar(x=top_cancers['암종'], y=top_cancers['여성'],
-                  name='여성',
-                  marker=dict(
-                      color='#E24A90',
-                      line=dict(color='#BE185D', width=2),
-                      pattern_shape="\\",  # 패턴 추가
-                      opacity=0.9
-                  ),
-                  text=top_cancers['여성'],
-                  textposition='outside',
-                  textfont=dict(size=10, color='#BE185D')),
-            row=1, col=1
-        )
-        
-        # 2. 성별 분포 (3D 파이차트 효과)
-        total_male = self.cancer_data['남성'].sum()
-        total_female = self.cancer_data['여성'].sum()
-        fig.add_trace(
-            go.Pie(labels=['남성', '여성'], 
-                  values=[total_male, total_female],
-                  name="성별 분포", 
-                  marker=dict(
-                      colors=['#4A90E2', '#E24A90'],
-                      line=dict(color='#FFFFFF', width=3)
-                  ),
-                  textfont=dict(size=12, color='white'),
-                  textinfo='label+percent+value',
-                  hole=0.3,  # 도넛 형태로 입체감
-                  pull=[0.1, 0.1]),  # 조각 분리 효과
-            row=1, col=2
-        )
-        
-        # 3. 연령별 분포 (그라데이션 효과)
-        fig.add_trace(
-            go.Bar(x=self.age_data['연령대'], y=self.age_data['발생수'],
-                  name='연령별',
-                  marker=dict(
-                      color=self.age_data['발생수'],
-                      colorscale='Viridis',  # 그라데이션 컬러스케일
-                      line=dict(color='#333333', width=1),
-                      opacity=0.8
-                  ),
-                  text=self.age_data['발생수'],
-                  textposition='outside',
-                  textfont=dict(size=10)),
-            row=2, col=1
-        )
-        
-        # 4. 지역별 상위 10개 (그라데이션 효과)
-        top_regions = self.regional_data.nlargest(10, '발생수')
-        fig.add_trace(
-            go.Bar(x=top_regions['지역'], y=top_regions['발생수'],
-                  name='지역별',
-                  marker=dict(
-                      color=top_regions['발생수'],
-                      colorscale='Blues',  # 파란색 그라데이션
-                      line=dict(color='#1E3A8A', width=1),
-                      opacity=0.85
-                  ),
-                  text=top_regions['발생수'],
-                  textposition='outside',
-                  textfont=dict(size=10)),
-            row=2, col=2
-        )
-        
-        # 레이아웃 업데이트 (3D 및 입체감 효과)
-        fig.update_layout(
-            height=900, 
-            showlegend=True,
-            title_text="2020년 한국 암 발생 통계 대시보드",
-            title_font=dict(size=20, color='#1f2937'),
-            plot_bgcolor='rgba(248,250,252,0.8)',
-            paper_bgcolor='rgba(255,255,255,0.95)',
-            annotations=[
-                dict(
-                    text="<b>📄 데이터 출처 및 저작권</b><br>" +
-                         "• <b>국립암센터 국가암정보센터</b>: www.cancer.go.kr<br>" +
-                         "• 중앙암등록본부 (국립암센터): ncc.re.kr<br>" +
-                         "• KOSIS 국가통계포털: kosis.kr<br>" +
-                         "• 공공데이터포털: data.go.kr<br>" +
-                         "• e-나라지표: index.go.kr<br>" +
-                         "<br><b>⚠️ 이용 조건</b><br>" +
-                         "• 저작자표시-비영리-변경금지<br>" +
-                         "• 포트폴리오/학습 목적만 허용<br>" +
-                         "• 상업적 이용 절대 금지<br>" +
-                         "<i>© 국립암센터 - 비영리 포트폴리오 프로젝트</i>",
-                    xref="paper", yref="paper",
-                    x=0.98, y=0.25, xanchor="right", yanchor="bottom",
-                    showarrow=False,
-                    font=dict(size=10, color="gray"),
-                    bgcolor="rgba(255,255,255,0.95)",
-                    bordercolor="rgba(209,213,219,1)",
-                    borderwidth=2,
-                    borderpad=8
-                )
-            ]
-        )
-        
-        # 각 서브플롯에 그림자 효과 추가
-        fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(235,236,240,0.6)')
-        fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(235,236,240,0.6)')
-        
-        # 범례 스타일링
-        fig.update_layout(
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1,
-                bgcolor="rgba(255,255,255,0.8)",
-                bordercolor="rgba(209,213,219,1)",
-                borderwidth=1
-            )
-        )
-        
-        # HTML 파일로 저장
-        fig.write_html(str(self.charts_dir / 'interactive_dashboard.html'))
-        
-    def generate_all_charts(self):
-        """모든 차트 생성"""
+        """인터랙티브 대시보드 생성 (plotly.js 포함 방식은 dashboard_js)"""
+        template = DashboardTemplate(plotly_js=self.dashboard_js, output_dir=self.charts_dir)
+        template.write(self.charts_dir / 'interactive_dashboard.html', self.view(),
+                       title=f"{year_label(self.years)} 한국 암 발생 통계 대시보드")
+    
+    def render_charts(self, method_names=None, workers=1):
+        """
+        차트 렌더링 (load_data 이후 호출)
+        workers가 2 이상이면 차트마다 별도 프로세스에서 렌더링
+        반환값: 메서드 이름 -> (소요 시간, 오류 traceback 또는 None)
+        """
+        method_names = list(method_names or CHART_TASKS)
+        results = {}
+        
+        if workers <= 1:
+            for method_name in method_names:
+                print(CHART_TASKS[method_name][0])
+                start = time.perf_counter()
+                try:
+                    getattr(self, method_name)()
+                    error = None
+                except Exception:
+                    error = traceback.format_exc()
+                results[method_name] = (time.perf_counter() - start, error)
+            return results
+        
+        # 한 차트의 실패가 다른 차트에 영향을 주지 않도록 결과를 각각 수집
+        with ProcessPoolExecutor(max_workers=workers, initializer=_use_agg_backend) as executor:
+            futures = {}
+            for method_name in method_names:
+                print(CHART_TASKS[method_name][0])
+                future = executor.submit(_render_chart_worker, method_name, str(self.charts_dir),
+                                         self.cancer_data, self.age_data, self.regional_data,
+                                         {'dashboard_js': self.dashboard_js,
+                                          'output_profiles': self.output_profiles,
+                                          'years': self.years})
+                futures[future] = method_name
+            
+            for future in as_completed(futures):
+                try:
+                    method_name, duration, error = future.result()
+                except Exception:
+                    # 작업자 프로세스 자체가 비정상 종료된 경우
+                    method_name, duration, error = futures[future], 0.0, traceback.format_exc()
+                results[method_name] = (duration, error)
+        return {method_name: results[method_name] for method_name in method_names}
+    
+    def generate_all_charts(self, workers=1):
+        """모든 차트 생성 (workers: 렌더링 프로세스 수)"""
         print("Starting chart generation...")
         
         if not self.load_data():
-            return
-        
-        print("Creating cancer type charts...")
-        self.create_cancer_type_chart()
-        
-        print("Creating gender distribution pie chart...")
-        self.create_gender_distribution_chart()
-        
-        print("Creating age distribution charts...")
-        self.create_age_distribution_chart()
+            return {}
         
-        print("Creating regional distribution charts...")
-        self.create_regional_map_chart()
+        results = self.render_charts(workers=workers)
+        failed = {name: error for name, (_, error) in results.items() if error}
         
-        print("Creating interactive dashboard...")
-        self.create_interactive_dashboard()
+        if failed:
+            print(f"WARNING: {len(failed)} of {len(results)} charts failed:")
+            for name, error in failed.items():
+                print(f"  - {name}:")
+                print(error)
+        else:
+            print("All charts generated successfully!")
         
-        print("All charts generated successfully!")
         print("Generated files:")
-        print("  - charts/cancer_by_type.png")
-        print("  - charts/gender_distribution.png")
-        print("  - charts/age_distribution.png")
-        print("  - charts/regional_distribution.png")
-        print("  - charts/interactive_dashboard.html")
+        for name, (_, error) in results.items():
+            if not error:
+                for path in self.chart_outputs(name):
+                    print(f"  - {path.as_posix()}")
+        return results
 
 if __name__ == "__main__":
     visualizer = CancerDataVisualizer()
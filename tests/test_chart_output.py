@@ -0,0 +1,44 @@
+import sys
+from pathlib import Path
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+from PIL import Image
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from chart_output import save_figure
+
+
+def _figure():
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(11.9, 9.9))
+    ax1.bar(range(9), [243, 421, 1234, 4567, 12345, 34567, 45678, 32145, 18234])
+    ax1.set_title('연령대별 암 발생 건수')
+    ax2.plot(range(9), np.cumsum(range(9)), marker='o')
+    ax2.set_xlabel('누적 발생 건수')
+    fig.tight_layout()
+    return fig
+
+
+def _pixels(path):
+    with Image.open(path) as image:
+        return np.asarray(image.convert('RGBA'))
+
+
+def test_print_profile_matches_single_render_when_sharing_a_render(tmp_path):
+    fig = _figure()
+    try:
+        save_figure(fig, tmp_path / 'single' / 'chart.png', ['print'])
+        save_figure(fig, tmp_path / 'shared' / 'chart.png', ['print', 'web'])
+    finally:
+        plt.close(fig)
+
+    single = _pixels(tmp_path / 'single' / 'chart.png')
+    shared = _pixels(tmp_path / 'shared' / 'chart.png')
+    assert shared.shape == single.shape
+    assert np.array_equal(shared, single)
+
+    with Image.open(tmp_path / 'shared' / 'chart_web.png') as web:
+        assert web.size == (round(single.shape[1] / 3), round(single.shape[0] / 3))
@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from ranking import RankingIndex
+
+
+def test_top_n_leaves_out_missing_values():
+    frame = pd.DataFrame({'암종': ['위암', '폐암', '간암', '갑상선암'], '연도': [2020] * 4,
+                          '발생수': [3.0, np.nan, 5.0, np.nan]})
+    ranking = RankingIndex(frame, '암종', ['발생수'], ['연도'])
+    assert ranking.top_keys('발생수', 3, 2020) == ['간암', '위암']
+    assert ranking.top_n('발생수', 3, 2020).index.tolist() == [2, 0]
+    assert ranking.top_keys('발생수', 1, 2020) == ['간암']
@@ -0,0 +1,34 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'src'))
+
+from standardization import _chi2_ppf, age_standardized_rates, direct_standardize, standard_weights
+
+
+def test_lower_bound_is_nan_when_rate_is_nan():
+    counts = [[1] * 9, [0] * 9, [1] * 9]
+    population = [[1000] * 9, [1000] * 9, [np.nan] * 9]
+    asr, lower, upper = direct_standardize(counts, population, standard_weights())
+    assert asr[1] == 0 and lower[1] == 0
+    assert np.isnan(asr[2]) and np.isnan(lower[2]) and np.isnan(upper[2])
+
+
+def test_population_without_age_bands_is_rejected():
+    cases = pd.DataFrame({'연도': [2020, 2020], '지역': ['서울특별시', '부산광역시'], '암종': ['위암', '위암'],
+                          '성별': ['남자', '남자'], '연령대': ['50-59세', '50-59세'], '발생수': [3, 4]})
+    population = pd.DataFrame({'연도': [2020, 2020], '지역': ['서울특별시', '부산광역시'],
+                               '성별': ['계', '계'], '연령대': ['계', '계'], '인구': [9720846, 3378016]})
+    with pytest.raises(ValueError, match=r"age bands \['0-9세'.*2 strata.*부산광역시"):
+        age_standardized_rates(cases, population)
+
+
+def test_chi2_quantiles_at_small_degrees_of_freedom():
+    expected = {(0.025, 1): 0.000982069, (0.025, 2): 0.0506356, (0.975, 1): 5.02389,
+                (0.975, 2): 7.37776, (0.025, 10): 3.24697, (0.975, 100): 129.561}
+    for (q, df), value in expected.items():
+        assert _chi2_ppf(q, df) == pytest.approx(value, rel=1e-5)